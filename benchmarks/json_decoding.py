@@ -0,0 +1,64 @@
+"""
+Сравнение парсеров JSON на странице photos.get?extended=1&photo_sizes=1 из 1000 фотографий
+
+    python -m benchmarks.json_decoding
+"""
+import json
+import timeit
+
+from vk_cli.api.vk_json import FAST_DECODERS, get_json_decoder
+
+PAGE_SIZE = 1000
+SIZE_TYPES = 'smxopqryzw'
+
+
+def photo_item(i: int) -> dict:
+    return {
+        'id': 457239000 + i,
+        'album_id': 123456789,
+        'owner_id': -12345678,
+        'user_id': 100,
+        'date': 1600000000 + i,
+        'text': f'Описание фотографии №{i}',
+        'has_tags': False,
+        'sizes': [
+            {
+                'type': size_type,
+                'url': f'https://sun9-{i % 90}.userapi.com/impg/{i:08x}/{size_type}.jpg?size=1280x960&quality=96',
+                'width': 75 * (n + 1),
+                'height': 56 * (n + 1),
+            }
+            for n, size_type in enumerate(SIZE_TYPES)
+        ],
+        'likes': {'user_likes': 0, 'count': i % 100},
+        'reposts': {'count': i % 7},
+        'comments': {'count': i % 13},
+        'can_comment': 1,
+        'tags': {'count': 0},
+    }
+
+
+def make_page() -> bytes:
+    page = {'response': {'count': 50000, 'items': [photo_item(i) for i in range(PAGE_SIZE)]}}
+    return json.dumps(page, ensure_ascii=False).encode('utf-8')
+
+
+def main(number: int = 50) -> None:
+    content = make_page()
+    print(f'page: {len(content) / 1024:.0f} KiB, {PAGE_SIZE} items')
+
+    baseline = None
+    for name in ('json', *FAST_DECODERS):
+        try:
+            decoder = get_json_decoder(name)
+        except ImportError:
+            print(f'{name:>8}: not installed')
+            continue
+
+        elapsed = min(timeit.repeat(lambda: decoder(content), number=number, repeat=3)) / number
+        baseline = baseline or elapsed
+        print(f'{name:>8}: {elapsed * 1000:7.2f} ms/page  x{baseline / elapsed:.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Создание моделей VKPhoto для страницы photos.get из 1000 фотографий и чтение нескольких полей:
+полное преобразование данных против ленивого (VK(lazy=True))
+
+    python -m benchmarks.lazy_models
+"""
+import json
+import timeit
+
+from benchmarks.json_decoding import PAGE_SIZE, make_page
+from vk_cli.models import VKPhoto
+
+CASES = {
+    'id, owner_id': lambda photo: (photo.id, photo.owner_id),
+    'id, owner_id, url': lambda photo: (photo.id, photo.owner_id, photo.vk_data.sizes[-1].url),
+}
+
+
+def extract(items: list[dict], lazy: bool, fields) -> list[tuple]:
+    return [fields(VKPhoto.from_data(None, item, lazy=lazy)) for item in items]
+
+
+def main(number: int = 10) -> None:
+    items = json.loads(make_page())['response']['items']
+
+    print(f'{PAGE_SIZE} items')
+    for case, fields in CASES.items():
+        assert extract(items, True, fields) == extract(items, False, fields)
+
+        baseline = None
+        for name, lazy in (('eager', False), ('lazy', True)):
+            run = lambda lazy=lazy: extract(items, lazy, fields)  # noqa: E731
+            elapsed = min(timeit.repeat(run, number=number, repeat=3)) / number
+            baseline = baseline or elapsed
+            print(f'{case:>18} {name:>6}: {elapsed * 1000:7.2f} ms/page  x{baseline / elapsed:.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Создание моделей VKPhoto для страницы photos.get из 1000 фотографий:
+dacite.from_dict против скомпилированной функции (vk_cli.models.data.decoder)
+
+    python -m benchmarks.model_decoding
+"""
+import json
+import timeit
+from copy import copy
+
+import dacite
+
+from benchmarks.json_decoding import PAGE_SIZE, make_page
+from vk_cli.models import VKPhoto
+from vk_cli.models.data import PhotoData
+from vk_cli.models.data.decoder import get_decoder
+
+
+def main(number: int = 10) -> None:
+    items = json.loads(make_page())['response']['items']
+    config = PhotoData.Meta.config
+    decoder = get_decoder(PhotoData, config)
+
+    def source(item: dict) -> dict:
+        data = copy(item)
+        data['source'] = item
+        return data
+
+    expected = [dacite.from_dict(PhotoData, source(item), config) for item in items]
+    assert [decoder(source(item)) for item in items] == expected
+
+    cases = {
+        'dacite': lambda: [dacite.from_dict(PhotoData, source(item), config) for item in items],
+        'compiled': lambda: [decoder(source(item)) for item in items],
+        'VKPhoto': lambda: [VKPhoto.from_data(None, item) for item in items],
+    }
+
+    print(f'{PAGE_SIZE} items')
+    baseline = None
+    for name, case in cases.items():
+        elapsed = min(timeit.repeat(case, number=number, repeat=3)) / number
+        baseline = baseline or elapsed
+        print(f'{name:>8}: {elapsed * 1000:7.2f} ms/page  x{baseline / elapsed:.1f}')
+
+
+if __name__ == '__main__':
+    main()
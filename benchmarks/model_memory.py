@@ -0,0 +1,43 @@
+"""
+Память, занимаемая моделями VKPhoto, созданными из страницы photos.get из 1000 фотографий
+с 10 размерами каждая, для каждого способа хранения исходных данных (VK.source_mode)
+
+    python -m benchmarks.model_memory
+"""
+import gc
+import json
+import tracemalloc
+
+from benchmarks.json_decoding import PAGE_SIZE, make_page
+from vk_cli.api.vk_json import SOURCE_MODES
+from vk_cli.models import VKPhoto
+
+
+def measure(source_mode: str) -> int:
+    """
+    Память, удерживаемая моделями после освобождения разобранной страницы
+    """
+    content = make_page()
+    VKPhoto.from_data(None, json.loads(content)['response']['items'][0])  # компиляция функции создания PhotoData
+
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(content)['response']['items']
+    photos = [VKPhoto.from_data(None, item, source_mode) for item in items]
+    del items
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(photos) == PAGE_SIZE
+    return used
+
+
+def main() -> None:
+    for source_mode in SOURCE_MODES:
+        used = measure(source_mode)
+        print(f'{source_mode:>5}: {used / 1024:5.0f} KiB, {used / PAGE_SIZE:5.0f} bytes per VKPhoto')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Отбор фотографий за период и сортировка по разрешению для 100 страниц photos.get по 1000 фотографий:
+модели VKPhoto против колоночного представления PhotoFrame
+
+    python -m benchmarks.photo_frame
+"""
+import json
+import time
+
+from benchmarks.json_decoding import PAGE_SIZE, make_page
+from vk_cli.models import PhotoFrame, VKPhoto
+
+PAGES = 100
+
+
+def with_models(pages: list[list[dict]], start: int, end: int) -> list[int]:
+    photos = [VKPhoto.from_data(None, item, source_mode='drop') for items in pages for item in items]
+    selected = [p for p in photos if start <= p.vk_data.date.timestamp() < end]
+    selected.sort(key=lambda p: p.vk_data.sizes[-1].width * p.vk_data.sizes[-1].height, reverse=True)
+    return [p.id for p in selected]
+
+
+def with_frame(pages: list[list[dict]], start: int, end: int) -> list[int]:
+    frame = PhotoFrame()
+    for items in pages:
+        frame.extend(items)
+    return list(frame.where('date', start, end).sort('resolution', reverse=True)['id'])
+
+
+def main() -> None:
+    items = json.loads(make_page())['response']['items']
+    pages = [items] * PAGES
+    start, end = items[100]['date'], items[900]['date']
+
+    print(f'{PAGES * PAGE_SIZE} photos')
+    results = []
+    baseline = None
+    for name, run in (('VKPhoto', with_models), ('PhotoFrame', with_frame)):
+        began = time.perf_counter()
+        results.append(run(pages, start, end))
+        elapsed = time.perf_counter() - began
+        baseline = baseline or elapsed
+        print(f'{name:>10}: {elapsed * 1000:8.1f} ms  x{baseline / elapsed:.1f}')
+
+    assert results[0] == results[1]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import re
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from tests.conftest import photo_item
+from vk_cli import AsyncVK, api
+from vk_cli.api.vk_request import VKRequest
+from vk_cli.api.vk_response import VKResponse
+from vk_cli.api.vk_session import AsyncHttpPool
+from vk_cli.models import ModelLister, VKPhoto, VKPhotoAlbum
+
+
+@pytest.fixture
+def vk(vk_creds: dict) -> AsyncVK:
+    return AsyncVK(**vk_creds)
+
+
+def photos_page(data: dict) -> Mock:
+    offset, count, total = int(data.get('offset', 0)), int(data['count']), 5
+    items = [photo_item(i) for i in range(offset, min(offset + count, total))]
+    return Mock(content=json.dumps({'response': {'count': total, 'items': items}}).encode())
+
+
+def test_invoke(vk: AsyncVK) -> None:
+    request = VKRequest(vk, 'utils.getServerTime')
+    response = Mock(content=json.dumps({'response': 123}).encode())
+
+    with patch.object(AsyncHttpPool, 'post', AsyncMock(return_value=response)):
+        assert asyncio.run(request.invoke()) is None
+        result = asyncio.run(request.get_invoke_result())
+
+    assert isinstance(result, VKResponse)
+    assert result.get_number == 123
+
+
+def test_lister_async_iteration(vk: AsyncVK) -> None:
+    async def collect(lister: ModelLister) -> list[VKPhoto]:
+        return [photo async for photo in lister]
+
+    request = api.photos.get(vk, owner_id=1, album_id=2)
+    post = AsyncMock(side_effect=lambda url, data, timeout=None: photos_page({k: v.decode() for k, v in data.items()}))
+
+    with patch.object(AsyncHttpPool, 'post', post):
+        photos = asyncio.run(collect(ModelLister(request, step=2)))
+
+    assert [p.id for p in photos] == [0, 1, 2, 3, 4]
+    assert all(isinstance(p, VKPhoto) for p in photos)
+
+
+def test_load(vk: AsyncVK) -> None:
+    album_data = {
+        'id': 2,
+        'owner_id': 1,
+        'thumb_id': 0,
+        'title': 'title',
+        'size': 5,
+        'description': None,
+        'created': 0,
+        'updated': 0,
+    }
+    response = Mock(content=json.dumps({'response': {'count': 1, 'items': [album_data]}}).encode())
+
+    with patch.object(AsyncHttpPool, 'post', AsyncMock(return_value=response)):
+        album = asyncio.run(VKPhotoAlbum(vk, '1_2').load())
+
+    assert album.title == 'title'
+
+
+def test_batch(vk: AsyncVK) -> None:
+    async def run() -> list[VKRequest]:
+        async with vk.batch(max_calls=2) as batch:
+            requests = [batch.add(VKRequest(vk, 'photos.getById', photos=f'1_{i}')) for i in range(3)]
+            assert len(batch) == 3  # заполненный пакет отправляется вместе с остальными при выходе из контекста
+        return requests
+
+    def execute(url: str, data: dict, timeout: float | None = None) -> Mock:
+        photos = re.findall(r'"photos": "1_(\d+)"', data['code'].decode())
+        return Mock(content=json.dumps({'response': [[{'id': int(i)}] for i in photos]}).encode())
+
+    with patch.object(AsyncHttpPool, 'post', AsyncMock(side_effect=execute)) as post:
+        requests = asyncio.run(run())
+
+    assert post.call_count == 2
+    assert [request.response.single['id'] for request in requests] == [0, 1, 2]
@@ -0,0 +1,129 @@
+import json
+import re
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vk_cli.api.vk_api_error import VKEAccessError
+from vk_cli.api.vk_batch import VKBatch
+from vk_cli.api.vk_cache import ResponseCache, ResponseMemo
+from vk_cli.api.vk_credentials import VK
+from vk_cli.api.vk_request import VKRequest
+from vk_cli.api.vk_session import HttpPool
+
+
+@pytest.fixture
+def vk(vk_creds: dict) -> VK:
+    return VK(**vk_creds)
+
+
+def http_response(json_data: dict) -> Mock:
+    return Mock(content=json.dumps(json_data).encode())
+
+
+def test_vkscript_call(vk: VK) -> None:
+    request = VKRequest(vk, 'photos.getById', photos=['1_2', '3_4'], extended=True, photo_sizes=None)
+
+    assert VKBatch.vkscript_call(request) == 'API.photos.getById({"photos": "1_2,3_4", "extended": 1})'
+
+
+def test_batch_responses(vk: VK) -> None:
+    error = {'method': 'photos.getAlbumsCount', 'error_code': 15, 'error_msg': 'Access denied'}
+    response = http_response({'response': [[{'id': 1}], False, 3], 'execute_errors': [error]})
+
+    with patch.object(HttpPool, 'post', return_value=response) as post, vk.batch() as batch:
+        r1 = batch.add(VKRequest(vk, 'photos.getById', photos='1_1'))
+        r2 = batch.add(VKRequest(vk, 'photos.getAlbumsCount', group_id=1))
+        r3 = batch.add(VKRequest(vk, 'photos.getAlbumsCount', user_id=1))
+        assert not r1.is_invoked
+
+    post.assert_called_once()
+    code = post.call_args.kwargs['data']['code'].decode()
+    assert code.startswith('return [API.photos.getById(')
+
+    assert r1.response.single == {'id': 1}
+    assert isinstance(r2.response.error, VKEAccessError)
+    assert r2.response.error.code == 15
+    assert r3.response.get_number == 3
+
+
+def test_batch_auto_flush(vk: VK) -> None:
+    def execute(url: str, data: dict, timeout: float | None = None) -> Mock:
+        calls = data['code'].decode().count('API.')
+        return http_response({'response': list(range(calls))})
+
+    with patch.object(HttpPool, 'post', side_effect=execute) as post:
+        batch = vk.batch()
+        requests = [batch.add(VKRequest(vk, 'photos.move', photo_id=i, target_album_id=1)) for i in range(30)]
+
+        assert post.call_count == 1
+        assert len(batch) == 5
+
+        batch.flush()
+
+    assert post.call_count == 2
+    assert [r.response.get_number for r in requests] == list(range(25)) + list(range(5))
+
+
+def test_batch_code_length(vk: VK) -> None:
+    with patch.object(HttpPool, 'post', return_value=http_response({'response': [1]})) as post:
+        batch = VKBatch(vk, max_code_length=100)
+        batch.add(VKRequest(vk, 'photos.getById', photos='1_1' * 20))
+        batch.add(VKRequest(vk, 'photos.getById', photos='2_2' * 20))
+
+    post.assert_called_once()
+    assert len(batch) == 1
+
+
+def test_batch_cache(tmp_path, vk_creds: dict) -> None:
+    vk = VK(cache=ResponseCache(tmp_path / 'cache.sqlite'), memo=ResponseMemo(), **vk_creds)
+    response = http_response({'response': [[{'id': 1, 'owner_id': 1}], 1]})
+
+    with patch.object(HttpPool, 'post', return_value=response) as post, vk.batch() as batch:
+        albums = batch.add(VKRequest(vk, 'photos.getAlbums', owner_id=1))
+        batch.add(VKRequest(vk, 'photos.getById', photos='1_1'))
+
+    post.assert_called_once()
+    # ответ метода чтения сохранён в кешах: повторный запрос не выполняется
+    assert VKRequest(vk, 'photos.getAlbums', owner_id=1).get_invoke_result() is albums.response
+    assert vk.cache.get(albums) == [{'id': 1, 'owner_id': 1}]
+
+    with patch.object(HttpPool, 'post', return_value=http_response({'response': [1]})), vk.batch() as batch:
+        batch.add(VKRequest(vk, 'photos.editAlbum', owner_id=1, album_id=1, title='альбом'))
+
+    # изменяющий запрос в пакете сбрасывает связанные записи
+    assert vk.cache.get(albums) is None
+    assert vk.memo.get(albums) is None
+
+
+def test_batch_execute_not_cached(tmp_path, vk_creds: dict) -> None:
+    vk = VK(cache=ResponseCache(tmp_path / 'cache.sqlite'), **vk_creds)
+    response = http_response({'response': [[{'id': 1, 'owner_id': 1}]]})
+
+    with (
+        patch.object(HttpPool, 'post', return_value=response),
+        patch.object(ResponseCache, 'invalidate') as invalidate,
+        patch.object(ResponseCache, 'store', wraps=vk.cache.store) as store,
+        vk.batch() as batch,
+    ):
+        albums = batch.add(VKRequest(vk, 'photos.getAlbums', owner_id=1))
+
+    # сам вызов execute не сбрасывает и не сохраняет записи кеша, сохраняется только ответ вызова внутри него
+    invalidate.assert_not_called()
+    store.assert_called_once_with(albums, [{'id': 1, 'owner_id': 1}])
+
+
+def test_batch_split_ids(vk: VK) -> None:
+    def execute(url: str, data: dict, timeout: float | None = None) -> Mock:
+        calls = re.findall(r'API\.photos\.getById\((\{.*?\})\)', data['code'].decode())
+        return http_response({'response': [[{'id': p} for p in json.loads(c)['photos'].split(',')] for c in calls]})
+
+    photos = [f'1_{i}' for i in range(250)]
+    with patch.object(HttpPool, 'post', side_effect=execute) as post, vk.batch() as batch:
+        request = batch.add(VKRequest(vk, 'photos.getById', photos=photos))
+        other = batch.add(VKRequest(vk, 'photos.getById', photos='2_1'))
+
+    post.assert_called_once()
+    assert post.call_args.kwargs['data']['code'].decode().count('API.') == 4  # три части и ещё один запрос
+    assert [item['id'] for item in request.response.raw_data] == photos
+    assert other.response.single == {'id': '2_1'}
@@ -0,0 +1,166 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tests.conftest import FakeClock
+from vk_cli.api import vk_const
+from vk_cli.api.vk_cache import ResponseCache, ResponseMemo, approx_size
+from vk_cli.api.vk_credentials import VK
+from vk_cli.api.vk_request import VKRequest
+from vk_cli.api.vk_session import HttpPool
+from vk_cli.models import VKPhotoAlbum
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock(1000.0)
+
+
+@pytest.fixture
+def vk(tmp_path, clock: FakeClock, vk_creds: dict) -> VK:
+    cache = ResponseCache(tmp_path / 'cache.sqlite', ttl={'photos.getAlbums': 60}, clock=clock)
+    return VK(cache=cache, **vk_creds)
+
+
+@pytest.fixture
+def post() -> Mock:
+    response = Mock(content=json.dumps({'response': [{'id': 1}]}).encode())
+    with patch.object(HttpPool, 'post', return_value=response) as post:
+        yield post
+
+
+def test_fingerprint_without_token(vk: VK, vk_creds: dict) -> None:
+    other = VK(**{**vk_creds, vk_const.ACCESS_TOKEN: 'other'})
+    r1 = VKRequest(vk, 'photos.get', owner_id=1, album_id=2, rev=True, offset=None)
+    r2 = VKRequest(other, 'photos.get', {'rev': 1, 'album_id': 2}, owner_id=1)
+
+    assert r1.fingerprint == r2.fingerprint
+    assert 'ACCESS_TOKEN' not in r1.fingerprint
+
+
+def test_is_idempotent(vk: VK) -> None:
+    assert VKRequest(vk, 'photos.getById').is_idempotent
+    assert not VKRequest(vk, 'photos.move').is_idempotent
+
+
+def test_cache_hit(vk: VK, post: Mock) -> None:
+    first = VKRequest(vk, 'photos.getAlbums', owner_id=1).get_invoke_result()
+    second = VKRequest(vk, 'photos.getAlbums', owner_id=1).get_invoke_result()
+
+    post.assert_called_once()
+    assert second.single == first.single
+    assert vk.cache.stats == {'hits': 1, 'misses': 1}
+
+
+def test_cache_ttl(vk: VK, post: Mock, clock: FakeClock) -> None:
+    VKRequest(vk, 'photos.getAlbums', owner_id=1).invoke()
+    clock.now += 61
+    VKRequest(vk, 'photos.getAlbums', owner_id=1).invoke()
+
+    assert post.call_count == 2
+
+
+def test_cache_refresh(vk: VK, post: Mock) -> None:
+    request = VKRequest(vk, 'photos.getAlbums', owner_id=1)
+    request.get_invoke_result()
+    request.get_invoke_result(update=True)
+
+    assert post.call_count == 2
+
+
+def test_not_cacheable_method(vk: VK, post: Mock) -> None:
+    VKRequest(vk, 'utils.getServerTime').invoke()
+    VKRequest(vk, 'utils.getServerTime').invoke()
+
+    assert post.call_count == 2
+
+
+def test_invalidation(vk: VK, post: Mock) -> None:
+    VKRequest(vk, 'photos.getAlbums', owner_id=1).invoke()
+    VKRequest(vk, 'photos.getAlbums', owner_id=2).invoke()
+
+    VKRequest(vk, 'photos.move', owner_id=1, photo_id=1, target_album_id=2).invoke_response()
+    VKRequest(vk, 'photos.getAlbums', owner_id=1).invoke()
+    VKRequest(vk, 'photos.getAlbums', owner_id=2).invoke()
+
+    assert post.call_count == 4
+    assert vk.cache.stats == {'hits': 1, 'misses': 3}
+
+
+def test_persistent(tmp_path, post: Mock, vk_creds: dict) -> None:
+    VKRequest(VK(cache=ResponseCache(tmp_path / 'cache.sqlite'), **vk_creds), 'photos.getById', photos='1_1').invoke()
+    cache = ResponseCache(tmp_path / 'cache.sqlite')
+    response = VKRequest(VK(cache=cache, **vk_creds), 'photos.getById', photos='1_1').get_invoke_result()
+
+    post.assert_called_once()
+    assert response.single == {'id': 1}
+
+
+@pytest.fixture
+def vk_memo(vk_creds: dict) -> VK:
+    return VK(memo=ResponseMemo(max_entries=2), **vk_creds)
+
+
+def test_memo_shared_response(vk_memo: VK, post: Mock) -> None:
+    first = VKRequest(vk_memo, 'photos.getById', photos='1_1').get_invoke_result()
+    second = VKRequest(vk_memo, 'photos.getById', photos='1_1').get_invoke_result()
+
+    post.assert_called_once()
+    assert second is first
+    assert vk_memo.memo.stats == {'hits': 1, 'misses': 1}
+
+
+def test_memo_lru_eviction(vk_memo: VK, post: Mock) -> None:
+    for photos in ('1_1', '1_2', '1_1', '1_3', '1_1', '1_2'):
+        VKRequest(vk_memo, 'photos.getById', photos=photos).invoke()
+
+    # 1_2 вытеснен при добавлении 1_3, 1_1 использовался недавно и остался
+    assert post.call_count == 4
+    assert len(vk_memo.memo) == 2
+
+
+def test_memo_bytes_limit(post: Mock, vk_creds: dict) -> None:
+    memo = ResponseMemo(max_bytes=approx_size([{'id': 1}]) * 2)
+    vk = VK(memo=memo, **vk_creds)
+    for photos in ('1_1', '1_2', '1_3'):
+        VKRequest(vk, 'photos.getById', photos=photos).invoke()
+
+    assert len(memo) == 2
+    assert memo.size <= memo.max_bytes
+
+
+def test_memo_registry_ttl(post: Mock, clock: FakeClock, vk_creds: dict) -> None:
+    vk = VK(memo=ResponseMemo(clock=clock), **vk_creds)
+    for _ in range(2):
+        VKRequest(vk, 'utils.getServerTime').invoke()  # время хранения не задано: ответ не сохраняется
+        VKRequest(vk, 'photos.getById', photos='1_1').invoke()
+
+    assert post.call_count == 3
+    assert len(vk.memo) == 1
+
+    clock.now += 601  # время хранения photos.getById в реестре методов - 600 сек
+    VKRequest(vk, 'photos.getById', photos='1_1').invoke()
+
+    assert post.call_count == 4
+
+
+def test_memo_invalidation(vk_memo: VK, post: Mock) -> None:
+    VKRequest(vk_memo, 'photos.getAlbums', owner_id=1).invoke()
+    VKRequest(vk_memo, 'photos.edit', owner_id=1, photo_id=1, caption='').invoke_response()
+    VKRequest(vk_memo, 'photos.getAlbums', owner_id=1).invoke()
+
+    assert post.call_count == 3
+
+
+def test_memo_load_and_reload(vk_memo: VK) -> None:
+    album_data = {'id': 2, 'owner_id': 1, 'thumb_id': 0, 'title': 'title', 'size': 5}
+    response = Mock(content=json.dumps({'response': {'count': 1, 'items': [album_data]}}).encode())
+
+    with patch.object(HttpPool, 'post', return_value=response) as post:
+        album = VKPhotoAlbum(vk_memo, '1_2').load()
+        VKPhotoAlbum(vk_memo, '1_2').load()
+        assert post.call_count == 1
+
+        album.reload()
+        assert post.call_count == 2
@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pytest
+
+from vk_cli import VK, CheckpointStore
+from vk_cli.api.vk_request import VKRequest
+
+
+@pytest.fixture
+def vk(vk_creds: dict) -> VK:
+    return VK(**vk_creds)
+
+
+def test_save_get_delete(vk: VK) -> None:
+    store = CheckpointStore()
+    request = VKRequest(vk, 'photos.getAll', owner_id=1)
+
+    assert store.get(request) is None
+
+    store.save(request, {'offset': 200})
+    store.save(request, {'offset': 400})
+    assert store.get(request) == {'offset': 400}
+    assert store.get(VKRequest(vk, 'photos.getAll', owner_id=2)) is None
+    assert len(store) == 1
+
+    store.delete(request)
+    assert store.get(request) is None
+
+
+def test_persistent(vk: VK, tmp_path: Path, vk_creds: dict) -> None:
+    path = tmp_path / 'checkpoints.sqlite'
+    request = VKRequest(vk, 'newsfeed.get', filters='photo')
+
+    store = CheckpointStore(path)
+    store.save(request, {'cursor': '5/abc'})
+    store.close()
+
+    # ключ не зависит от ключа доступа
+    other_vk = VK(**{**vk_creds, 'access_token': 'other'})
+    assert CheckpointStore(path).get(VKRequest(other_vk, 'newsfeed.get', filters='photo')) == {'cursor': '5/abc'}
@@ -0,0 +1,74 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vk_cli import VK, ResponseCache, api
+from vk_cli.api.vk_method_info import MethodInfo, get_method_info, register_method
+from vk_cli.api.vk_rate_limit import TokenBucket
+from vk_cli.api.vk_request import VKRequest
+from vk_cli.api.vk_session import HttpPool
+from vk_cli.models import ModelLister
+
+
+@pytest.fixture
+def vk(vk_creds: dict) -> VK:
+    return VK(**vk_creds)
+
+
+def test_registered() -> None:
+    info = get_method_info('photos.get')
+
+    assert info.name == 'photos.get'
+    assert info.max_count == 1000
+    assert info.idempotent
+    assert info.ttl
+
+
+def test_default() -> None:
+    assert get_method_info('utils.getServerTime').idempotent
+    assert not get_method_info('photos.move').idempotent
+    assert get_method_info('photos.move').max_count is None
+
+
+def test_explicit_idempotent() -> None:
+    assert not MethodInfo('messages.getLongPollServer', idempotent=False).idempotent
+    assert MethodInfo('utils.resolveScreenName', idempotent=True).idempotent
+
+
+def test_lister_step(vk: VK) -> None:
+    assert ModelLister(api.photos.get(vk, owner_id=1, album_id=2)).partial_generator.step == 1000
+    assert ModelLister(api.photos.get_all(vk, owner_id=1)).partial_generator.step == 200
+    assert ModelLister(api.photos.get(vk, owner_id=1), step=10).partial_generator.step == 10
+
+
+def test_cache_ttl() -> None:
+    cache = ResponseCache(ttl={'photos.getAlbums': 60}, default_ttl=5)
+
+    assert cache.get_ttl('photos.get') == get_method_info('photos.get').ttl
+    assert cache.get_ttl('photos.getAlbums') == 60
+    assert cache.get_ttl('utils.getServerTime') == 5
+    assert cache.get_ttl('photos.move') == 0
+
+
+def test_split_ids(vk: VK) -> None:
+    photos = [f'1_{i}' for i in range(250)]
+    request = VKRequest(vk, 'photos.getById', photos=photos, extended=True)
+
+    parts = request.split_ids()
+
+    assert [len(r.method_params['photos']) for r in parts] == [100, 100, 50]
+    assert all(r.method_params['extended'] for r in parts)
+    assert sum((r.method_params['photos'] for r in parts), []) == photos
+
+    assert VKRequest(vk, 'photos.getById', photos='1_1,1_2').split_ids()[0].method_params['photos'] == '1_1,1_2'
+
+
+def test_rate_cost(vk: VK) -> None:
+    register_method(MethodInfo('test.heavyMethod', cost=3))
+    response = Mock(content=json.dumps({'response': 1}).encode())
+
+    with patch.object(HttpPool, 'post', return_value=response), patch.object(TokenBucket, 'acquire') as acquire:
+        VKRequest(vk, 'test.heavyMethod').invoke()
+
+    acquire.assert_called_once_with(3)
@@ -0,0 +1,64 @@
+import json
+import threading
+from unittest.mock import Mock, patch
+
+from tests.conftest import FakeClock
+from vk_cli.api import vk_const
+from vk_cli.api.vk_credentials import VK
+from vk_cli.api.vk_rate_limit import TokenBucket, get_rate_limiter
+from vk_cli.api.vk_request import VKRequest
+from vk_cli.api.vk_session import HttpPool
+
+
+def test_bucket_burst_and_refill() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == 1 / 3
+    assert bucket.reserve() == 2 / 3
+
+    clock.now = 1
+    assert bucket.available == 1
+
+
+def test_bucket_drain() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, clock=clock)
+    bucket.drain()
+
+    assert bucket.reserve() == 0.5
+
+
+def test_bucket_threads() -> None:
+    bucket = TokenBucket(rate=5, clock=FakeClock())
+    delays = []
+    threads = [threading.Thread(target=lambda: delays.append(bucket.reserve())) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(delays) == [0] * 5 + [0.2, 0.4, 0.6, 0.8, 1.0]
+
+
+def test_limiter_shared_by_token(vk_creds: dict) -> None:
+    vk1 = VK(**vk_creds)
+    vk2 = VK(**vk_creds)
+    other = VK(**{**vk_creds, vk_const.ACCESS_TOKEN: 'other', vk_const.RATE_LIMIT: 20})
+
+    assert vk1.credentials.rate_limiter is vk2.credentials.rate_limiter
+    assert other.credentials.rate_limiter is not vk1.credentials.rate_limiter
+    assert other.credentials.rate_limiter.rate == 20
+    assert get_rate_limiter('other', 20) is other.credentials.rate_limiter
+
+
+def test_too_frequent_retry(vk_creds: dict) -> None:
+    vk = VK(**vk_creds)
+    error = {'error': {'error_code': 6, 'error_msg': 'Too many requests per second'}}
+    responses = [Mock(content=json.dumps(error).encode()), Mock(content=json.dumps({'response': 1}).encode())]
+
+    with patch.object(HttpPool, 'post', side_effect=responses), patch.object(TokenBucket, 'drain') as drain:
+        assert VKRequest(vk, 'utils.getServerTime').invoke_response() == 1
+
+    drain.assert_called_once()
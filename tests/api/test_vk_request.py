@@ -1,13 +1,15 @@
-from unittest.mock import patch
+import json
+from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
-from tests.credentials import VK_CREDS
 from vk_cli.api import vk_const
 from vk_cli.api.vk_api_error import VKECaptchaNeeded
 from vk_cli.api.vk_credentials import VK
-from vk_cli.api.vk_request import VKRequest
+from vk_cli.api.vk_request import PartialRequest, VKRequest
 from vk_cli.api.vk_response import VKResponse
+from vk_cli.api.vk_session import HttpConfig, HttpPool
 
 TEST_METHOD_NAME = 'method_class.method_name'
 
@@ -22,8 +24,8 @@ params_dict = {
 
 
 @pytest.fixture
-def vk() -> VK:
-    return VK(**VK_CREDS)
+def vk(vk_creds: dict) -> VK:
+    return VK(**vk_creds)
 
 
 @pytest.fixture
@@ -127,3 +129,47 @@ def test_captcha(vk: VK) -> None:
     r = VKRequest(vk, 'captcha.force')
     with pytest.raises(VKECaptchaNeeded):
         r.invoke_response()
+
+
+def test_partial_request_shares_vk(vk_request: VKRequest) -> None:
+    partial = PartialRequest(vk_request, 10, 20)
+
+    assert partial._vk is vk_request._vk
+    assert partial.method_params == {'offset': 20, 'count': 10}
+
+
+def test_do_invoke_uses_pool(vk: VK, vk_request: VKRequest) -> None:
+    response = Mock(content=json.dumps({'response': {'count': 0, 'items': []}}).encode())
+    create_session = patch.object(HttpPool, '_create_session', wraps=vk.http._create_session)
+    with create_session as create, patch.object(requests.Session, 'post', autospec=True, return_value=response) as post:
+        vk_request.invoke()
+        PartialRequest(vk_request, 10, 0).invoke()
+
+    # оба запроса выполнены через одну сессию пула соединений экземпляра VK
+    create.assert_called_once()
+    assert [call.args[0] for call in post.call_args_list] == [vk.http.session] * 2
+
+
+def test_pool_config(vk_creds: dict) -> None:
+    vk = VK(http_config=HttpConfig(pool_maxsize=3, keep_alive=False), **vk_creds)
+    adapter = vk.http.session.get_adapter(VKRequest.URL_BASE)
+
+    assert adapter._pool_maxsize == 3
+    assert vk.http.session.headers['Connection'] == 'close'
+
+
+def test_json_decoder_default(vk_creds: dict) -> None:
+    orjson = pytest.importorskip('orjson')
+
+    assert VK(**vk_creds).json_loads is orjson.loads
+    assert VK(json_decoder='json', **vk_creds).json_loads is json.loads
+
+
+def test_json_decoder_hook(vk_request: VKRequest) -> None:
+    decoder = Mock(return_value={'response': 5})
+    vk_request.json_decoder = decoder
+
+    with patch.object(HttpPool, 'post', return_value=Mock(content=b'raw')):
+        assert vk_request.invoke_response() == 5
+
+    decoder.assert_called_once_with(b'raw')
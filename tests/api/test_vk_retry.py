@@ -0,0 +1,113 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from vk_cli.api.vk_api_error import VKError, VKETooFrequent
+from vk_cli.api.vk_credentials import VK
+from vk_cli.api.vk_request import PartialRequest, VKRequest
+from vk_cli.api.vk_retry import RetryBudget, RetryPolicy, RetryState
+from vk_cli.api.vk_session import HttpPool
+
+NO_DELAY = {'backoff_base': 0, 'budget': None}
+
+
+def api_error(code: int) -> Mock:
+    return Mock(content=json.dumps({'error': {'error_code': code, 'error_msg': 'error'}}).encode())
+
+
+def api_response(result: object) -> Mock:
+    return Mock(content=json.dumps({'response': result}).encode())
+
+
+def invoke(policy: RetryPolicy, responses: list, vk_creds: dict) -> tuple[object, Mock]:
+    vk = VK(retry_policy=policy, **vk_creds)
+    with patch.object(HttpPool, 'post', side_effect=responses) as post:
+        return VKRequest(vk, 'utils.getServerTime').invoke_response(), post
+
+
+def test_retry_until_success(vk_creds: dict) -> None:
+    responses = [api_error(6), requests.ConnectionError(), api_response(1)]
+    result, post = invoke(RetryPolicy(**NO_DELAY), responses, vk_creds)
+
+    assert result == 1
+    assert post.call_count == 3
+
+
+def test_max_attempts(vk_creds: dict) -> None:
+    with pytest.raises(VKETooFrequent):
+        invoke(RetryPolicy(max_attempts=3, **NO_DELAY), [api_error(6)] * 5, vk_creds)
+
+
+def test_not_retryable(vk_creds: dict) -> None:
+    with pytest.raises(VKError) as e:
+        invoke(RetryPolicy(**NO_DELAY), [api_error(100), api_response(1)], vk_creds)
+
+    assert e.value.code == 100
+
+
+def test_http_status() -> None:
+    policy = RetryPolicy(**NO_DELAY)
+    error = requests.HTTPError(response=Mock(status_code=502))
+
+    assert policy.is_retryable(error)
+    assert not policy.is_retryable(requests.HTTPError(response=Mock(status_code=404)))
+
+
+def test_request_policy_overrides_vk(vk_creds: dict) -> None:
+    vk = VK(retry_policy=RetryPolicy(**NO_DELAY), **vk_creds)
+    request = VKRequest(vk, 'utils.getServerTime')
+    request.retry_policy = RetryPolicy(max_attempts=1)
+
+    with patch.object(HttpPool, 'post', side_effect=[api_error(10), api_response(1)]), pytest.raises(VKError):
+        request.invoke_response()
+
+
+def test_request_policy_shared_by_partial_requests(vk_creds: dict) -> None:
+    request = VKRequest(VK(**vk_creds), 'photos.get', owner_id=1)
+    request.retry_policy = RetryPolicy(budget=RetryBudget())
+
+    partial = PartialRequest(request, 10, 0)  # политика с блокировкой бюджета не копируется
+
+    assert partial.retry_policy is request.retry_policy
+    assert partial.method_params is not request.method_params
+
+
+def test_backoff_delays() -> None:
+    policy = RetryPolicy(backoff_base=1, backoff_multiplier=2, backoff_max=5, jitter=0)
+    assert [policy.get_delay(i) for i in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    jittered = RetryPolicy(backoff_base=1, jitter=0.5)
+    assert all(0.5 <= jittered.get_delay(1) <= 1 for _ in range(100))
+
+
+def test_deadline() -> None:
+    now = [0.0]
+    policy = RetryPolicy(backoff_base=1, jitter=0, deadline=2.5, budget=None)
+    retry = RetryState(policy, clock=lambda: now[0])
+
+    assert retry.get_timeout(5) == 2.5
+    assert retry.next_delay(requests.Timeout()) == 1
+
+    now[0] = 1.0
+    assert retry.next_delay(requests.Timeout()) is None  # задержка 2 сек выходит за срок
+
+
+def test_budget() -> None:
+    budget = RetryBudget(ratio=0.5, min_per_second=0.001)
+    budget._reserve.drain()
+
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_budget_stops_retries(vk_creds: dict) -> None:
+    budget = RetryBudget(ratio=0, min_per_second=0.001)
+    budget._reserve.drain()
+
+    with pytest.raises(requests.ConnectionError):
+        invoke(RetryPolicy(backoff_base=0, budget=budget), [requests.ConnectionError(), api_response(1)], vk_creds)
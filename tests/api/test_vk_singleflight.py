@@ -0,0 +1,111 @@
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from vk_cli.api.vk_api_error import VKEAccessError
+from vk_cli.api.vk_credentials import AsyncVK, VK
+from vk_cli.api.vk_request import VKRequest
+from vk_cli.api.vk_session import AsyncHttpPool, HttpPool
+from vk_cli.api.vk_singleflight import SingleFlight
+
+THREADS = 5
+
+
+def run_concurrently(vk: VK, method_name: str, **params) -> list:
+    """
+    Запуск одинаковых запросов из нескольких потоков, ответ API задерживается до старта всех потоков
+    """
+    started = threading.Barrier(THREADS + 1)
+    results = [None] * THREADS
+
+    def invoke(i: int) -> None:
+        request = VKRequest(vk, method_name, **params)
+        started.wait()
+        try:
+            results[i] = request.get_invoke_result()
+        except Exception as e:  # noqa: BLE001
+            results[i] = e
+
+    threads = [threading.Thread(target=invoke, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+
+    started.wait()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def slow_response(json_data: dict) -> Mock:
+    def post(url: str, data: dict, timeout: float | None = None) -> Mock:
+        threading.Event().wait(0.1)
+        return Mock(content=json.dumps(json_data).encode())
+
+    return Mock(side_effect=post)
+
+
+def test_coalesce_threads(vk_creds: dict) -> None:
+    vk = VK(**vk_creds)
+    post = slow_response({'response': [{'id': 1}]})
+
+    with patch.object(HttpPool, 'post', post):
+        results = run_concurrently(vk, 'photos.getById', photos='1_1')
+
+    assert post.call_count == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_coalesce_shared_error(vk_creds: dict) -> None:
+    vk = VK(**vk_creds)
+    post = slow_response({'error': {'error_code': 15, 'error_msg': 'Access denied'}})
+
+    with patch.object(HttpPool, 'post', post):
+        results = run_concurrently(vk, 'photos.getAlbums', owner_id=1)
+
+    assert post.call_count == 1
+    assert all(isinstance(r, VKEAccessError) for r in results)
+
+
+def test_mutating_not_coalesced(vk_creds: dict) -> None:
+    vk = VK(**vk_creds)
+    post = slow_response({'response': 1})
+
+    with patch.object(HttpPool, 'post', post):
+        run_concurrently(vk, 'photos.move', owner_id=1, photo_id=1, target_album_id=2)
+
+    assert post.call_count == THREADS
+
+
+def test_coalesce_async(vk_creds: dict) -> None:
+    vk = AsyncVK(**vk_creds)
+
+    async def post(url: str, data: dict, timeout: float | None = None) -> Mock:
+        await asyncio.sleep(0.05)
+        return Mock(content=json.dumps({'response': [{'id': 1}]}).encode())
+
+    async def invoke_all() -> list:
+        requests = [VKRequest(vk, 'photos.getById', photos='1_1') for _ in range(THREADS)]
+        return await asyncio.gather(*(r.get_invoke_result() for r in requests))
+
+    with patch.object(AsyncHttpPool, 'post', AsyncMock(side_effect=post)) as mock:
+        results = asyncio.run(invoke_all())
+
+    assert mock.call_count == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_sequential_calls_not_shared() -> None:
+    flight = SingleFlight()
+    fn = Mock(side_effect=[1, 2])
+
+    assert flight.do('key', fn) == 1
+    assert flight.do('key', fn) == 2
+    assert len(flight) == 0
+
+    with pytest.raises(ZeroDivisionError):
+        flight.do('key', lambda: 1 / 0)
+    assert len(flight) == 0
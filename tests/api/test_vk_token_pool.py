@@ -0,0 +1,88 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vk_cli.api import vk_const
+from vk_cli.api.vk_api_error import VKEAccessError
+from vk_cli.api.vk_credentials import NoAvailableTokenError, VK, VKTokenPool
+from vk_cli.api.vk_request import VKRequest
+from vk_cli.api.vk_session import HttpPool
+
+TOKENS = ['token1', 'token2', 'token3']
+
+
+@pytest.fixture
+def pool() -> VKTokenPool:
+    return VKTokenPool({vk_const.ACCESS_TOKEN: token} for token in TOKENS)
+
+
+def api_error(code: int) -> dict:
+    error = {'error_code': code, 'error_msg': 'error'}
+    if code == 14:
+        error.update(captcha_sid='1', captcha_img='https://vk.com/captcha.php')
+    return {'error': error}
+
+
+def post_by_token(responses: dict[str, dict]) -> Mock:
+    def post(url: str, data: dict, timeout: float | None = None) -> Mock:
+        token = data[vk_const.ACCESS_TOKEN].decode()
+        return Mock(content=json.dumps(responses.get(token, {'response': token})).encode())
+
+    return Mock(side_effect=post)
+
+
+def sent_tokens(post: Mock) -> list[str]:
+    return [c.kwargs['data'][vk_const.ACCESS_TOKEN].decode() for c in post.call_args_list]
+
+
+def test_least_loaded(pool: VKTokenPool) -> None:
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert first is not second
+    pool.release(first)
+    pool.release(second)
+
+
+def test_dispatch_spreads_requests(pool: VKTokenPool) -> None:
+    vk = VK(token_pool=pool)
+    post = post_by_token({})
+
+    with patch.object(HttpPool, 'post', post):
+        for _ in range(6):
+            VKRequest(vk, 'utils.getServerTime').invoke_response()
+
+    assert sorted(sent_tokens(post)) == sorted(TOKENS * 2)
+
+
+def test_captcha_suspends_token(pool: VKTokenPool) -> None:
+    vk = VK(token_pool=pool)
+    post = post_by_token({'token1': api_error(14)})
+
+    with patch.object(HttpPool, 'post', post):
+        results = [VKRequest(vk, 'utils.getServerTime').invoke_response() for _ in range(4)]
+
+    assert 'token1' not in results
+    assert sent_tokens(post).count('token1') == 1
+    assert not pool.has_available(exclude=pool.members[1:])
+
+
+def test_access_error_for_all_tokens(pool: VKTokenPool) -> None:
+    vk = VK(token_pool=pool)
+    post = post_by_token({token: api_error(15) for token in TOKENS})
+
+    with patch.object(HttpPool, 'post', post), pytest.raises(VKEAccessError):
+        VKRequest(vk, 'photos.get', owner_id=1).invoke_response()
+
+    # данные закрыты для всех ключей, ключи не исключаются
+    assert sorted(sent_tokens(post)) == TOKENS
+    assert pool.has_available(exclude=pool.members[1:])
+
+
+def test_all_suspended(pool: VKTokenPool) -> None:
+    for member in pool.members:
+        pool.suspend(member)
+
+    with pytest.raises(NoAvailableTokenError):
+        pool.acquire()
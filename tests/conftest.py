@@ -0,0 +1,36 @@
+import pytest
+
+from vk_cli.api import vk_const, vk_credentials
+
+
+@pytest.fixture(autouse=True)
+def _fast_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    # запросы в тестах не уходят в сеть, ограничение частоты их только замедляет
+    monkeypatch.setattr(vk_credentials, 'DEFAULT_RATE_LIMIT', 10_000)
+
+
+@pytest.fixture
+def vk_creds() -> dict:
+    # запросы в тестах подменяются, настоящие учётные данные (tests/credentials.py) нужны только test_album
+    return {
+        vk_const.CLIENT_ID: 00000,
+        vk_const.CLIENT_SECRET: None,
+        vk_const.ACCESS_TOKEN: '<ACCESS_TOKEN>',
+    }
+
+
+class FakeClock:
+    """
+    Часы для проверки времени хранения и ограничения частоты: текущее время задаётся атрибутом now
+    """
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def photo_item(i: int) -> dict:
+    # элемент ответа photos.get с номером i
+    return {'id': i, 'owner_id': 1, 'album_id': 2, 'user_id': None, 'text': '', 'date': 0, 'width': 1, 'height': 1}
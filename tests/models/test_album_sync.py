@@ -0,0 +1,116 @@
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vk_cli import VK, AsyncVK, CheckpointStore
+from vk_cli.api.vk_session import AsyncHttpPool, HttpPool
+from vk_cli.models import VKPhotoAlbum
+
+
+class FakeAlbum:
+    """
+    Альбом с фотографиями 1..size, ответы photos.get с rev=1 - от новых к старым
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.calls = 0
+
+    def photo(self, i: int) -> dict:
+        return {
+            'id': i,
+            'owner_id': 1,
+            'album_id': 2,
+            'user_id': None,
+            'text': '',
+            'date': 1_600_000_000 + i,
+            'width': 1,
+            'height': 1,
+        }
+
+    def post(self, url: str, data: dict, timeout: float | None = None) -> Mock:
+        self.calls += 1
+        data = {k: v.decode() for k, v in data.items()}
+        assert data['rev'] == '1'
+        offset, count = int(data.get('offset', 0)), int(data['count'])
+        ids = list(range(self.size, 0, -1))[offset : offset + count]
+        response = {'count': self.size, 'items': [self.photo(i) for i in ids]}
+        return Mock(content=json.dumps({'response': response}).encode())
+
+    async def post_async(self, *args, **kwargs) -> Mock:
+        return self.post(*args, **kwargs)
+
+
+@pytest.fixture
+def vk(vk_creds: dict) -> VK:
+    return VK(**vk_creds, checkpoints=CheckpointStore())
+
+
+def test_first_sync(vk: VK) -> None:
+    fake = FakeAlbum(250)
+    album = VKPhotoAlbum(vk, object_id=2, owner_id=1)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        photos = list(album.new_photos())
+
+    assert [p.id for p in photos] == list(range(250, 0, -1))
+    assert vk.checkpoints.get_watermark(album.sync_name) == {'id': 250, 'date': 1_600_000_250}
+
+
+def test_incremental(vk: VK) -> None:
+    fake = FakeAlbum(5000)
+    album = VKPhotoAlbum(vk, object_id=2, owner_id=1)
+    vk.checkpoints.save_watermark(album.sync_name, {'id': 4990})
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        photos = list(album.new_photos())
+
+    assert [p.id for p in photos] == list(range(5000, 4990, -1))
+    assert fake.calls == 1  # обход остановлен на первой уже полученной фотографии
+    assert vk.checkpoints.get_watermark(album.sync_name)['id'] == 5000
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        assert list(album.new_photos()) == []
+
+    assert vk.checkpoints.get_watermark(album.sync_name)['id'] == 5000
+
+
+def test_interrupted(vk: VK) -> None:
+    fake = FakeAlbum(50)
+    album = VKPhotoAlbum(vk, object_id=2, owner_id=1)
+    vk.checkpoints.save_watermark(album.sync_name, {'id': 10})
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        for photo in album.new_photos():
+            if photo.id == 45:
+                break
+
+    # не все новые фотографии пройдены, отметка не меняется
+    assert vk.checkpoints.get_watermark(album.sync_name) == {'id': 10}
+
+
+def test_since_id(vk_creds: dict) -> None:
+    fake = FakeAlbum(20)
+    album = VKPhotoAlbum(VK(**vk_creds), object_id=2, owner_id=1)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        assert [p.id for p in album.new_photos(since_id=17)] == [20, 19, 18]
+
+
+def test_async(vk_creds: dict) -> None:
+    async def collect(album: VKPhotoAlbum) -> list:
+        return [photo async for photo in album.new_photos()]
+
+    fake = FakeAlbum(300)
+    vk = AsyncVK(**vk_creds, checkpoints=CheckpointStore())
+    album = VKPhotoAlbum(vk, object_id=2, owner_id=1)
+    vk.checkpoints.save_watermark(album.sync_name, {'id': 150})
+
+    with patch.object(AsyncHttpPool, 'post', side_effect=fake.post_async):
+        photos = asyncio.run(collect(album))
+
+    assert [p.id for p in photos] == list(range(300, 150, -1))
+    assert fake.calls == 2
+    assert vk.checkpoints.get_watermark(album.sync_name)['id'] == 300
@@ -0,0 +1,182 @@
+import dataclasses
+import pickle
+import typing
+
+import dacite
+import pytest
+
+from vk_cli.models import VKPhoto
+from vk_cli.models.data import PhotoAlbumData, PhotoData
+from vk_cli.models.data.decoder import get_decoder, get_lazy_decoder
+from vk_cli.models.data.post_data import PostData
+from vk_cli.models.data.user_data import UserData, UserDataActivity
+
+PHOTO = {
+    'id': 1,
+    'owner_id': -2,
+    'album_id': 3,
+    'user_id': 100,
+    'text': 'текст',
+    'date': 1_600_000_000,
+    'width': '1280',
+    'sizes': [{'type': 'x', 'url': 'https://example.com/x.jpg', 'width': 604, 'height': 453}],
+    'likes': {'count': 5},
+}
+
+ALBUM = {
+    'id': 1,
+    'owner_id': -2,
+    'thumb_id': 0,
+    'title': 'альбом',
+    'created': 1_500_000_000,
+    'updated': None,
+    'size': '10',
+    'can_upload': 1,
+    'privacy_view': {'category': 'all'},
+}
+
+POST = {
+    'id': 1,
+    'owner_id': -2,
+    'from_id': -2,
+    'date': 1_600_000_000,
+    'text': '',
+    'comments': {'count': 3, 'can_post': 1},
+    'likes': {'count': 1, 'user_likes': 0, 'can_like': 1, 'can_publish': 1},
+    'views': None,
+    'post_type': 'post',
+    'is_favorite': False,
+    'copy_history': [{'id': 5}],
+    'attachments': [{'type': 'photo', 'photo': PHOTO}, {'type': 'link'}],
+}
+
+USER = {
+    'id': 1,
+    'first_name': 'Павел',
+    'last_name': 'Дуров',
+    'relatives': [],
+    'online': 1,
+    'last_seen': {'time': 1_600_000_000, 'platform': 7},
+}
+
+
+@pytest.mark.parametrize(
+    ('data_class', 'data'),
+    [(PhotoData, PHOTO), (PhotoAlbumData, ALBUM), (PostData, POST), (UserData, USER), (UserDataActivity, USER)],
+)
+def test_same_as_dacite(data_class: type, data: dict) -> None:
+    data = {**data, 'source': data}
+    config = data_class.Meta.config
+
+    assert get_decoder(data_class, config)(data) == dacite.from_dict(data_class, data, config)
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        {k: v for k, v in PHOTO.items() if k != 'text'},
+        {**PHOTO, 'text': None},
+        {**PHOTO, 'sizes': [{'type': 'x'}]},
+        {**PHOTO, 'sizes': 'x'},
+        {**PHOTO, 'date': 'вчера'},
+    ],
+)
+def test_errors_same_as_dacite(data: dict) -> None:
+    data = {**data, 'source': {}}
+    config = PhotoData.Meta.config
+
+    with pytest.raises(Exception) as expected:  # noqa: PT011
+        dacite.from_dict(PhotoData, data, config)
+
+    with pytest.raises(type(expected.value)) as error:
+        get_decoder(PhotoData, config)(data)
+
+    assert str(error.value) == str(expected.value)
+
+
+def test_compiled_once() -> None:
+    config = PhotoData.Meta.config
+
+    assert get_decoder(PhotoData, config) is get_decoder(PhotoData, config)
+    assert get_decoder(PhotoData, config) is not get_decoder(PhotoData)
+
+
+def test_unsupported_config() -> None:
+    @dataclasses.dataclass
+    class Data:
+        value: int
+
+    config = dacite.Config(cast=[int])
+
+    assert get_decoder(Data, config)({'value': '5'}) == Data(5)
+
+
+def test_class_var_and_init_var() -> None:
+    @dataclasses.dataclass
+    class Data:
+        kind: typing.ClassVar[str] = 'data'
+        value: int
+
+    @dataclasses.dataclass
+    class InitData:
+        value: int
+        scale: dataclasses.InitVar[int] = 1
+
+    assert get_decoder(Data)({'value': 5}) == Data(5)
+    assert get_decoder(InitData)({'value': 5}) == dacite.from_dict(InitData, {'value': 5})
+
+
+def test_slots() -> None:
+    photo = VKPhoto.from_data(None, PHOTO)
+
+    assert not hasattr(photo.vk_data, '__dict__')
+    assert not hasattr(photo.vk_data.sizes[0], '__dict__')
+    assert photo.vk_data.sizes[0].url == 'https://example.com/x.jpg'
+    assert photo.vk_data.album_id == 3
+
+
+@pytest.mark.parametrize(
+    ('data_class', 'data'),
+    [(PhotoData, PHOTO), (PhotoAlbumData, ALBUM), (PostData, POST), (UserData, USER)],
+)
+def test_lazy_same_as_eager(data_class: type, data: dict) -> None:
+    config = data_class.Meta.config
+    eager = get_decoder(data_class, config)({**data, 'source': data})
+    lazy = get_lazy_decoder(data_class, config)(data, source=data)
+
+    assert isinstance(lazy, data_class)
+    assert lazy == eager
+    assert eager == lazy
+    assert repr(lazy) == repr(eager)
+    for field in dataclasses.fields(data_class):
+        assert isinstance(getattr(lazy, field.name), type(getattr(eager, field.name)))
+
+
+def test_lazy_on_access() -> None:
+    config = PhotoData.Meta.config
+    data = {**PHOTO, 'text': None}
+    photo = get_lazy_decoder(PhotoData, config)(data, source=None)
+
+    assert photo.id == 1
+    assert photo.sizes[0].url == 'https://example.com/x.jpg'
+    assert photo.sizes is photo.sizes  # значение сохраняется после первого обращения
+
+    with pytest.raises(dacite.WrongTypeError):
+        photo.text  # noqa: B018
+
+    photo.text = 'описание'
+    assert photo.text == 'описание'
+
+
+def test_lazy_pickle() -> None:
+    config = PhotoData.Meta.config
+    eager = get_decoder(PhotoData, config)({**PHOTO, 'source': PHOTO})
+    lazy = get_lazy_decoder(PhotoData, config)(PHOTO, source=PHOTO)
+
+    restored = pickle.loads(pickle.dumps(lazy))  # noqa: S301
+
+    assert type(restored) is PhotoData
+    assert restored == eager
+
+    photo = pickle.loads(pickle.dumps(VKPhoto.from_data(None, PHOTO, lazy=True)))  # noqa: S301
+    assert photo.vk_data.sizes[0].url == 'https://example.com/x.jpg'
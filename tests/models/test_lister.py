@@ -0,0 +1,638 @@
+import asyncio
+import datetime
+import json
+import re
+import threading
+import time
+import tracemalloc
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tests.conftest import photo_item
+from vk_cli import VK, AsyncVK, CheckpointStore, api
+from vk_cli.api.vk_request import VKRequest
+from vk_cli.api.vk_session import AsyncHttpPool, HttpPool
+from vk_cli.models import ModelLister, VKPhoto
+from vk_cli.models.data import PhotoData
+
+TOTAL = 10
+
+
+class FakeApi:
+    """
+    Постраничные ответы photos.get с подсчётом одновременно выполняемых запросов
+    """
+
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay = delay
+        self.offsets = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.executes = []  # количество вызовов API в каждом execute
+        self._lock = threading.Lock()
+
+    def result(self, params: dict) -> dict:
+        offset, count = int(params.get('offset', 0)), int(params['count'])
+        self.offsets.append(offset)
+        return {'count': TOTAL, 'items': [photo_item(i) for i in range(offset, min(offset + count, TOTAL))]}
+
+    def page(self, data: dict) -> Mock:
+        data = {k: v.decode() if isinstance(v, bytes) else v for k, v in data.items()}
+        if 'code' in data:
+            calls = re.findall(r'API\.photos\.get\((\{.*?\})\)', data['code'])
+            self.executes.append(len(calls))
+            response = [self.result(json.loads(params)) for params in calls]
+        else:
+            response = self.result(data)
+        return Mock(content=json.dumps({'response': response}).encode())
+
+    def _enter(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def post(self, url: str, data: dict, timeout: float | None = None) -> Mock:
+        self._enter()
+        time.sleep(self.delay)
+        self._exit()
+        return self.page(data)
+
+    async def post_async(self, url: str, data: dict, timeout: float | None = None) -> Mock:
+        self._enter()
+        await asyncio.sleep(self.delay)
+        self._exit()
+        return self.page(data)
+
+
+def test_sequential(vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    request = api.photos.get(VK(**vk_creds), owner_id=1, album_id=2)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        photos = list(ModelLister(request, step=3))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    assert fake.offsets == [0, 3, 6, 9]  # без запроса пустой страницы в конце
+
+
+@pytest.mark.parametrize('step', [2, 3, 10, 20])
+def test_concurrent(step: int, vk_creds: dict) -> None:
+    fake = FakeApi()
+    request = api.photos.get(VK(**vk_creds), owner_id=1, album_id=2)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        photos = list(ModelLister(request, step=step, concurrency=4))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    assert sorted(fake.offsets) == list(range(0, TOTAL, step))  # без запроса пустой страницы в конце
+    if TOTAL // step > 2:
+        assert fake.max_in_flight > 1
+
+
+def test_concurrent_page_size_from_response(vk_creds: dict) -> None:
+    # API вернул меньше запрошенного: смещения планируются по фактическому размеру страницы
+    fake = FakeApi(delay=0)
+    page = fake.page
+    fake.page = lambda data: page({**data, 'count': min(int(data['count']), 4)})
+    request = api.photos.get(VK(**vk_creds), owner_id=1, album_id=2)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        photos = list(ModelLister(request, step=100, concurrency=3))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    assert sorted(fake.offsets) == [0, 4, 8]
+
+
+@pytest.mark.parametrize(('concurrency', 'pages_per_call'), [(2, 1), (1, 2), (2, 2)])
+def test_planned_short_first_page(concurrency: int, pages_per_call: int, vk_creds: dict) -> None:
+    # первая страница короче запрошенной: остальные страницы не перекрываются
+    fake = FakeApi(delay=0)
+    result = fake.result
+    short = lambda params: int(params['count']) - (not int(params.get('offset', 0)))  # noqa: E731
+    fake.result = lambda params: result({**params, 'count': short(params)})
+    request = api.photos.get(VK(**vk_creds), owner_id=1, album_id=2)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        photos = list(ModelLister(request, step=4, concurrency=concurrency, pages_per_call=pages_per_call))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    assert sorted(fake.offsets) == [0, 3, 6, 9]
+
+
+def test_concurrent_break(vk_creds: dict) -> None:
+    fake = FakeApi()
+    request = api.photos.get(VK(**vk_creds), owner_id=1, album_id=2)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        for photo in ModelLister(request, step=1, concurrency=2):
+            if photo.id == 2:
+                break
+
+    assert len(fake.offsets) < TOTAL
+
+
+def test_concurrent_async(vk_creds: dict) -> None:
+    async def collect(lister: ModelLister) -> list:
+        return [photo async for photo in lister]
+
+    fake = FakeApi()
+    request = api.photos.get(AsyncVK(**vk_creds), owner_id=1, album_id=2)
+
+    with patch.object(AsyncHttpPool, 'post', side_effect=fake.post_async):
+        photos = asyncio.run(collect(ModelLister(request, step=2, concurrency=3)))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    assert sorted(fake.offsets) == [0, 2, 4, 6, 8]
+    assert fake.max_in_flight == 3
+
+
+@pytest.mark.parametrize('concurrency', [1, 2])
+def test_execute_pages(concurrency: int, vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    request = api.photos.get(VK(**vk_creds), owner_id=1, album_id=2)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post) as post:
+        photos = list(ModelLister(request, step=1, concurrency=concurrency, pages_per_call=4))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    assert sorted(fake.offsets) == list(range(TOTAL))
+    # первая страница, две группы по 4 через execute, последняя одиночная страница без execute
+    assert fake.executes == [4, 4]
+    assert post.call_count == 4
+
+
+def test_execute_pages_async(vk_creds: dict) -> None:
+    async def collect(lister: ModelLister) -> list:
+        return [photo async for photo in lister]
+
+    fake = FakeApi(delay=0)
+    request = api.photos.get(AsyncVK(**vk_creds), owner_id=1, album_id=2)
+
+    with patch.object(AsyncHttpPool, 'post', side_effect=fake.post_async):
+        photos = asyncio.run(collect(ModelLister(request, step=3, pages_per_call=25)))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    assert fake.executes == [3]
+
+
+def cursor_page(url: str, data: dict, timeout: float | None = None) -> Mock:
+    data = {k: v.decode() for k, v in data.items()}
+    start, count = int(data.get('start_from', 0)), int(data['count'])
+    response = {'items': [photo_item(i) for i in range(start, min(start + count, TOTAL))]}
+    if start + count < TOTAL:
+        response['next_from'] = str(start + count)
+    return Mock(content=json.dumps({'response': response}).encode())
+
+
+def cursor_request(vk: VK) -> VKRequest:
+    request = VKRequest(vk, 'newsfeed.get', filters='photo')
+    request.bind_model('VKPhoto')
+    return request
+
+
+def test_cursor(vk_creds: dict) -> None:
+    request = cursor_request(VK(**vk_creds))
+
+    with patch.object(HttpPool, 'post', side_effect=cursor_page) as post:
+        photos = list(ModelLister(request, step=4, concurrency=4))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    starts = [call.kwargs['data'].get('start_from') for call in post.call_args_list]
+    assert starts == [None, b'4', b'8']
+    assert 'offset' not in post.call_args_list[1].kwargs['data']
+
+
+def test_cursor_async(vk_creds: dict) -> None:
+    async def collect(lister: ModelLister) -> list:
+        return [photo async for photo in lister]
+
+    async def post(*args, **kwargs) -> Mock:
+        return cursor_page(*args, **kwargs)
+
+    request = cursor_request(AsyncVK(**vk_creds))
+
+    with patch.object(AsyncHttpPool, 'post', side_effect=post) as async_post:
+        photos = asyncio.run(collect(ModelLister(request, step=3)))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    assert async_post.call_count == 4
+
+
+def test_resume_offset(vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    vk = VK(**vk_creds, checkpoints=CheckpointStore())
+    request = api.photos.get(vk, owner_id=1, album_id=2)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        for photo in ModelLister(request, step=3, resume=True):
+            if photo.id == 4:
+                break  # обработаны страницы 0..2 и часть страницы 3..5
+
+        assert vk.checkpoints.get(request) == {'offset': 3}
+
+        fake.offsets.clear()
+        photos = list(ModelLister(request, step=3, resume=True))
+
+    assert [p.id for p in photos] == list(range(3, TOTAL))
+    assert fake.offsets == [3, 6, 9]
+    assert vk.checkpoints.get(request) is None  # обход завершён
+
+
+def test_no_resume_keeps_no_position(vk_creds: dict) -> None:
+    # обход без resume не сохраняет позицию: следующий обход с resume=True начинается с начала
+    fake = FakeApi(delay=0)
+    vk = VK(**vk_creds, checkpoints=CheckpointStore())
+    request = api.photos.get(vk, owner_id=1, album_id=2)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        for photo in ModelLister(request, step=3):
+            if photo.id == 3:
+                break
+
+        assert vk.checkpoints.get(request) is None
+        photos = list(ModelLister(request, step=3, resume=True))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+
+
+@pytest.mark.parametrize('concurrency', [1, 2])
+def test_resume_twice(concurrency: int, vk_creds: dict) -> None:
+    # после завершения продолженного обхода повторный обход того же объекта начинается с начала
+    fake = FakeApi(delay=0)
+    vk = VK(**vk_creds, checkpoints=CheckpointStore())
+    request = api.photos.get(vk, owner_id=1, album_id=2)
+    vk.checkpoints.save(request, {'offset': 3})
+    lister = ModelLister(request, step=3, concurrency=concurrency, resume=True)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        assert [p.id for p in lister] == list(range(3, TOTAL))
+        assert [p.id for p in lister] == list(range(TOTAL))
+
+
+def test_resume_planned(vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    vk = VK(**vk_creds, checkpoints=CheckpointStore())
+    request = api.photos.get(vk, owner_id=1, album_id=2)
+    vk.checkpoints.save(request, {'offset': 4})
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        photos = list(ModelLister(request, step=2, concurrency=2, resume=True))
+
+    assert [p.id for p in photos] == list(range(4, TOTAL))
+    assert sorted(fake.offsets) == [4, 6, 8]
+
+
+def test_resume_cursor(vk_creds: dict) -> None:
+    vk = VK(**vk_creds, checkpoints=CheckpointStore())
+    request = cursor_request(vk)
+
+    with patch.object(HttpPool, 'post', side_effect=cursor_page):
+        lister = iter(ModelLister(request, step=4, resume=True))
+        for _ in range(5):
+            next(lister)
+        lister.close()
+
+        assert vk.checkpoints.get(request) == {'cursor': '4'}
+        photos = list(ModelLister(request, step=4, resume=True))
+
+    assert [p.id for p in photos] == list(range(4, TOTAL))
+
+
+class FakeResponse:
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def test_stream_memory(vk_creds: dict) -> None:
+    total, step = 100_000, 1000
+    pages = {
+        offset: json.dumps({'response': {'count': total, 'items': list(map(photo_item, range(offset, offset + step)))}})
+        for offset in range(0, total, step)
+    }
+
+    # обычная функция вместо Mock: Mock сохраняет аргументы всех вызовов
+    def post(pool: HttpPool, url: str, data: dict, timeout: float | None = None) -> FakeResponse:
+        return FakeResponse(pages[int(data.get('offset', b'0'))].encode())
+
+    request = api.photos.get(VK(**vk_creds), owner_id=1, album_id=2)
+
+    def traced(stream: bool) -> list[int]:
+        # объём памяти после получения каждой десятой страницы
+        samples = []
+        tracemalloc.start()
+        try:
+            for i, page in enumerate(ModelLister(request, step=step, stream=stream).partial_generator):
+                assert page.response.count == step
+                if i % 10 == 9:
+                    samples.append(tracemalloc.get_traced_memory()[0])
+        finally:
+            tracemalloc.stop()
+        return samples
+
+    with patch.object(HttpPool, 'post', post):
+        stream = traced(stream=True)
+        retained = traced(stream=False)
+
+    assert len(stream) == len(retained) == total // step // 10
+    page_size = (retained[-1] - retained[0]) / (total // step - 10)
+    assert max(stream) - stream[0] < page_size  # в потоковом режиме память не растёт
+    assert retained[-1] > 10 * max(stream)
+
+
+@pytest.fixture
+def photos_lister(vk_creds: dict) -> ModelLister:
+    return ModelLister(api.photos.get(VK(**vk_creds), owner_id=1, album_id=2), step=2)
+
+
+def test_getitem(photos_lister: ModelLister) -> None:
+    fake = FakeApi(delay=0)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post) as post:
+        assert photos_lister[4].id == 4
+        assert post.call_args.kwargs['data']['count'] == b'1'
+
+        assert [p.id for p in photos_lister[3:8]] == [3, 4, 5, 6, 7]
+        assert fake.offsets == [4, 3, 5, 7]  # только страницы, покрывающие срез
+
+        with pytest.raises(IndexError):
+            photos_lister[10]  # noqa: B018
+
+        with pytest.raises(TypeError):
+            photos_lister['1']  # noqa: B018
+
+
+def test_getitem_with_total(photos_lister: ModelLister) -> None:
+    fake = FakeApi(delay=0)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        assert photos_lister[-1].id == 9
+        assert [p.id for p in photos_lister[::3]] == [0, 3, 6, 9]
+        assert [p.id for p in photos_lister[::-4]] == [9, 5, 1]
+
+        with pytest.raises(IndexError):
+            photos_lister[-11]  # noqa: B018
+
+
+def test_take_skip_last(photos_lister: ModelLister) -> None:
+    fake = FakeApi(delay=0)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        assert [p.id for p in photos_lister.take(3)] == [0, 1, 2]
+        assert [p.id for p in photos_lister.skip(7)] == [7, 8, 9]
+        assert [p.id for p in photos_lister.last(2)] == [8, 9]
+        assert photos_lister.last(0) == []
+
+
+def test_slice_wide_step(photos_lister: ModelLister) -> None:
+    # шаг среза больше размера страницы: запрашивается и создаётся только по одному объекту на номер
+    fake = FakeApi(delay=0)
+
+    wrapped = patch.object(VKPhoto, 'from_data', wraps=VKPhoto.from_data)
+    with patch.object(HttpPool, 'post', side_effect=fake.post) as post, wrapped as from_data:
+        assert [p.id for p in photos_lister[1:10:4]] == [1, 5, 9]
+        assert [p.id for p in photos_lister[8:0:-3]] == [8, 5, 2]
+
+    assert fake.offsets == [1, 5, 9, 0, 2, 5, 8]  # отрицательный шаг: сначала запрос общего количества
+    assert {call.kwargs['data']['count'] for call in post.call_args_list} == {b'1'}
+    assert from_data.call_count == 6
+
+
+def test_slice_beyond_total(photos_lister: ModelLister) -> None:
+    fake = FakeApi(delay=0)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        assert [p.id for p in photos_lister[5:1000]] == [5, 6, 7, 8, 9]
+
+    assert fake.offsets == [5, 7, 9]  # страницы за пределами общего количества не запрашиваются
+
+
+def test_slice_concurrent(vk_creds: dict) -> None:
+    fake = FakeApi()
+    lister = ModelLister(api.photos.get(VK(**vk_creds), owner_id=1, album_id=2), step=1, concurrency=4)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        assert [p.id for p in lister[1:9]] == list(range(1, 9))
+
+    assert fake.max_in_flight > 1
+
+
+def test_slice_async(vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    lister = ModelLister(api.photos.get(AsyncVK(**vk_creds), owner_id=1, album_id=2), step=2, concurrency=2)
+
+    with patch.object(AsyncHttpPool, 'post', side_effect=fake.post_async):
+        assert [p.id for p in asyncio.run(lister[3:8])] == [3, 4, 5, 6, 7]
+        assert asyncio.run(lister[-2]).id == 8
+
+
+def test_slice_cursor(vk_creds: dict) -> None:
+    with pytest.raises(TypeError):
+        ModelLister(cursor_request(VK(**vk_creds)))[5]  # noqa: B018
+
+
+def test_count_probe(photos_lister: ModelLister) -> None:
+    fake = FakeApi(delay=0)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post) as post:
+        assert photos_lister.count == TOTAL
+        assert post.call_args.kwargs['data']['count'] == b'1'
+
+        list(photos_lister)
+        assert photos_lister.count == TOTAL
+
+    assert post.call_count == 1 + 5
+
+
+def test_count_probe_ids_only(vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    request = api.photos.get(VK(**vk_creds), owner_id=1, album_id=2, extended=True, photo_sizes=True)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post) as post:
+        assert ModelLister(request, step=4).count == TOTAL
+
+    data = post.call_args.kwargs['data']
+    assert data['count'] == b'1'
+    assert 'extended' not in data
+    assert 'photo_sizes' not in data
+    assert request.method_params['extended']  # исходный запрос не изменён
+
+
+def test_count_async(vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    lister = ModelLister(api.photos.get(AsyncVK(**vk_creds), owner_id=1, album_id=2), step=4)
+
+    with patch.object(AsyncHttpPool, 'post', side_effect=fake.post_async) as post:
+        assert asyncio.run(lister.count) == TOTAL
+        assert post.call_args.kwargs['data']['count'] == b'1'
+        assert asyncio.run(lister.count) == TOTAL
+
+    assert post.call_count == 1
+
+
+def test_ids_only(vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    request = api.photos.get(VK(**vk_creds), owner_id=1, album_id=2, extended=True, photo_sizes=True)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post) as post, patch.object(VKPhoto, 'from_data') as from_data:
+        ids = list(ModelLister(request, step=4).ids())
+
+    assert ids == list(range(TOTAL))
+    from_data.assert_not_called()
+    for call in post.call_args_list:
+        assert 'extended' not in call.kwargs['data']
+        assert 'photo_sizes' not in call.kwargs['data']
+    assert request.method_params['extended']  # исходный запрос не изменён
+
+
+def test_ids_only_async(vk_creds: dict) -> None:
+    async def collect(lister: ModelLister) -> list:
+        return [i async for i in lister.ids()]
+
+    fake = FakeApi(delay=0)
+    request = api.photos.get(AsyncVK(**vk_creds), owner_id=1, album_id=2)
+
+    with patch.object(AsyncHttpPool, 'post', side_effect=fake.post_async):
+        assert asyncio.run(collect(ModelLister(request, step=3))) == list(range(TOTAL))
+
+
+def test_count_many(vk_creds: dict) -> None:
+    vk = VK(**vk_creds)
+
+    def execute(url: str, data: dict, timeout: float | None = None) -> Mock:
+        calls = re.findall(r'API\.photos\.getAll\((\{.*?\})\)\.count', data['code'].decode())
+        counts = []
+        for params in map(json.loads, calls):
+            assert params['count'] == 1
+            counts.append(params['owner_id'] * 10 if params['owner_id'] > 0 else False)
+        return Mock(content=json.dumps({'response': counts}).encode())
+
+    requests = [api.photos.get_all(vk, owner_id=owner_id) for owner_id in [*range(1, 30), -1]]
+
+    with patch.object(HttpPool, 'post', side_effect=execute) as post:
+        counts = ModelLister.count_many(requests)
+
+    assert post.call_count == 2  # 30 запросов: 25 + 5 вызовов в двух execute
+    assert counts == [i * 10 for i in range(1, 30)] + [None]
+
+
+class DatedAlbum:
+    """
+    Альбом из size фотографий, фотография i добавлена в момент START + 10 * i
+    """
+
+    START = 1_600_000_000
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.counts = []
+
+    def post(self, url: str, data: dict, timeout: float | None = None) -> Mock:
+        data = {k: v.decode() for k, v in data.items()}
+        offset, count = int(data.get('offset', 0)), int(data['count'])
+        self.counts.append(count)
+        ids = list(range(self.size))
+        if data.get('rev') == '1':
+            ids.reverse()
+        items = [{**photo_item(i), 'date': self.START + 10 * i} for i in ids[offset : offset + count]]
+        return Mock(content=json.dumps({'response': {'count': self.size, 'items': items}}).encode())
+
+    async def post_async(self, *args, **kwargs) -> Mock:
+        return self.post(*args, **kwargs)
+
+
+@pytest.mark.parametrize('rev', [False, True])
+def test_between(rev: bool, vk_creds: dict) -> None:
+    album = DatedAlbum(5000)
+    lister = ModelLister(api.photos.get(VK(**vk_creds), owner_id=1, album_id=2, rev=rev))
+    start = datetime.datetime.fromtimestamp(DatedAlbum.START + 10 * 1234)
+
+    with patch.object(HttpPool, 'post', side_effect=album.post):
+        photos = lister.between(start, DatedAlbum.START + 10 * 1300 - 5)
+
+    expected = list(range(1234, 1300))
+    assert [p.id for p in photos] == (expected[::-1] if rev else expected)
+    probes = album.counts.count(1)
+    assert probes <= 2 * 13 + 1  # запрос количества и двоичный поиск обеих границ
+    assert sum(c for c in album.counts if c > 1) <= 2 * 1000  # только страницы внутри диапазона
+
+
+def test_between_empty(vk_creds: dict) -> None:
+    album = DatedAlbum(100)
+    lister = ModelLister(api.photos.get(VK(**vk_creds), owner_id=1, album_id=2))
+
+    with patch.object(HttpPool, 'post', side_effect=album.post):
+        assert lister.between(0, DatedAlbum.START) == []
+        assert [p.id for p in lister.between(0, DatedAlbum.START + 25)] == [0, 1, 2]
+        assert len(lister.between(DatedAlbum.START + 995, DatedAlbum.START + 10_000)) == 0
+
+
+def test_between_async(vk_creds: dict) -> None:
+    album = DatedAlbum(300)
+    lister = ModelLister(api.photos.get(AsyncVK(**vk_creds), owner_id=1, album_id=2, rev=1))
+
+    with patch.object(AsyncHttpPool, 'post', side_effect=album.post_async):
+        photos = asyncio.run(lister.between(DatedAlbum.START + 100, DatedAlbum.START + 200))
+
+    assert [p.id for p in photos] == list(range(19, 9, -1))
+
+
+@pytest.mark.parametrize(
+    ('vk_mode', 'lister_mode', 'stored'),
+    [
+        ('keep', None, dict),
+        ('drop', None, type(None)),
+        ('keep', 'bytes', bytes),
+        ('bytes', 'keep', dict),
+    ],
+)
+def test_source_mode(vk_mode: str, lister_mode: str | None, stored: type, vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    request = api.photos.get(VK(**vk_creds, source_mode=vk_mode), owner_id=1, album_id=2)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        photos = list(ModelLister(request, step=5, source_mode=lister_mode))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    assert isinstance(photos[3].vk_data.source, stored)
+    assert photos[3].get_source_data() == (None if stored is type(None) else photo_item(3))
+
+
+def test_lazy(vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    request = api.photos.get(VK(**vk_creds, source_mode='drop'), owner_id=1, album_id=2)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        photos = list(ModelLister(request, step=5, lazy=True))
+
+    assert [p.id for p in photos] == list(range(TOTAL))
+    assert type(photos[0].vk_data) is not PhotoData
+    assert photos[0].vk_data == VKPhoto.from_data(None, photo_item(0), source_mode='drop').vk_data
+
+
+def test_frame(vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    lister = ModelLister(api.photos.get(VK(**vk_creds), owner_id=1, album_id=2), step=3, stream=True)
+
+    with patch.object(HttpPool, 'post', side_effect=fake.post):
+        assert [len(frame) for frame in lister.frames()] == [3, 3, 3, 1]
+        frame = lister.frame()
+
+    assert list(frame['id']) == list(range(TOTAL))
+
+
+def test_frame_async(vk_creds: dict) -> None:
+    fake = FakeApi(delay=0)
+    lister = ModelLister(api.photos.get(AsyncVK(**vk_creds), owner_id=1, album_id=2), step=4)
+
+    with patch.object(AsyncHttpPool, 'post', side_effect=fake.post_async):
+        frame = asyncio.run(lister.frame())
+
+    assert list(frame['album_id']) == [2] * TOTAL
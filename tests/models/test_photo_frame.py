@@ -0,0 +1,79 @@
+import datetime
+
+import pytest
+
+from vk_cli.models import PhotoFrame, photo_frame
+
+
+def photo(i: int, width: int, date: int) -> dict:
+    return {
+        'id': i,
+        'owner_id': -1,
+        'album_id': 2,
+        'date': date,
+        'text': '',
+        'sizes': [
+            {'type': 's', 'url': f'https://example.com/{i}/s.jpg', 'width': 75, 'height': 50},
+            {'type': 'z', 'url': f'https://example.com/{i}/z.jpg', 'width': width, 'height': width // 2},
+            {'type': 'm', 'url': f'https://example.com/{i}/m.jpg', 'width': 130, 'height': 87},
+        ],
+    }
+
+
+@pytest.fixture
+def frame() -> PhotoFrame:
+    return PhotoFrame.from_items([photo(1, 1280, 300), photo(2, 800, 100), photo(3, 2000, 200), photo(4, 1280, 400)])
+
+
+def test_from_items(frame: PhotoFrame) -> None:
+    assert len(frame) == 4
+    assert list(frame['id']) == [1, 2, 3, 4]
+    assert list(frame['width']) == [1280, 800, 2000, 1280]
+    assert frame['url'][1] == 'https://example.com/2/z.jpg'
+    assert list(frame['resolution']) == [1280 * 640, 800 * 400, 2000 * 1000, 1280 * 640]
+    assert next(frame.rows()) == (1, -1, 2, 300, 1280, 640, 'https://example.com/1/z.jpg')
+
+
+def test_without_sizes() -> None:
+    frame = PhotoFrame.from_items([{'id': 1, 'owner_id': 1, 'album_id': 2, 'date': 0, 'width': 10, 'height': 5}])
+
+    assert next(frame.rows()) == (1, 1, 2, 0, 10, 5, '')
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    # where и sort выполняются средствами NumPy, если он установлен, иначе - циклами по столбцам
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(photo_frame, '_numpy', lambda: None)
+
+
+@pytest.mark.usefixtures('backend')
+def test_where(frame: PhotoFrame) -> None:
+    assert list(frame.where('date', 200, 400)['id']) == [1, 3]
+    assert list(frame.where('date', datetime.datetime.fromtimestamp(300))['id']) == [1, 4]
+    assert list(frame.where('resolution', high=1_000_000)['id']) == [1, 2, 4]
+    assert frame.where('width', 5000).url == []
+
+
+@pytest.mark.usefixtures('backend')
+def test_sort(frame: PhotoFrame) -> None:
+    assert list(frame.sort()['id']) == [2, 3, 1, 4]
+    assert list(frame.sort('resolution', reverse=True)['id']) == [3, 1, 4, 2]
+    assert frame.sort('width').url == [f'https://example.com/{i}/z.jpg' for i in (2, 1, 4, 3)]
+
+
+def test_filter_take_concat(frame: PhotoFrame) -> None:
+    assert list(frame.filter([True, False, False, True])['date']) == [300, 400]
+    assert list(frame.take([3, 0])['id']) == [4, 1]
+    assert list(PhotoFrame.concat([frame, frame.take([1])])['id']) == [1, 2, 3, 4, 2]
+
+
+def test_to_numpy(frame: PhotoFrame) -> None:
+    np = pytest.importorskip('numpy')
+
+    arrays = frame.to_numpy()
+
+    assert arrays['date'].dtype == np.int64
+    assert list(arrays['id'][arrays['width'] > 1000]) == [1, 3, 4]
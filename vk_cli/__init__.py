@@ -2,4 +2,8 @@
 
 __version__ = '0.0.1-dev2'
 
-from .api.vk_credentials import VK, VKCredentials
+from .api.vk_credentials import AsyncVK, VK, VKCredentials, VKTokenPool
+from .api.vk_cache import ResponseCache, ResponseMemo
+from .api.vk_checkpoint import CheckpointStore
+from .api.vk_retry import RetryBudget, RetryPolicy
+from .api.vk_session import HttpConfig
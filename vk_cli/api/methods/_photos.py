@@ -1,3 +1,4 @@
+from vk_cli.api.vk_method_info import MethodInfo
 from vk_cli.api.vk_request import VKRequest
 
 from ._vkapi_base import VKApiBase, build_request, raw_result
@@ -11,6 +12,20 @@ class VKApiPhotos(VKApiBase):
     """
 
     method_group = 'photos'
+    methods = (
+        MethodInfo('get', max_count=1000, ttl=600),
+        MethodInfo('getAll', max_count=200, ttl=600),
+        MethodInfo('getAlbums', ttl=600),
+        MethodInfo('getAlbumsCount', ttl=600),
+        # ограничение не документировано, значение выбрано с запасом по длине запроса
+        MethodInfo('getById', max_ids=100, ids_param='photos', ttl=600),
+        MethodInfo('getComments', max_count=100, ttl=300),
+        MethodInfo('getAllComments', max_count=100, ttl=300),
+        MethodInfo('getNewTags', max_count=100, ttl=300),
+        MethodInfo('getTags', ttl=300),
+        MethodInfo('getUserPhotos', max_count=1000, ttl=600),
+        MethodInfo('search', max_count=1000, ttl=300),
+    )
 
     @classmethod
     @raw_result
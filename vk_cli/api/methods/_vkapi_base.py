@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from abc import ABC
+from dataclasses import replace
 
 from vk_cli.api.misc import get_params
+from vk_cli.api.vk_method_info import MethodInfo, register_method
 from vk_cli.api.vk_request import VKRequest
 
 from typing import TYPE_CHECKING
@@ -14,6 +16,13 @@ if TYPE_CHECKING:
 class VKApiBase(ABC):
     method_group = None
     cls_name_prefix = 'VKApi'
+    methods: tuple[MethodInfo, ...] = ()  # сведения о методах группы, регистрируются при объявлении класса
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        for info in cls.methods:
+            register_method(replace(info, name=f'{cls.method_group}.{info.name}'))
 
     def __init__(self) -> None:
         class_name = self.__class__.__name__
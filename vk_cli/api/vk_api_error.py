@@ -15,7 +15,7 @@ class VKError(Exception):
 
     @property
     def params(self):
-        return {a['key']: a['value'] for a in self.error['request_params']}
+        return {a['key']: a['value'] for a in self.error.get('request_params', [])}
 
     def __str__(self) -> str:
         return f"Error(code = '{self.code}', description = '{self.description}', params = '{self.params}')"
@@ -51,8 +51,10 @@ class VKEInternal(VKError):
 class VKApiErrorFactory:
     errors = {
         113: VKEInvalidUserId,
+        5: VKEAccessError,
         14: VKECaptchaNeeded,
         6: VKETooFrequent,
+        10: VKEInternal,
         7: VKEAccessError,
         15: VKEAccessError,
     }
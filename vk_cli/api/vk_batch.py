@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from .vk_api_error import VKApiErrorFactory
+from .vk_request import VKRequest
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from .vk_credentials import VK
+    from .vk_response import VKResponse
+
+log = logging.getLogger(__name__)
+
+
+class VKExecuteRequest(VKRequest):
+    """
+    Вызов метода execute с кодом на VKScript.
+    Кроме результата сохраняет ошибки отдельных вызовов API (execute_errors).
+    Кеши обрабатываются для каждого вызова в отдельности (set_responses), а не для execute целиком
+    """
+
+    use_cache = False
+
+    def __init__(self, vk: VK, code: str) -> None:
+        super().__init__(vk, 'execute', code=code)
+        self.execute_errors = []
+
+    @classmethod
+    def from_calls(cls, vk: VK, calls: list[str]) -> VKExecuteRequest:
+        """
+        Запрос, возвращающий массив результатов вызовов API
+        """
+        return cls(vk, f'return [{",".join(calls)}];')
+
+    def _extract_response(self, json_resp: dict):
+        self.execute_errors = json_resp.get('execute_errors', [])
+        return super()._extract_response(json_resp)
+
+    def set_responses(self, requests: list[VKRequest], results: list) -> None:
+        """
+        Назначение запросам, вызванным через execute, их результатов или ошибок.
+        Результаты сохраняются в кешах VK.cache и VK.memo, изменяющие запросы сбрасывают связанные записи
+        """
+        errors = iter(self.execute_errors)
+        for request, result in zip(requests, results, strict=True):
+            if result is False:  # вызов завершился ошибкой, ошибки перечислены в порядке вызовов
+                error = next(errors, None)
+                if error is not None:
+                    result = VKApiErrorFactory.get_exception(error)
+
+            request._set_result(result)
+
+
+class VKBatch:
+    """
+    Пакетное выполнение запросов: до 25 вызовов API за один HTTP-запрос через метод execute.
+    Каждый добавленный запрос после отправки пакета получает собственный VKResponse,
+    при ошибке вызова VKResponse.error содержит соответствующее исключение VKError.
+    Запрос с количеством идентификаторов больше допустимого для метода (MethodInfo.max_ids)
+    выполняется несколькими вызовами, их результаты объединяются в одном ответе
+    """
+
+    max_calls = 25  # ограничение API на количество вызовов внутри execute
+    max_code_length = 60_000  # размер кода VKScript, при превышении которого пакет отправляется
+
+    def __init__(self, vk: VK, max_calls: int | None = None, max_code_length: int | None = None) -> None:
+        self._vk = vk
+        self.max_calls = min(max_calls or self.max_calls, VKBatch.max_calls)
+        self.max_code_length = max_code_length or self.max_code_length
+
+        self._requests: list[VKRequest] = []
+        self._calls: list[str] = []
+        self._code_length = 0
+        self._split: list[tuple[VKRequest, list[VKRequest]]] = []  # запросы, разбитые по max_ids, и их части
+
+    def __enter__(self) -> VKBatch:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def add(self, request: VKRequest) -> VKRequest:
+        """
+        Добавление запроса в пакет. Пакет отправляется автоматически при достижении лимитов
+        """
+        parts = request.split_ids()
+        if len(parts) > 1:
+            self._split.append((request, parts))
+
+        for part in parts:
+            self._add_call(part)
+        return request
+
+    def _add_call(self, request: VKRequest) -> None:
+        call = self.vkscript_call(request)
+
+        if self._calls and self._code_length + len(call) > self.max_code_length:
+            self._flush_full()
+
+        self._requests.append(request)
+        self._calls.append(call)
+        self._code_length += len(call) + 1
+
+        if len(self._calls) >= self.max_calls:
+            self._flush_full()
+
+    def _flush_full(self) -> None:
+        """
+        Отправка пакета, достигшего лимитов
+        """
+        self.flush()
+
+    def _take(self) -> list[VKRequest]:
+        """
+        Накопленные запросы, пакет очищается
+        """
+        requests = self._requests
+        self._requests, self._calls, self._code_length = [], [], 0
+        return requests
+
+    @staticmethod
+    def vkscript_call(request: VKRequest) -> str:
+        """
+        Представление запроса в виде вызова API на VKScript
+        """
+        params = {k: request.cast_param(v) for k, v in request.method_params.items() if v is not None}
+        return f'API.{request.method_name}({json.dumps(params, ensure_ascii=False)})'
+
+    def flush(self) -> None:
+        """
+        Отправка накопленных запросов одним вызовом execute
+        """
+        if not self._requests:
+            return
+
+        calls = self._calls
+        requests = self._take()
+
+        log.debug(f'execute batch of {len(requests)} calls')
+        execute = VKExecuteRequest.from_calls(self._vk, calls)
+        execute.set_responses(requests, execute.invoke_response())
+        self._join_split()
+
+    def _join_split(self) -> None:
+        """
+        Объединение результатов частей разбитых запросов, все части которых выполнены
+        """
+        pending = []
+        for request, parts in self._split:
+            if all(part.is_invoked for part in parts):
+                request._set_result(_join_results([part.response for part in parts]))
+            else:
+                pending.append((request, parts))
+        self._split = pending
+
+
+class AsyncVKBatch(VKBatch):
+    """
+    Пакетное выполнение запросов асинхронного клиента (AsyncVK), используется через async with.
+    Заполненные пакеты не отправляются в add, а накапливаются и отправляются одновременно при flush
+    """
+
+    def __init__(self, vk: VK, max_calls: int | None = None, max_code_length: int | None = None) -> None:
+        super().__init__(vk, max_calls, max_code_length)
+        self._full: list[list[VKRequest]] = []  # заполненные пакеты, ожидающие отправки
+
+    def __enter__(self) -> VKBatch:
+        msg = 'AsyncVKBatch must be used with "async with"'
+        raise TypeError(msg)
+
+    async def __aenter__(self) -> AsyncVKBatch:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            await self.flush()
+
+    def __len__(self) -> int:
+        return len(self._requests) + sum(map(len, self._full))
+
+    def _flush_full(self) -> None:
+        self._full.append(self._take())
+
+    async def flush(self) -> None:
+        """
+        Отправка накопленных пакетов: каждый - одним вызовом execute, пакеты выполняются одновременно
+        """
+        batches, self._full = self._full, []
+        if self._requests:
+            batches.append(self._take())
+
+        log.debug(f'execute {len(batches)} batches')
+        await asyncio.gather(*(execute_requests(self._vk, requests) for requests in batches))
+        self._join_split()
+
+
+def _join_results(responses: list[VKResponse]):
+    """
+    Результат запроса, разбитого на части по идентификаторам: списки объектов частей объединяются,
+    при ошибке любой из частей - её исключение
+    """
+    for response in responses:
+        if response.error is not None or response.raw_data is False:
+            return response.raw_data
+
+    results = [response.raw_data for response in responses]
+    if all(isinstance(result, dict) and 'items' in result for result in results):
+        items = [item for result in results for item in result['items']]
+        return {**results[0], 'count': len(items), 'items': items}
+    return [item for result in results for item in result]
+
+
+def execute_requests(vk: VK, requests: list[VKRequest]):
+    """
+    Выполнение запросов одним вызовом execute, каждый запрос получает собственный VKResponse.
+    Для асинхронного клиента возвращает корутину
+    """
+    execute = VKExecuteRequest.from_calls(vk, [VKBatch.vkscript_call(request) for request in requests])
+
+    if vk.is_async:
+        return _execute_requests_async(execute, requests)
+
+    execute.set_responses(requests, execute.invoke_response())
+    return None
+
+
+async def _execute_requests_async(execute: VKExecuteRequest, requests: list[VKRequest]) -> None:
+    execute.set_responses(requests, await execute.invoke_response())
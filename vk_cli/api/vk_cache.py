@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .vk_method_info import get_method_info
+
+if TYPE_CHECKING:
+    from .vk_request import VKRequest
+    from .vk_response import VKResponse
+
+log = logging.getLogger(__name__)
+
+
+def get_request_owner(request: VKRequest) -> int | None:
+    """
+    Владелец данных, к которым обращается запрос (по параметрам owner_id, group_id, user_id)
+    """
+    params = request.method_params
+
+    if params.get('owner_id') is not None:
+        return int(params['owner_id'])
+    if params.get('group_id') is not None:
+        return -abs(int(params['group_id']))
+    if params.get('user_id') is not None:
+        return int(params['user_id'])
+    return None
+
+
+class ResponseCache:
+    """
+    Постоянный кеш ответов API в базе SQLite.
+    Ключ - имя метода и параметры запроса без ключа доступа (VKRequest.fingerprint).
+    Кешируются методы чтения, для которых задано время хранения (в реестре методов или параметром ttl);
+    вызов метода, изменяющего данные, удаляет записи той же группы методов для того же владельца
+    (или всей группы, если владелец не указан)
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ':memory:',
+        ttl: dict[str, float] | None = None,
+        default_ttl: float = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        :param path: файл базы данных
+        :param ttl: время хранения ответов по именам методов, заменяет указанное в реестре методов
+        :param default_ttl: время хранения для остальных методов чтения, 0 - не кешировать
+        """
+        self.ttl = ttl or {}
+        self.default_ttl = default_ttl
+        self._clock = clock
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            (
+                'CREATE TABLE IF NOT EXISTS responses '
+                '(key TEXT PRIMARY KEY, method TEXT, owner_id INTEGER, expires REAL, data TEXT)'
+            ),
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_method ON responses (method, owner_id)')
+        self._db.commit()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(hits={self.hits}, misses={self.misses})'
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def get_ttl(self, method_name: str) -> float:
+        if method_name in self.ttl:
+            return self.ttl[method_name]
+
+        info = get_method_info(method_name)
+        if not info.idempotent:
+            return 0
+        return info.ttl or self.default_ttl
+
+    def get(self, request: VKRequest) -> Any:
+        """
+        Сохранённый ответ на запрос или None
+        """
+        if not self.get_ttl(request.method_name):
+            return None
+
+        with self._lock:
+            row = self._db.execute(
+                'SELECT data FROM responses WHERE key = ? AND expires > ?',
+                (request.fingerprint, self._clock()),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        log.debug(f'cache hit: {request.method_name}')
+        return json.loads(row[0])
+
+    def store(self, request: VKRequest, raw_result: Any) -> None:
+        ttl = self.get_ttl(request.method_name)
+        if not ttl:
+            return
+
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+                (
+                    request.fingerprint,
+                    request.method_name,
+                    get_request_owner(request),
+                    self._clock() + ttl,
+                    json.dumps(raw_result, ensure_ascii=False),
+                ),
+            )
+            self._db.commit()
+
+    def invalidate(self, request: VKRequest) -> None:
+        """
+        Удаление записей, которые могли устареть после выполнения изменяющего запроса
+        """
+        method_group = request.method_name.partition('.')[0]
+        owner_id = get_request_owner(request)
+
+        with self._lock:
+            if owner_id is None:
+                self._db.execute('DELETE FROM responses WHERE method LIKE ?', (f'{method_group}.%',))
+            else:
+                self._db.execute(
+                    'DELETE FROM responses WHERE method LIKE ? AND (owner_id IS NULL OR owner_id = ?)',
+                    (f'{method_group}.%', owner_id),
+                )
+            self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def approx_size(data: Any) -> int:
+    """
+    Приблизительный объём памяти, занимаемый JSON-данными, байт
+    """
+    size = sys.getsizeof(data)
+
+    if isinstance(data, dict):
+        size += sum(approx_size(k) + approx_size(v) for k, v in data.items())
+    elif isinstance(data, list):
+        size += sum(approx_size(v) for v in data)
+
+    return size
+
+
+class ResponseMemo:
+    """
+    Кеш объектов VKResponse в памяти процесса с вытеснением давно не использовавшихся (LRU).
+    Размер ограничен количеством записей и приблизительным объёмом данных ответов.
+    Сохраняются ответы методов чтения, для которых в реестре методов задано время хранения (MethodInfo.ttl)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param max_entries: максимальное количество ответов
+        :param max_bytes: максимальный суммарный объём данных ответов
+        :param ttl: наибольшее время хранения ответа, сек; None - время из реестра методов
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.size = 0  # текущий объём данных
+
+        # fingerprint -> (response, size, owner_id, expires)
+        self._entries: OrderedDict[str, tuple[VKResponse, int, int | None, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self)} entries, {self.size} bytes)'
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def get_ttl(self, method_name: str) -> float:
+        """
+        Время хранения ответа метода, 0 - не сохранять (например, utils.getServerTime или photos.getUploadServer)
+        """
+        info = get_method_info(method_name)
+        if not info.idempotent or not info.ttl:
+            return 0
+        return info.ttl if self.ttl is None else min(info.ttl, self.ttl)
+
+    def get(self, request: VKRequest) -> VKResponse | None:
+        if not self.get_ttl(request.method_name):
+            return None
+
+        key = request.fingerprint
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[3] < self._clock():
+                self._pop(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def store(self, request: VKRequest, response: VKResponse) -> None:
+        ttl = self.get_ttl(request.method_name)
+        if not ttl:
+            return
+
+        key = request.fingerprint
+        size = approx_size(response.raw_data)
+        if size > self.max_bytes:
+            return
+
+        expires = self._clock() + ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+            self._entries[key] = (response, size, get_request_owner(request), expires)
+            self.size += size
+
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str) -> None:
+        _, size, _, _ = self._entries.pop(key)
+        self.size -= size
+
+    def invalidate(self, request: VKRequest) -> None:
+        """
+        Удаление ответов той же группы методов для того же владельца (см. ResponseCache.invalidate)
+        """
+        method_prefix = request.method_name.partition('.')[0] + '.'
+        owner_id = get_request_owner(request)
+
+        with self._lock:
+            for key, (response, _, entry_owner, _) in list(self._entries.items()):
+                if not response.request.method_name.startswith(method_prefix):
+                    continue
+                if owner_id is None or entry_owner is None or entry_owner == owner_id:
+                    self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .vk_request import VKRequest
+
+
+class CheckpointStore:
+    """
+    Хранилище позиций постраничного получения в базе SQLite.
+    Ключ - базовый запрос выборки (VKRequest.fingerprint), значение - смещение или курсор страницы,
+    с которой продолжается прерванный обход (ModelLister(..., resume=True)).
+    Также хранит именованные отметки синхронизации (например, последнюю полученную фотографию альбома)
+    """
+
+    def __init__(self, path: str | Path = ':memory:') -> None:
+        """
+        :param path: файл базы данных
+        """
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute('CREATE TABLE IF NOT EXISTS checkpoints (key TEXT PRIMARY KEY, position TEXT, updated REAL)')
+        self._db.execute('CREATE TABLE IF NOT EXISTS watermarks (name TEXT PRIMARY KEY, value TEXT, updated REAL)')
+        self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM checkpoints').fetchone()[0]
+
+    def get(self, request: VKRequest) -> dict[str, Any] | None:
+        """
+        Сохранённая позиция: {'offset': int} или {'cursor': str}
+        """
+        with self._lock:
+            row = self._db.execute('SELECT position FROM checkpoints WHERE key = ?', (request.fingerprint,)).fetchone()
+
+        return json.loads(row[0]) if row is not None else None
+
+    def save(self, request: VKRequest, position: dict[str, Any]) -> None:
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)',
+                (request.fingerprint, json.dumps(position), time.time()),
+            )
+            self._db.commit()
+
+    def delete(self, request: VKRequest) -> None:
+        """
+        Удаление позиции завершённого обхода
+        """
+        with self._lock:
+            self._db.execute('DELETE FROM checkpoints WHERE key = ?', (request.fingerprint,))
+            self._db.commit()
+
+    def get_watermark(self, name: str) -> dict[str, Any] | None:
+        """
+        Отметка синхронизации с указанным именем
+        """
+        with self._lock:
+            row = self._db.execute('SELECT value FROM watermarks WHERE name = ?', (name,)).fetchone()
+
+        return json.loads(row[0]) if row is not None else None
+
+    def save_watermark(self, name: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)',
+                (name, json.dumps(value), time.time()),
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute('DELETE FROM checkpoints')
+            self._db.execute('DELETE FROM watermarks')
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -5,6 +5,7 @@ ACCESS_TOKEN_SECURE = 'access_token_secure'
 API_VERSION = 'v'
 HTTPS = 'https'
 LANG = 'lang'
+RATE_LIMIT = 'rate_limit'  # ограничение количества запросов в секунду для ключа доступа
 
 PLATFORM_UNKNOWN = 0
 PLATFORM_MOBILE = 1  # Мобильная версия сайта или неопознанное мобильное приложение
@@ -1,14 +1,38 @@
-from typing import TypedDict
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from typing import NotRequired, TYPE_CHECKING, TypedDict
 
 from . import vk_const
+from .vk_json import SOURCE_KEEP, SOURCE_MODES, get_json_decoder
+from .vk_rate_limit import get_rate_limiter
+from .vk_session import AsyncHttpPool, HttpConfig, HttpPool
+from .vk_singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable
+
+    from .vk_batch import AsyncVKBatch, VKBatch
+    from .vk_cache import ResponseCache, ResponseMemo
+    from .vk_checkpoint import CheckpointStore
+    from .vk_json import JSONDecoder
+    from .vk_retry import RetryPolicy
+    from .vk_rate_limit import TokenBucket
+
+log = logging.getLogger(__name__)
 
 DEFAULT_API_VERSION = '5.131'
+DEFAULT_RATE_LIMIT = 3  # запросов в секунду на один ключ доступа
 
 
 class VKCredentialsData(TypedDict):
     client_id: int
     client_secret: str | None
     access_token: str
+    rate_limit: NotRequired[float]
 
 
 class ApiCredentials:
@@ -41,11 +65,238 @@ class ApiCredentials:
 
         return self.credentials.get(vk_const.LANG)
 
+    @property
+    def rate_limit(self) -> float:
+        assert self.credentials, 'required to set credentials with "VKCredentials.set(CRED_DATA)"'
+
+        return self.credentials.get(vk_const.RATE_LIMIT) or DEFAULT_RATE_LIMIT
+
+    @property
+    def rate_limiter(self) -> TokenBucket:
+        """
+        Ограничитель частоты запросов, общий для всех запросов с этим ключом доступа
+        """
+        return get_rate_limiter(self.access_token, self.rate_limit)
+
+    # Интерфейс выбора ключа для запроса, общий с VKTokenPool: единственный ключ используется всегда
+
+    is_pool = False
+
+    def acquire(self, exclude: Collection[ApiCredentials] = ()) -> ApiCredentials:
+        return self
+
+    def release(self, credentials: ApiCredentials) -> None:
+        pass
+
+    def suspend(self, credentials: ApiCredentials, seconds: float | None = None) -> None:
+        pass
+
+    def has_available(self, exclude: Collection[ApiCredentials] = ()) -> bool:
+        return self not in exclude
+
+
+class NoAvailableTokenError(Exception):
+    pass
+
+
+class VKTokenPool:
+    """
+    Набор ключей доступа, между которыми распределяются запросы.
+    Каждый запрос отправляется с наименее загруженным ключом: учитываются остаток токенов в его ограничителе
+    частоты и количество выполняющихся запросов. Ключи, получившие требование капчи или ошибку доступа,
+    временно исключаются из выбора
+    """
+
+    is_pool = True
+    suspend_time = 60  # время исключения ключа из выбора, сек
+
+    def __init__(
+        self,
+        credentials: Iterable[ApiCredentials | VKCredentialsData],
+        suspend_time: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.members = [c if isinstance(c, ApiCredentials) else ApiCredentials(**c) for c in credentials]
+        assert self.members, 'at least one credentials required'
+
+        self.suspend_time = suspend_time or self.suspend_time
+        self._clock = clock
+        self._in_flight = [0] * len(self.members)
+        self._suspended_until = [0.0] * len(self.members)
+        self._last_acquired = [0] * len(self.members)
+        self._acquired = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    # параметры запроса (версия API, язык) берутся у первого ключа набора
+
+    @property
+    def access_token(self) -> str:
+        return self.members[0].access_token
+
+    @property
+    def api_version(self) -> str:
+        return self.members[0].api_version
+
+    @property
+    def lang(self) -> str:
+        return self.members[0].lang
+
+    @property
+    def rate_limiter(self) -> TokenBucket:
+        return self.members[0].rate_limiter
+
+    def _candidates(self, exclude: Collection[ApiCredentials]) -> list[int]:
+        now = self._clock()
+        return [i for i, member in enumerate(self.members) if member not in exclude and self._suspended_until[i] <= now]
+
+    def has_available(self, exclude: Collection[ApiCredentials] = ()) -> bool:
+        with self._lock:
+            return bool(self._candidates(exclude))
+
+    def acquire(self, exclude: Collection[ApiCredentials] = ()) -> ApiCredentials:
+        """
+        Выбор наименее загруженного ключа. После выполнения запроса ключ возвращается через release()
+        """
+        with self._lock:
+            candidates = self._candidates(exclude)
+            if not candidates:
+                msg = f'all {len(self.members)} tokens are suspended or excluded'
+                raise NoAvailableTokenError(msg)
+
+            best = max(candidates, key=self._load_key)
+            self._in_flight[best] += 1
+            self._acquired += 1
+            self._last_acquired[best] = self._acquired
+            return self.members[best]
+
+    def _load_key(self, i: int) -> tuple[int, int]:
+        # запас запросов ключа с учётом выполняющихся, при равенстве - давно не использовавшийся
+        return math.floor(self.members[i].rate_limiter.available) - self._in_flight[i], -self._last_acquired[i]
+
+    def release(self, credentials: ApiCredentials) -> None:
+        with self._lock:
+            self._in_flight[self.members.index(credentials)] -= 1
+
+    def suspend(self, credentials: ApiCredentials, seconds: float | None = None) -> None:
+        """
+        Временное исключение ключа из выбора
+        """
+        log.info(f'token #{self.members.index(credentials)} suspended')
+
+        with self._lock:
+            self._suspended_until[self.members.index(credentials)] = self._clock() + (seconds or self.suspend_time)
+
 
 # singleton параметры доступа к vk api
 VKCredentials = ApiCredentials()
 
 
 class VK:
-    def __init__(self, **kwargs: VKCredentialsData) -> None:
-        self.credentials = ApiCredentials(**kwargs)
+    is_async = False
+
+    def __init__(
+        self,
+        http_config: HttpConfig | None = None,
+        token_pool: VKTokenPool | None = None,
+        cache: ResponseCache | None = None,
+        memo: ResponseMemo | None = None,
+        retry_policy: RetryPolicy | None = None,
+        json_decoder: str | JSONDecoder | None = None,
+        checkpoints: CheckpointStore | None = None,
+        source_mode: str = SOURCE_KEEP,
+        lazy: bool = False,
+        **kwargs: VKCredentialsData,
+    ) -> None:
+        """
+        :param http_config: настройки пула HTTP-соединений
+        :param token_pool: набор ключей доступа вместо единственного ключа из kwargs
+        :param cache: постоянный кеш ответов методов чтения
+        :param memo: кеш объектов VKResponse в памяти, общий для всех запросов экземпляра
+        :param retry_policy: политика повторов запросов
+        :param json_decoder: парсер ответов API: 'orjson', 'ujson', 'json' или функция от bytes,
+            по умолчанию самый быстрый из установленных
+        :param checkpoints: хранилище позиций постраничного получения для продолжения прерванных обходов
+        :param source_mode: хранение исходных данных объектов в моделях: 'keep' - словарь из ответа,
+            'drop' - не хранить, 'bytes' - сжатый JSON, разбираемый при вызове get_source_data()
+        :param lazy: поля данных моделей (vk_data) преобразуются из исходного словаря при первом обращении;
+            модель хранит исходный словарь независимо от source_mode
+        """
+        assert source_mode in SOURCE_MODES, f'unknown source mode {source_mode}'
+
+        self.credentials = token_pool or ApiCredentials(**kwargs)
+        self.http = HttpPool(http_config)
+        self.cache = cache
+        self.memo = memo
+        self.retry_policy = retry_policy
+        self.json_loads = get_json_decoder(json_decoder)
+        self.checkpoints = checkpoints
+        self.source_mode = source_mode
+        self.lazy = lazy
+        self.single_flight = SingleFlight()
+
+    def batch(self, max_calls: int | None = None, max_code_length: int | None = None) -> VKBatch:
+        """
+        Контекст пакетного выполнения запросов через метод execute
+        """
+        from .vk_batch import VKBatch
+
+        return VKBatch(self, max_calls=max_calls, max_code_length=max_code_length)
+
+    def close(self) -> None:
+        self.http.close()
+
+
+class AsyncVK(VK):
+    """
+    Асинхронный клиент: запросы, созданные с ним, выполняются через await
+    (await request.invoke(), async for photo in album.photos, await photo.download(...))
+    """
+
+    is_async = True
+
+    def __init__(
+        self,
+        http_config: HttpConfig | None = None,
+        token_pool: VKTokenPool | None = None,
+        cache: ResponseCache | None = None,
+        memo: ResponseMemo | None = None,
+        retry_policy: RetryPolicy | None = None,
+        json_decoder: str | JSONDecoder | None = None,
+        checkpoints: CheckpointStore | None = None,
+        source_mode: str = SOURCE_KEEP,
+        lazy: bool = False,
+        **kwargs: VKCredentialsData,
+    ) -> None:
+        super().__init__(
+            http_config,
+            token_pool,
+            cache,
+            memo,
+            retry_policy,
+            json_decoder,
+            checkpoints,
+            source_mode,
+            lazy,
+            **kwargs,
+        )
+        self.http = AsyncHttpPool(http_config)
+
+    def batch(self, max_calls: int | None = None, max_code_length: int | None = None) -> AsyncVKBatch:
+        """
+        Контекст пакетного выполнения запросов через метод execute (async with)
+        """
+        from .vk_batch import AsyncVKBatch
+
+        return AsyncVKBatch(self, max_calls=max_calls, max_code_length=max_code_length)
+
+    async def close(self) -> None:
+        await self.http.close()
+
+    async def __aenter__(self) -> AsyncVK:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import importlib
+import json
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecoder = Callable[[bytes], Any]
+
+# быстрые парсеры в порядке предпочтения, все принимают исходные байты ответа
+FAST_DECODERS = ('orjson', 'ujson')
+
+# хранение исходных данных объекта (VKObjectData.source) в моделях
+SOURCE_KEEP = 'keep'  # словарь из ответа API
+SOURCE_DROP = 'drop'  # не хранить, get_source_data() возвращает None
+SOURCE_BYTES = 'bytes'  # сжатый JSON (compress_json), разбирается при вызове get_source_data()
+SOURCE_MODES = (SOURCE_KEEP, SOURCE_DROP, SOURCE_BYTES)
+
+
+def get_json_decoder(name: str | JSONDecoder | None = None) -> JSONDecoder:
+    """
+    Функция разбора JSON-ответов API
+    :param name: 'orjson', 'ujson', 'json', готовая функция либо None - самый быстрый из установленных парсеров
+    """
+    if callable(name):
+        return name
+
+    if name == 'json':
+        return json.loads
+
+    for module_name in (name,) if name else FAST_DECODERS:
+        try:
+            return importlib.import_module(module_name).loads
+        except ImportError:
+            if name:
+                raise
+
+    return json.loads
+
+
+def encode_json(value: Any) -> bytes:
+    """
+    Компактное представление значения в JSON (orjson, если установлен)
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def compress_json(value: Any) -> bytes:
+    """
+    Сжатое представление значения в JSON для долгого хранения в памяти.
+    Ответы API сжимаются в 3-4 раза за счёт повторяющихся адресов размеров фотографий
+    """
+    return zlib.compress(encode_json(value), 1)
+
+
+def decompress_json(data: bytes, decoder: JSONDecoder | None = None) -> Any:
+    return (decoder or json.loads)(zlib.decompress(data))
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+READ_METHOD_PREFIXES = ('get', 'search', 'is', 'check')
+
+OFFSET_PAGINATION = 'offset'  # страницы задаются параметрами offset и count
+CURSOR_PAGINATION = 'cursor'  # следующая страница начинается с курсора из предыдущего ответа (start_from/next_from)
+
+
+@dataclass(frozen=True)
+class MethodInfo:
+    """
+    Сведения о методе API, которыми руководствуются постраничное получение, кеширование и ограничение частоты
+    """
+
+    name: str  # имя метода без группы, полное имя - после регистрации
+    max_count: int | None = None  # максимальное значение параметра count
+    max_ids: int | None = None  # максимальное количество идентификаторов в параметре ids_param
+    ids_param: str | None = None
+    idempotent: bool | None = None  # метод только читает данные; None - определяется по имени метода
+    ttl: float = 0  # время хранения ответа в кеше, сек; 0 - по умолчанию для кеша
+    cost: float = 1  # количество токенов ограничителя частоты, расходуемых вызовом
+    pagination: str = OFFSET_PAGINATION
+    cursor_param: str = 'start_from'  # параметр запроса, задающий начало страницы
+    next_cursor_field: str = 'next_from'  # поле ответа с курсором следующей страницы
+
+    def __post_init__(self) -> None:
+        assert self.pagination in (OFFSET_PAGINATION, CURSOR_PAGINATION), f'unknown pagination {self.pagination}'
+
+        if self.idempotent is None:
+            action = self.name.rpartition('.')[-1]
+            object.__setattr__(self, 'idempotent', action.startswith(READ_METHOD_PREFIXES))
+
+
+_methods: dict[str, MethodInfo] = {}
+_methods_lock = threading.Lock()
+
+
+def register_method(info: MethodInfo) -> MethodInfo:
+    with _methods_lock:
+        _methods[info.name] = info
+    return info
+
+
+# методы групп, для которых нет классов VKApi*
+register_method(MethodInfo('newsfeed.get', max_count=100, pagination=CURSOR_PAGINATION))
+register_method(MethodInfo('newsfeed.search', max_count=200, pagination=CURSOR_PAGINATION))
+register_method(MethodInfo('newsfeed.getComments', max_count=100, pagination=CURSOR_PAGINATION))
+
+
+def get_method_info(method_name: str) -> MethodInfo:
+    """
+    Сведения о зарегистрированном методе либо сведения по умолчанию, определяемые по имени метода
+    """
+    try:
+        return _methods[method_name]
+    except KeyError:
+        return MethodInfo(method_name)
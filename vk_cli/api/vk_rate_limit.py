@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """
+    Ограничение частоты запросов по алгоритму token bucket.
+    Токены восполняются со скоростью rate в секунду, но не более capacity.
+    Запрос резервирует токены заранее (баланс может уйти в минус), поэтому конкурирующие потоки
+    получают время ожидания в порядке обращения
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+        assert rate > 0, 'rate must be positive'
+
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(rate={self.rate}, capacity={self.capacity})'
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def available(self) -> float:
+        """
+        Количество доступных токенов (отрицательное, если есть ожидающие запросы)
+        """
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self, cost: float = 1) -> float:
+        """
+        Резервирование токенов
+        :return: время ожидания в секундах, по истечении которого запрос можно отправлять
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= cost
+            return max(0.0, -self._tokens / self.rate)
+
+    def try_acquire(self, cost: float = 1) -> bool:
+        """
+        Получение токенов без ожидания
+        :return: False, если токенов недостаточно
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < cost:
+                return False
+            self._tokens -= cost
+            return True
+
+    def acquire(self, cost: float = 1) -> None:
+        delay = self.reserve(cost)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, cost: float = 1) -> None:
+        delay = self.reserve(cost)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def drain(self) -> None:
+        """
+        Сброс накопленных токенов, например после ошибки API 'Too many requests per second'
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0)
+
+
+_limiters: dict[tuple[str | None, float], TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(access_token: str | None, rate: float) -> TokenBucket:
+    """
+    Ограничитель частоты запросов, общий для всех запросов с указанным ключом доступа и лимитом
+    """
+    with _limiters_lock:
+        try:
+            return _limiters[access_token, rate]
+        except KeyError:
+            limiter = _limiters[access_token, rate] = TokenBucket(rate)
+            return limiter
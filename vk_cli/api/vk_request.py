@@ -1,31 +1,40 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
-import requests
-
 from . import vk_const
 from .misc import get_model_class, timer
 from .vk_api_error import (
     VKApiErrorFactory,
+    VKEAccessError,
     VKECaptchaNeeded,
-    VKEInternal,
     VKETooFrequent,
     VKError,
 )
+from .vk_method_info import get_method_info
 from .vk_response import VKResponse
+from .vk_retry import RetryPolicy
 
 if TYPE_CHECKING:
-    from .vk_credentials import VK, VKCredentials
+    from .vk_credentials import VK, ApiCredentials, VKCredentials
+    from .vk_json import JSONDecoder
+    from .vk_method_info import MethodInfo
+    from .vk_retry import RetryState
 
 log = logging.getLogger(__name__)
 
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
 
 class VKRequest:
     URL_BASE = 'https://api.vk.com/method/'
-    attempts = 1  # By default, there is 1 attempt for loading
+    retry_policy: RetryPolicy | None = None  # политика повторов, по умолчанию VK.retry_policy
+    json_decoder: JSONDecoder | None = None  # парсер ответов, по умолчанию VK.json_loads
+    use_cache = True  # ответ сохраняется в VK.cache или сбрасывает связанные записи
 
     def __init__(self, vk: VK, method_name: str | None = None, parameters: dict | None = None, **pars) -> None:
         self._vk = vk
@@ -46,7 +55,9 @@ class VKRequest:
     def _init_from_request(self, request: VKRequest) -> None:
         from copy import deepcopy
 
-        self.__dict__.update(deepcopy(request.__dict__))
+        # экземпляр VK (и его пул соединений) и политика повторов (с общим бюджетом) общие для производных запросов
+        shared = (request._vk, request.__dict__.get('retry_policy'))
+        self.__dict__.update(deepcopy(request.__dict__, memo={id(value): value for value in shared}))
         assert self._vk is not None, f"is required to set 'vk' value for class '{self.__class__.__name__}'"
 
     def __str__(self) -> str:
@@ -70,6 +81,7 @@ class VKRequest:
 
     def set_param(self, param: str, value: Any) -> None:
         self.method_params[param] = value
+        self._method_params_prepared = None
 
     @property
     def _prepared_parameters(self) -> dict:
@@ -94,40 +106,225 @@ class VKRequest:
         filter out empty values, cast values to str
         :return:
         """
-        str_params = {}
-
-        for k, v in self._prepared_parameters.items():
-            if v is None:
-                continue
-
-            # cast params
-            if isinstance(v, bool):
-                str_params[k] = int(v)
-            elif isinstance(v, list | set):
-                str_params[k] = ','.join(map(str, v))
-            else:
-                str_params[k] = v
+        str_params = {k: self.cast_param(v) for k, v in self._prepared_parameters.items() if v is not None}
 
         return {k: str(v).encode('utf-8') for k, v in str_params.items()}
 
+    @staticmethod
+    def cast_param(value: Any) -> Any:
+        """
+        Приведение значения параметра к виду, принимаемому API
+        """
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, list | set):
+            return ','.join(map(str, value))
+        return value
+
     @property
     def url(self) -> str:
         return self.URL_BASE + self.method_name
 
-    def invoke(self):
+    @property
+    def fingerprint(self) -> str:
+        """
+        Канонический ключ запроса: имя метода и параметры без ключа доступа
+        """
+        params = {
+            k: self.cast_param(v)
+            for k, v in self._prepared_parameters.items()
+            if v is not None and k != vk_const.ACCESS_TOKEN
+        }
+        return f'{self.method_name}:{json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)}'
+
+    @property
+    def method_info(self) -> MethodInfo:
+        """
+        Сведения о методе из реестра (ограничения count и количества идентификаторов, кеширование, стоимость вызова)
+        """
+        return get_method_info(self.method_name)
+
+    @property
+    def is_idempotent(self) -> bool:
+        """
+        Метод только читает данные, его результат можно кешировать
+        """
+        return self.method_info.idempotent
+
+    def split_ids(self) -> list[VKRequest]:
+        """
+        Разбиение запроса на несколько, если количество идентификаторов превышает ограничение метода
+        """
+        info = self.method_info
+        ids = self.method_params.get(info.ids_param) if info.max_ids else None
+        if ids is None:
+            return [self]
+
+        if isinstance(ids, str):
+            ids = ids.split(',')
+        ids = list(ids)
+        if len(ids) <= info.max_ids:
+            return [self]
+
+        requests = []
+        for i in range(0, len(ids), info.max_ids):
+            request = VKRequest.from_request(self)
+            request.set_param(info.ids_param, ids[i : i + info.max_ids])
+            request.response = None
+            requests.append(request)
+        return requests
+
+    @property
+    def is_async(self) -> bool:
+        """
+        Запрос выполняется асинхронным клиентом (AsyncVK): методы invoke, invoked, invoke_response и
+        get_invoke_result возвращают корутины
+        """
+        return self._vk.is_async
+
+    def invoke(self, refresh: bool = False):
         """
         Выполнение запроса, формирование и сохранение результата
+        :param refresh: не использовать сохранённый в кеше ответ
         """
-        raw_result = self._do_invoke()
+        if self.is_async:
+            return self._invoke_async(refresh)
+
+        if not refresh and self._get_memoized():
+            return None
+
+        if self.is_idempotent:
+            # одинаковые одновременные запросы выполняются один раз
+            self.response = self._vk.single_flight.do(self.fingerprint, lambda: self._fetch_response(refresh))
+        else:
+            self.response = self._fetch_response(refresh)
+
+        self._memoize()
+        return None
+
+    async def _invoke_async(self, refresh: bool = False) -> None:
+        if not refresh and self._get_memoized():
+            return
+
+        if self.is_idempotent:
+            self.response = await self._vk.single_flight.do_async(
+                self.fingerprint,
+                lambda: self._fetch_response_async(refresh),
+            )
+        else:
+            self.response = await self._fetch_response_async(refresh)
+
+        self._memoize()
+
+    def _fetch_response(self, refresh: bool = False) -> VKResponse:
+        raw_result = self._invoke_cached(refresh)
         assert raw_result is not None
 
+        return VKResponse(self, raw_result)
+
+    async def _fetch_response_async(self, refresh: bool = False) -> VKResponse:
+        raw_result = await self._invoke_cached_async(refresh)
+        assert raw_result is not None
+
+        return VKResponse(self, raw_result)
+
+    def _get_memoized(self) -> bool:
+        """
+        Получение ответа из кеша в памяти VK.memo (если задан)
+        """
+        memo = self._vk.memo
+        if memo is None or not self.is_idempotent:
+            return False
+
+        self.response = memo.get(self)
+        return self.response is not None
+
+    def _memoize(self) -> None:
+        if self._vk.memo is not None and self.is_idempotent:
+            self._vk.memo.store(self, self.response)
+
+    def _invalidate_cached(self) -> None:
+        """
+        Сброс сохранённых ответов, которые могли устареть после изменяющего запроса
+        """
+        for store in (self._vk.cache, self._vk.memo):
+            if store is not None:
+                store.invalidate(self)
+
+    def _set_result(self, raw_result: Any) -> None:
+        """
+        Назначение результата, полученного без invoke (вызовом внутри execute), с той же обработкой кешей:
+        ответы методов чтения сохраняются, методы изменения данных сбрасывают связанные записи
+        """
         self.response = VKResponse(self, raw_result)
+        if self.response.error is not None or raw_result is False:  # ошибка вызова
+            return
+
+        if not self.is_idempotent:
+            self._invalidate_cached()
+            return
+
+        if self._vk.cache is not None:
+            self._vk.cache.store(self, raw_result)
+        self._memoize()
+
+    def _invoke_cached(self, refresh: bool = False):
+        """
+        Выполнение запроса с учётом кеша ответов VK.cache (если задан):
+        ответы методов чтения сохраняются, методы изменения данных сбрасывают связанные записи
+        """
+        if not self.use_cache:
+            return self._do_invoke()
+
+        if not self.is_idempotent:
+            raw_result = self._do_invoke()
+            self._invalidate_cached()
+            return raw_result
+
+        cache = self._vk.cache
+        if cache is None:
+            return self._do_invoke()
+
+        if not refresh and (raw_result := cache.get(self)) is not None:
+            return raw_result
+
+        raw_result = self._do_invoke()
+        cache.store(self, raw_result)
+        return raw_result
+
+    async def _invoke_cached_async(self, refresh: bool = False):
+        if not self.use_cache:
+            return await self._do_invoke_async()
+
+        if not self.is_idempotent:
+            raw_result = await self._do_invoke_async()
+            self._invalidate_cached()
+            return raw_result
+
+        cache = self._vk.cache
+        if cache is None:
+            return await self._do_invoke_async()
+
+        if not refresh and (raw_result := cache.get(self)) is not None:
+            return raw_result
+
+        raw_result = await self._do_invoke_async()
+        cache.store(self, raw_result)
+        return raw_result
 
     def invoked(self):
+        if self.is_async:
+            return self._invoked_async()
+
         if not self.is_invoked:
             self.invoke()
         return self
 
+    async def _invoked_async(self) -> VKRequest:
+        if not self.is_invoked:
+            await self._invoke_async()
+        return self
+
     @timer
     def _do_invoke(self):
         """
@@ -136,23 +333,27 @@ class VKRequest:
         log.debug('_do_invoke')
         log.info(f'* {self.method_name}: {self.method_params}')
 
+        pool = self._credentials
+        failed = []  # ключи, получившие ошибку доступа или капчу при выполнении этого запроса
+        retry = self.get_retry_policy().start()
+
         while True:
+            credentials = pool.acquire(exclude=failed)
             try:
-                resp = requests.post(self.url, data=self._str_prepared_parameters, timeout=5)
+                credentials.rate_limiter.acquire(self.method_info.cost)
+                resp = self._vk.http.post(
+                    self.url,
+                    data=self._post_data(credentials),
+                    timeout=retry.get_timeout(self._vk.http.config.timeout),
+                )
                 resp.raise_for_status()
-                json_resp = resp.json()
-                try:
-                    return json_resp['response']
-                except KeyError as e:
-                    raise VKApiErrorFactory.get_exception(json_resp.get('error') or json_resp) from e
-
-            except (VKETooFrequent, VKEInternal):
-                # если запросы отправляются слишком часто
-                log.info('sleep for 1 sec')
-
-                time.sleep(3)
+                result = self._extract_response(self.decode_json(resp.content))
 
             except VKECaptchaNeeded as e:
+                if pool.is_pool:
+                    self._on_token_error(credentials, e, failed)
+                    continue
+
                 # требуется ввод кода с картинки
                 sid, img = e.error['captcha_sid'], e.error['captcha_img']
 
@@ -162,19 +363,147 @@ class VKRequest:
 
                 return captha_r.invoke_response()
 
-            except VKError:
-                raise
+            except VKEAccessError as e:
+                if not pool.is_pool:
+                    raise
+                self._on_token_error(credentials, e, failed)
+
+            except Exception as e:
+                delay = self._on_error(credentials, retry, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+            else:
+                self._on_token_success(failed)
+                return result
+
+            finally:
+                pool.release(credentials)
+
+    async def _do_invoke_async(self):
+        """
+        Непосредственный вызов одного из методов API vk.com асинхронным клиентом
+        """
+        log.info(f'* {self.method_name}: {self.method_params}')
+
+        pool = self._credentials
+        failed = []  # ключи, получившие ошибку доступа или капчу при выполнении этого запроса
+        retry = self.get_retry_policy().start()
+
+        while True:
+            credentials = pool.acquire(exclude=failed)
+            try:
+                await credentials.rate_limiter.acquire_async(self.method_info.cost)
+                resp = await self._vk.http.post(
+                    self.url,
+                    data=self._post_data(credentials),
+                    timeout=retry.get_timeout(self._vk.http.config.timeout),
+                )
+                resp.raise_for_status()
+                result = self._extract_response(self.decode_json(resp.content))
+
+            except (VKEAccessError, VKECaptchaNeeded) as e:
+                if not pool.is_pool:
+                    raise
+                self._on_token_error(credentials, e, failed)
+
+            except Exception as e:
+                delay = self._on_error(credentials, retry, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+            else:
+                self._on_token_success(failed)
+                return result
+
+            finally:
+                pool.release(credentials)
+
+    def decode_json(self, content: bytes) -> Any:
+        """
+        Разбор тела ответа парсером, заданным для запроса или для экземпляра VK
+        """
+        return (self.json_decoder or self._vk.json_loads)(content)
+
+    def get_retry_policy(self) -> RetryPolicy:
+        """
+        Политика повторов: заданная для запроса, для экземпляра VK или политика по умолчанию
+        """
+        return self.retry_policy or self._vk.retry_policy or DEFAULT_RETRY_POLICY
+
+    @staticmethod
+    def _on_error(credentials: ApiCredentials, retry: RetryState, error: Exception) -> float | None:
+        """
+        Ошибка выполнения запроса: задержка перед повтором или None, если запрос не повторяется
+        """
+        if isinstance(error, VKETooFrequent):
+            # если запросы отправляются слишком часто, ждём восполнения токенов
+            credentials.rate_limiter.drain()
+
+        return retry.next_delay(error)
+
+    def _post_data(self, credentials: ApiCredentials) -> dict[str, bytes]:
+        """
+        Параметры запроса с ключом доступа, выбранным для текущей попытки
+        """
+        data = self._str_prepared_parameters
+        if credentials.access_token is not None:
+            data[vk_const.ACCESS_TOKEN] = credentials.access_token.encode('utf-8')
+        return data
+
+    def _on_token_error(self, credentials: ApiCredentials, error: VKError, failed: list[ApiCredentials]) -> None:
+        """
+        Ключ из набора получил капчу или ошибку доступа: запрос повторяется с другим ключом.
+        Капча относится к ключу, поэтому он сразу исключается из выбора
+        """
+        failed.append(credentials)
+
+        if isinstance(error, VKECaptchaNeeded):
+            self._credentials.suspend(credentials)
+
+        if not self._credentials.has_available(exclude=failed):
+            raise error
+
+        log.info(f'{error}, retry with another token')
+
+    def _on_token_success(self, failed: list[ApiCredentials]) -> None:
+        """
+        Запрос выполнен с другим ключом: ошибки доступа относились к ключам, а не к запрошенным данным
+        """
+        for credentials in failed:
+            self._credentials.suspend(credentials)
+
+    def _extract_response(self, json_resp: dict):
+        """
+        Получение результата из ответа API либо исключение с ошибкой
+        """
+        try:
+            return json_resp['response']
+        except KeyError as e:
+            raise VKApiErrorFactory.get_exception(json_resp.get('error') or json_resp) from e
 
     def invoke_response(self):
-        return self._do_invoke()
+        if self.is_async:
+            return self._invoke_cached_async()
+        return self._invoke_cached()
 
     def get_invoke_result(self, update=False) -> VKResponse:
         """
         Результат выполнения запроса
         :return:
         """
+        if self.is_async:
+            return self._get_invoke_result_async(update)
+
         if not self.is_invoked or update:
-            self.invoke()
+            self.invoke(refresh=update)
+        return self.response
+
+    async def _get_invoke_result_async(self, update=False) -> VKResponse:
+        if not self.is_invoked or update:
+            await self._invoke_async(refresh=update)
         return self.response
 
     def bind_model(self, model_class_name):
@@ -218,6 +547,19 @@ class PartialRequest(VKRequest):
         return f'{self.method_name}: {self.method_params} \ninvoked = {self.is_invoked}{res}'
 
 
+class CursorRequest(PartialRequest):
+    """
+    Страница выборки, начинающаяся с курсора из предыдущего ответа
+    """
+
+    def __init__(self, request, step, cursor) -> None:
+        super().__init__(request, step, 0)
+
+        self.cursor = cursor
+        self.set_param(self.method_info.cursor_param, cursor)
+        self.response = None
+
+
 class VKCapchaR(VKRequest):
     def __init__(self, sid, ig_url, method, params) -> None:
         super().__init__(method, params)
@@ -48,27 +48,34 @@ class VKResponse:
     def get_model_single(self) -> VKobject:
         return self.create_model_instance(self.single)
 
-    def model_generator(self) -> Iterator[VKobject]:
+    def model_generator(self, source_mode: str | None = None, lazy: bool | None = None) -> Iterator[VKobject]:
         for data in self._items:
             try:
-                yield self.create_model_instance(data)
+                yield self.create_model_instance(data, source_mode, lazy)
             except StopIteration:
                 return
 
     def ids_generator(self) -> Iterator[int]:
-        for id_item in self._items:
-            if not isinstance(id_item, int):
+        """
+        Идентификаторы объектов: элементы-числа или поле id элементов-объектов
+        """
+        for item in self._items:
+            if isinstance(item, dict):
+                item = item.get('id')
+            if not isinstance(item, int):
                 return
-            yield id_item
+            yield item
 
-    def create_model_instance(self, data: dict) -> VKobject:
+    def create_model_instance(self, data: dict, source_mode: str | None = None, lazy: bool | None = None) -> VKobject:
         """
         Создание экземпляра связанной модели на основе порции данных из полученного ответа
+        :param source_mode: хранение исходных данных в модели, по умолчанию - VK.source_mode
+        :param lazy: преобразование полей при первом обращении, по умолчанию - VK.lazy
         """
         if not isinstance(data, dict):
             raise StopIteration
 
-        return self.request.binded_model.from_data(vk=self.request._vk, data=data)
+        return self.request.binded_model.from_data(vk=self.request._vk, data=data, source_mode=source_mode, lazy=lazy)
 
     @property
     def array(self) -> list[VKobject]:
@@ -94,6 +101,22 @@ class VKResponse:
         except AttributeError:
             return self.count
 
+    @property
+    def has_total(self) -> bool:
+        """
+        Ответ содержит общее количество объектов (поле count)
+        """
+        return isinstance(self.raw_data, dict) and 'count' in self.raw_data
+
+    @property
+    def next_cursor(self) -> str | None:
+        """
+        Курсор следующей страницы для методов с постраничным получением по курсору (next_from)
+        """
+        if not isinstance(self.raw_data, dict):
+            return None
+        return self.raw_data.get(self.request.method_info.next_cursor_field) or None
+
     @property
     def count(self) -> int:
         """
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import requests
+
+from .vk_api_error import VKError
+from .vk_rate_limit import TokenBucket
+
+log = logging.getLogger(__name__)
+
+
+def default_retry_exceptions() -> tuple[type[BaseException], ...]:
+    """
+    Сетевые ошибки, после которых запрос повторяется
+    """
+    errors = [requests.ConnectionError, requests.Timeout]
+    try:
+        import httpx
+    except ImportError:
+        pass
+    else:
+        errors.append(httpx.TransportError)
+    return tuple(errors)
+
+
+class RetryBudget:
+    """
+    Общий лимит повторов: каждый запрос пополняет бюджет на ratio повтора, каждый повтор расходует один.
+    Дополнительно разрешено min_per_second повторов в секунду, чтобы редкие сбои повторялись всегда.
+    При массовых ошибках API количество повторов ограничено долей от количества запросов
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1, max_balance: float = 100) -> None:
+        self.ratio = ratio
+        self.max_balance = max_balance
+        self._balance = 0.0
+        self._reserve = TokenBucket(min_per_second)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance >= 1:
+                self._balance -= 1
+                return True
+        return self._reserve.try_acquire()
+
+
+# бюджет повторов, общий для процесса
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Политика повторов запроса: количество попыток, экспоненциальная задержка со случайным разбросом,
+    повторяемые ошибки, общий бюджет повторов и предельное время выполнения запроса
+    """
+
+    max_attempts: int = 5
+    backoff_base: float = 0.5  # задержка перед первым повтором, сек
+    backoff_multiplier: float = 2
+    backoff_max: float = 30
+    jitter: float = 1.0  # доля задержки, выбираемая случайно: 0 - без разброса, 1 - от 0 до полной задержки
+    deadline: float | None = 60  # предельное время выполнения запроса со всеми повторами, сек
+
+    retry_codes: frozenset[int] = frozenset({1, 6, 10})  # коды ошибок API: unknown, too many requests, internal
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})  # коды ответа HTTP
+    retry_exceptions: tuple[type[BaseException], ...] = field(default_factory=default_retry_exceptions)
+    budget: RetryBudget | None = DEFAULT_RETRY_BUDGET
+
+    def is_retryable(self, error: BaseException) -> bool:
+        if isinstance(error, VKError):
+            return error.code in self.retry_codes
+
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+        if status is not None:
+            return status in self.retry_statuses
+
+        return isinstance(error, self.retry_exceptions)
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Задержка перед повтором после неудачной попытки номер attempt
+        """
+        delay = min(self.backoff_max, self.backoff_base * self.backoff_multiplier ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())  # noqa: S311
+
+    def start(self, clock: Callable[[], float] = time.monotonic) -> RetryState:
+        if self.budget is not None:
+            self.budget.deposit()
+        return RetryState(self, clock)
+
+
+class RetryState:
+    """
+    Состояние повторов одного запроса
+    """
+
+    def __init__(self, policy: RetryPolicy, clock: Callable[[], float] = time.monotonic) -> None:
+        self.policy = policy
+        self.attempt = 1
+        self._clock = clock
+        self._deadline = clock() + policy.deadline if policy.deadline is not None else None
+
+    @property
+    def remaining(self) -> float | None:
+        """
+        Время до истечения предельного срока запроса, сек
+        """
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - self._clock())
+
+    def get_timeout(self, timeout: float) -> float:
+        """
+        Таймаут очередной попытки, не выходящий за предельный срок запроса
+        """
+        remaining = self.remaining
+        return timeout if remaining is None else max(0.001, min(timeout, remaining))
+
+    def next_delay(self, error: BaseException) -> float | None:
+        """
+        Задержка перед следующей попыткой или None, если повторять запрос не нужно
+        """
+        policy = self.policy
+
+        if not policy.is_retryable(error):
+            return None
+
+        if self.attempt >= policy.max_attempts:
+            log.info(f'{error}: no attempts left ({self.attempt})')
+            return None
+
+        delay = policy.get_delay(self.attempt)
+
+        remaining = self.remaining
+        if remaining is not None and delay >= remaining:
+            log.info(f'{error}: deadline exceeded')
+            return None
+
+        if policy.budget is not None and not policy.budget.withdraw():
+            log.info(f'{error}: retry budget exhausted')
+            return None
+
+        self.attempt += 1
+        log.info(f'{error}: retry #{self.attempt - 1} in {delay:.2f} sec')
+        return delay
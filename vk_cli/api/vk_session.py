@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    import httpx
+
+
+@dataclass
+class HttpConfig:
+    """
+    Настройки пула HTTP-соединений
+    """
+
+    pool_connections: int = 10  # количество хостов, для которых хранятся пулы соединений
+    pool_maxsize: int = 10  # максимальное количество соединений к одному хосту
+    pool_block: bool = False  # ждать освобождения соединения вместо открытия лишнего при исчерпании пула
+    keep_alive: bool = True  # переиспользовать соединения между запросами
+    timeout: float = 5  # таймаут запроса, сек
+
+
+class HttpPool:
+    """
+    Пул keep-alive соединений, общий для всех запросов одного экземпляра VK.
+    Сессия создаётся при первом обращении, после чего безопасно используется из разных потоков
+    """
+
+    def __init__(self, config: HttpConfig | None = None) -> None:
+        self.config = config or HttpConfig()
+        self._session: requests.Session | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        if not self.config.keep_alive:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    def post(self, url: str, data: dict, timeout: float | None = None) -> requests.Response:
+        return self.session.post(url, data=data, timeout=timeout or self.config.timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+class AsyncHttpPool:
+    """
+    Асинхронный пул keep-alive соединений для AsyncVK (требуется пакет httpx).
+    Клиент создаётся при первом запросе внутри работающего цикла событий
+    """
+
+    def __init__(self, config: HttpConfig | None = None) -> None:
+        self.config = config or HttpConfig()
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        try:
+            import httpx
+        except ImportError as e:
+            msg = 'AsyncVK requires httpx package, install it with "pip install vk-api-client[async]"'
+            raise ImportError(msg) from e
+
+        limits = httpx.Limits(
+            max_connections=self.config.pool_connections * self.config.pool_maxsize,
+            max_keepalive_connections=self.config.pool_maxsize if self.config.keep_alive else 0,
+        )
+        return httpx.AsyncClient(limits=limits, timeout=self.config.timeout)
+
+    async def post(self, url: str, data: dict, timeout: float | None = None) -> httpx.Response:
+        data = {k: v.decode('utf-8') if isinstance(v, bytes) else v for k, v in data.items()}
+        return await self.client.post(url, data=data, timeout=timeout or self.config.timeout)
+
+    async def get(self, url: str, timeout: float | None = None) -> httpx.Response:
+        return await self.client.get(url, timeout=timeout or self.config.timeout)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class _Call:
+    __slots__ = ['done', 'error', 'result']
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Объединение одинаковых одновременно выполняющихся вызовов: первый вызов с ключом выполняется,
+    остальные дожидаются его завершения и получают тот же результат или то же исключение
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._async_calls: dict[tuple[int, str], asyncio.Future] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+
+        future = self._async_calls.get(loop_key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = self._async_calls[loop_key] = loop.create_future()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # ожидающих может не быть, исключение считается полученным
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._async_calls[loop_key]
+
+    def __len__(self) -> int:
+        return len(self._calls) + len(self._async_calls)
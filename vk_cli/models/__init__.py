@@ -1,3 +1,4 @@
 from .lister import ModelLister
 from .photo import VKPhoto
 from .photo_album import VKPhotoAlbum
+from .photo_frame import PhotoFrame
@@ -1,13 +1,13 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class DataAttachmentPhoto:
     type: str
     photo: 'PhotoData'
 
 
-@dataclass
+@dataclass(slots=True)
 class DataAttachmentPost:
     type: str
     photo: 'PostData'
@@ -0,0 +1,410 @@
+"""
+Компиляция функций создания экземпляров классов данных из словарей JSON.
+Для каждой пары (класс данных, dacite.Config) один раз создаётся специализированная функция,
+повторяющая поведение dacite.from_dict (хуки типов, Optional, вложенные классы данных, списки,
+проверка типов), но без разбора аннотаций при создании каждого объекта.
+Если данные не соответствуют аннотациям, объект создаётся через dacite.from_dict,
+который и сообщает об ошибке
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import threading
+import types
+import typing
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import dacite
+
+T = TypeVar('T')
+
+SIMPLE_HOOKS = (int, bool, float, str)  # хуки вида {int: int}, результат которых не нужно проверять
+
+_decoders: dict[tuple[type, int], tuple[Callable, Callable, dacite.Config]] = {}
+_lazy_decoders: dict[tuple[type, int], tuple[Callable, dacite.Config]] = {}
+_decoders_lock = threading.RLock()
+
+
+class DecodeMismatchError(Exception):
+    """
+    Данные не соответствуют аннотации поля
+    """
+
+
+class _UnsupportedTypeError(Exception):
+    """
+    Аннотация, для которой функция не компилируется: класс создаётся через dacite.from_dict
+    """
+
+
+def _mismatch() -> Any:
+    raise DecodeMismatchError
+
+
+def _checked(value: Any, type_: type) -> Any:
+    if isinstance(value, type_):
+        return value
+    raise DecodeMismatchError
+
+
+def _is_union(type_: Any) -> bool:
+    return typing.get_origin(type_) is typing.Union or isinstance(type_, types.UnionType)
+
+
+def get_decoder(data_class: type[T], config: dacite.Config | None = None) -> Callable[[dict], T]:
+    """
+    Функция создания экземпляра класса данных из словаря, эквивалентная dacite.from_dict(data_class, data, config)
+    """
+    return _get_decoders(data_class, config or dacite.Config())[1]
+
+
+def from_dict(data_class: type[T], data: dict, config: dacite.Config | None = None) -> T:
+    return get_decoder(data_class, config)(data)
+
+
+def _get_decoders(data_class: type, config: dacite.Config) -> tuple[Callable, Callable]:
+    """
+    Пара функций: быстрая, которая при несоответствии данных выбрасывает DecodeMismatchError,
+    и итоговая, которая в этом случае повторяет создание объекта через dacite
+    """
+    key = (data_class, id(config))
+    try:
+        fast, decoder, _ = _decoders[key]
+    except KeyError:
+        pass
+    else:
+        return fast, decoder
+
+    with _decoders_lock:
+        if key not in _decoders:
+            fallback = functools.partial(dacite.from_dict, data_class, config=config)
+            # на время компиляции - для классов, ссылающихся на себя
+            _decoders[key] = (lambda data: _decoders[key][0](data), fallback, config)
+            try:
+                fast = _DecoderCompiler(config).compile(data_class)
+            except _UnsupportedTypeError:
+                _decoders[key] = (fallback, fallback, config)
+            except BaseException:
+                del _decoders[key]
+                raise
+            else:
+                _decoders[key] = (fast, _with_fallback(fast, fallback), config)
+
+        fast, decoder, _ = _decoders[key]
+        return fast, decoder
+
+
+def _with_fallback(fast: Callable, fallback: Callable) -> Callable:
+    def decoder(data: dict) -> Any:
+        try:
+            return fast(data)
+        except Exception:  # noqa: BLE001
+            return fallback(data)
+
+    return decoder
+
+
+class _DecoderCompiler:
+    """
+    Генерация исходного кода функции создания экземпляра класса данных
+    """
+
+    def __init__(self, config: dacite.Config, lazy: bool = False) -> None:
+        """
+        :param lazy: вложенные классы данных создаются ленивыми (get_lazy_decoder)
+        """
+        self.config = config
+        self.lazy = lazy
+        self.namespace: dict[str, Any] = {'_mismatch': _mismatch, '_checked': _checked}
+        self.depth = 0
+
+    def fields(self, data_class: type) -> list[tuple[dataclasses.Field, Any]]:
+        """
+        Поля класса данных и их типы
+        """
+        config = self.config
+        if not config.check_types or config.strict or config.strict_unions_match or config.cast:
+            raise _UnsupportedTypeError
+        if getattr(data_class, '__parameters__', None):
+            raise _UnsupportedTypeError
+
+        try:
+            hints = typing.get_type_hints(data_class, localns=config.forward_references)
+        except Exception as e:  # noqa: BLE001
+            raise _UnsupportedTypeError from e
+
+        fields = dataclasses.fields(data_class)
+        if any(not f.init for f in fields) or any(isinstance(hint, dataclasses.InitVar) for hint in hints.values()):
+            raise _UnsupportedTypeError
+
+        return [(field, hints[field.name]) for field in fields]
+
+    def field_lines(self, field: dataclasses.Field, type_: Any, target: str) -> list[str]:
+        """
+        Строки кода, присваивающие значение поля переменной target (либо возвращающие его, если target = 'return')
+        """
+        key = self.config.convert_key(field.name)
+        assign = 'return ' if target == 'return' else f'{target} = '
+        return [
+            f'    if {key!r} in data:',
+            f'        v = data[{key!r}]',
+            f'        {assign}{self.expr(type_, "v")}',
+            '    else:',
+            f'        {assign}{self.default(field, type_)}',
+        ]
+
+    def compile(self, data_class: type) -> Callable:
+        fields = self.fields(data_class)
+
+        lines = ['def decode(data):']
+        for n, (field, type_) in enumerate(fields):
+            lines += self.field_lines(field, type_, f'f{n}')
+        args = ', '.join(f'{field.name}=f{n}' for n, (field, _) in enumerate(fields))
+        lines.append(f'    return {self.add(data_class)}({args})')
+
+        exec('\n'.join(lines), self.namespace)  # noqa: S102
+        decode = self.namespace.pop('decode')
+        decode.__qualname__ = decode.__name__ = f'decode_{data_class.__name__}'
+        return decode
+
+    def compile_fields(self, data_class: type) -> dict[str, Callable]:
+        """
+        Отдельные функции получения значения каждого поля из словаря - для ленивых классов данных
+        """
+        getters = {}
+        for field, type_ in self.fields(data_class):
+            exec('\n'.join(['def get(data):', *self.field_lines(field, type_, 'return')]), self.namespace)  # noqa: S102
+            getters[field.name] = self.namespace.pop('get')
+            getters[field.name].__qualname__ = f'get_{data_class.__name__}_{field.name}'
+        return getters
+
+    def add(self, value: Any) -> str:
+        """
+        Имя объекта в пространстве имён создаваемой функции
+        """
+        name = f'_n{len(self.namespace)}'
+        self.namespace[name] = value
+        return name
+
+    def default(self, field: dataclasses.Field, type_: Any) -> str:
+        if field.default is not dataclasses.MISSING:
+            return self.add(field.default)
+        if field.default_factory is not dataclasses.MISSING:
+            return f'{self.add(field.default_factory)}()'
+        if _is_union(type_) and type(None) in typing.get_args(type_):
+            return 'None'
+        return '_mismatch()'
+
+    def function(self, type_: Any, hooked: bool = True) -> Callable:
+        """
+        Отдельная функция преобразования значения - для членов объединений типов и значений после хуков
+        """
+        compiler = _DecoderCompiler(self.config, self.lazy)
+        compiler.namespace = self.namespace
+        expr = compiler.expr(type_, 'v') if hooked else compiler.expr_unhooked(type_, 'v')
+        exec(f'def convert(v):\n    return {expr}', self.namespace)  # noqa: S102
+        return self.namespace.pop('convert')
+
+    def expr(self, type_: Any, var: str) -> str:
+        """
+        Выражение, преобразующее значение переменной var к типу type_ так же, как dacite._build_value
+        """
+        hooks = self.config.type_hooks
+        if type_ in hooks:
+            hook = hooks[type_]
+            if hook is type_ and type_ in SIMPLE_HOOKS:
+                return f'{type_.__name__}({var})'
+
+            convert = self.function(type_, hooked=False)
+            return f'{self.add(convert)}({self.add(hook)}({var}))'
+
+        return self.expr_unhooked(type_, var)
+
+    def expr_unhooked(self, type_: Any, var: str) -> str:
+        if type_ is Any:
+            return var
+
+        if _is_union(type_):
+            args = typing.get_args(type_)
+            if type(None) in args:
+                if len(args) == 2:  # noqa: PLR2004
+                    return f'(None if {var} is None else {self.expr(args[0], var)})'
+                return f'(None if {var} is None else {self.union(args, var)})'
+            return self.union(args, var)
+
+        origin = typing.get_origin(type_)
+        if origin is list:
+            (item_type,) = typing.get_args(type_) or (Any,)
+            self.depth += 1
+            item = f'x{self.depth}'
+            expr = f'([{self.expr(item_type, item)} for {item} in {var}] if type({var}) is list else _mismatch())'
+            self.depth -= 1
+            return expr
+
+        if origin is not None or not isinstance(type_, type):
+            raise _UnsupportedTypeError
+
+        if dataclasses.is_dataclass(type_):
+            fast = get_lazy_decoder(type_, self.config) if self.lazy else _get_decoders(type_, self.config)[0]
+            return f'({self.add(fast)}({var}) if type({var}) is dict else _checked({var}, {self.add(type_)}))'
+
+        return f'_checked({var}, {self.add(type_)})'
+
+    def union(self, args: tuple, var: str) -> str:
+        converters = tuple(self.function(arg) for arg in args if arg is not type(None))
+
+        def convert(value: Any) -> Any:
+            for converter in converters:
+                try:
+                    return converter(value)
+                except Exception:  # noqa: BLE001, PERF203, S112
+                    continue
+            raise DecodeMismatchError
+
+        return f'{self.add(convert)}({var})'
+
+
+def get_lazy_decoder(data_class: type[T], config: dacite.Config | None = None) -> Callable[..., T]:
+    """
+    Функция создания экземпляра класса данных, поля которого преобразуются из исходного словаря
+    при первом обращении и сохраняются; значения, переданные в именованных аргументах, задаются сразу.
+    Для классов без __slots__ и классов, функции которых не компилируются, создаётся обычный экземпляр
+    """
+    config = config or dacite.Config()
+    key = (data_class, id(config))
+    try:
+        return _lazy_decoders[key][0]
+    except KeyError:
+        pass
+
+    with _decoders_lock:
+        if key not in _lazy_decoders:
+            # на время создания - для классов, ссылающихся на себя
+            _lazy_decoders[key] = (lambda data, **values: _lazy_decoders[key][0](data, **values), config)
+            try:
+                _lazy_decoders[key] = (_make_lazy_decoder(data_class, config), config)
+            except BaseException:
+                del _lazy_decoders[key]
+                raise
+        return _lazy_decoders[key][0]
+
+
+class _LazyField:
+    """
+    Поле ленивого класса данных: значение хранится в слоте поля исходного класса
+    """
+
+    __slots__ = ('fallback', 'getter', 'slot')
+
+    def __init__(self, slot: types.MemberDescriptorType, getter: Callable, fallback: Callable) -> None:
+        self.slot = slot
+        self.getter = getter
+        self.fallback = fallback
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+
+        try:
+            value = self.getter(instance._raw)  # noqa: SLF001
+        except Exception:  # noqa: BLE001
+            value = self.fallback(instance._raw)  # noqa: SLF001
+
+        self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        self.slot.__delete__(instance)
+
+
+def _make_lazy_decoder(data_class: type, config: dacite.Config) -> Callable:
+    decoder = get_decoder(data_class, config)
+
+    def eager(data: dict, **values: Any) -> Any:
+        return decoder({**data, **values})
+
+    compiler = _DecoderCompiler(config, lazy=True)
+    try:
+        fields = compiler.fields(data_class)
+        getters = compiler.compile_fields(data_class)
+    except _UnsupportedTypeError:
+        return eager
+
+    slots = {field.name: getattr(data_class, field.name, None) for field, _ in fields}
+    if not all(isinstance(slot, types.MemberDescriptorType) for slot in slots.values()):
+        return eager
+
+    names = tuple(slots)
+
+    def __eq__(self: Any, other: object) -> bool:  # noqa: N807
+        if type(other) not in (data_class, lazy_class):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in names)
+
+    def __reduce__(self: Any) -> tuple:  # noqa: N807
+        # восстанавливается обычный экземпляр исходного класса: ленивый класс не импортируется по имени
+        return _restore, (data_class, {name: getattr(self, name) for name in names})
+
+    namespace = {
+        '__slots__': ('_raw',),
+        '__eq__': __eq__,
+        '__reduce__': __reduce__,
+        '__module__': data_class.__module__,
+        '__qualname__': data_class.__qualname__,
+    }
+    for field, type_ in fields:
+        fallback = _field_fallback(field, type_, config)
+        namespace[field.name] = _LazyField(slots[field.name], getters[field.name], fallback)
+    lazy_class = type(data_class.__name__, (data_class,), namespace)
+
+    new = object.__new__
+    set_raw = lazy_class._raw.__set__  # noqa: SLF001
+
+    def decode(data: dict, **values: Any) -> Any:
+        instance = new(lazy_class)
+        set_raw(instance, data)
+        if values:
+            for name, value in values.items():
+                setattr(instance, name, value)
+        return instance
+
+    return decode
+
+
+def _restore(data_class: type, values: dict[str, Any]) -> Any:
+    """
+    Экземпляр класса данных с заданными значениями полей, без вызова __init__ (распаковка ленивых экземпляров)
+    """
+    instance = object.__new__(data_class)
+    for name, value in values.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def _field_fallback(field: dataclasses.Field, type_: Any, config: dacite.Config) -> Callable:
+    """
+    Преобразование значения одного поля через dacite - для данных, не соответствующих аннотации
+    """
+    kwargs = {}
+    if field.default is not dataclasses.MISSING:
+        kwargs['default'] = field.default
+    if field.default_factory is not dataclasses.MISSING:
+        kwargs['default_factory'] = field.default_factory
+    single = dataclasses.make_dataclass(field.name, [(field.name, type_, dataclasses.field(**kwargs))])
+    key = config.convert_key(field.name)
+
+    def fallback(data: dict) -> Any:
+        return getattr(dacite.from_dict(single, {key: data[key]} if key in data else {}, config), field.name)
+
+    return fallback
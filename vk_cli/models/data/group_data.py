@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from vk_cli.models.data.vk_object_data import VKObjectData
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupData(VKObjectData):
     # 1. Базовые поля
     name: str  # название сообщества.
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from .vk_object_data import VKOwnedObjectData
 
 
-@dataclass
+@dataclass(slots=True)
 class PhotoAlbumData(VKOwnedObjectData):
     """ """
 
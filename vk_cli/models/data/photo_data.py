@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from .vk_object_data import VKOwnedObjectData
 
 
-@dataclass
+@dataclass(slots=True)
 class PhotoSize:
     type: str
     url: str
@@ -12,7 +12,7 @@ class PhotoSize:
     height: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PhotoData(VKOwnedObjectData):
     album_id: int  # идентификатор альбома, в котором находится фотография.
     user_id: int | None  # идентификатор пользователя, загрузившего фото (если фотография размещена в сообществе).
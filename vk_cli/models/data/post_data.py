@@ -5,7 +5,7 @@ from vk_cli.models.data.attachents import DataAttachmentPhoto
 from vk_cli.models.data.vk_object_data import VKOwnedObjectData
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataComments:
     count: int  # количество комментариев;
     can_post: bool = (
@@ -16,7 +16,7 @@ class PostDataComments:
     can_open: bool = False  # может ли текущий пользователь открыть комментарии к записи.
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataLikes:
     count: int  # число пользователей, которым понравилась запись;
     user_likes: bool  # наличие отметки «Мне нравится» от текущего пользователя (1 — есть, 0 — нет);
@@ -26,18 +26,18 @@ class PostDataLikes:
     # информация о том, может ли текущий пользователь сделать репост записи (1 — может, 0 — не может).
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataReposts:
     count: int  # число пользователей, скопировавших запись;
     user_reposted: bool  # наличие репоста от текущего пользователя (1 — есть, 0 — нет).
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataviews:
     count: int  # число просмотров записи.
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataSource:
     """
     https://vk.com/dev/objects/post_source
@@ -49,14 +49,14 @@ class PostDataSource:
     url: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class PostDataGeo:
     type: str  # тип места;
     coordinates: str  # координаты места;
     place: dict  # описание места (если оно добавлено). Объект места.
 
 
-@dataclass
+@dataclass(slots=True)
 class PostData(VKOwnedObjectData):
     id: int  # идентификатор записи.
     owner_id: int | None  # идентификатор владельца стены, на которой размещена запись.
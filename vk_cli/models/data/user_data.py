@@ -161,13 +161,13 @@ class UserFields:
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class LastSeen:
     time: datetime.datetime
     platform: int
 
 
-@dataclass
+@dataclass(slots=True)
 class UserDataActivity(VKObjectData):
     # activity
     online: bool  # информация о том, находится ли пользователь сейчас на сайте.
@@ -176,7 +176,7 @@ class UserDataActivity(VKObjectData):
     online_mobile: bool | None = False  # пользователь использует мобильное приложение либо мобильную версию
 
 
-@dataclass
+@dataclass(slots=True)
 class UserData(VKObjectData):
     # personal
     first_name: str  # имя
@@ -4,10 +4,10 @@ from dataclasses import dataclass
 from dacite import Config
 
 
-@dataclass
+@dataclass(slots=True)
 class VKObjectData:
     id: int | None  # идентификатор объекта
-    source: dict
+    source: dict | bytes | None  # исходные данные объекта, см. VK.source_mode
 
     class Meta:
         config = Config(
@@ -19,6 +19,6 @@ class VKObjectData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VKOwnedObjectData(VKObjectData):
     owner_id: int  # идентификатор владельца объекта
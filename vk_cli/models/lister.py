@@ -1,4 +1,19 @@
-from vk_cli.api.vk_request import PartialRequest
+import asyncio
+import datetime
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from vk_cli.api.vk_batch import VKBatch, VKExecuteRequest, execute_requests
+from vk_cli.api.vk_method_info import CURSOR_PAGINATION
+from vk_cli.api.vk_request import CursorRequest, PartialRequest, VKRequest
+from vk_cli.models.photo_frame import PhotoFrame
+
+
+DEFAULT_STEP = 200  # для методов без указанного в реестре ограничения count
+
+# параметры, добавляющие в ответ необязательные поля; при получении только идентификаторов не передаются
+IDS_ONLY_EXCLUDED_PARAMS = ('extended', 'photo_sizes', 'fields', 'need_covers', 'need_likes')
 
 
 class ModelLister:
@@ -7,47 +22,412 @@ class ModelLister:
     параметров offset и count
     """
 
-    def __init__(self, request, step=200) -> None:
+    def __init__(
+        self,
+        request,
+        step=None,
+        concurrency=1,
+        pages_per_call=1,
+        resume=False,
+        stream=False,
+        source_mode=None,
+        lazy=None,
+    ) -> None:
+        """
+        :param step: количество объектов в одном запросе, по умолчанию - максимально допустимое для метода
+        :param concurrency: количество одновременно выполняемых HTTP-запросов
+        :param pages_per_call: количество страниц, получаемых одним вызовом execute (до 25)
+        :param resume: продолжить прерванный обход с позиции, сохранённой в VK.checkpoints,
+            и сохранять в нём позицию после каждой страницы
+        :param stream: не хранить полученные страницы: после обработки ответ страницы освобождается,
+            память ограничена несколькими страницами, повторный обход выполняет запросы заново
+        :param source_mode: хранение исходных данных объектов в моделях ('keep', 'drop', 'bytes'),
+            по умолчанию - VK.source_mode
+        :param lazy: преобразовывать поля данных моделей при первом обращении, по умолчанию - VK.lazy
+        """
         assert request.is_binded
 
-        self.partial_generator = PartialRequestsGenerator(request, step)
+        self.source_mode = source_mode
+        self.lazy = lazy
+
+        step = step or request.method_info.max_count or DEFAULT_STEP
+        self.partial_generator = PartialRequestsGenerator(
+            request,
+            step,
+            concurrency,
+            pages_per_call,
+            resume,
+            stream,
+        )
 
     def __iter__(self):
         # get all Models from associated partial requests
         for partial_request in self.partial_generator:
             response = partial_request.get_invoke_result()
-            yield from response.model_generator()
+            yield from response.model_generator(self.source_mode, self.lazy)
+
+    async def __aiter__(self):
+        # асинхронный проход для запросов, созданных с AsyncVK
+        async for partial_request in self.partial_generator:
+            for model in partial_request.response.model_generator(self.source_mode, self.lazy):
+                yield model
 
     @property
     def ids_generator(self):
+        return self.ids()
+
+    def ids(self):
+        """
+        Идентификаторы объектов без создания экземпляров модели.
+        Запросы страниц выполняются без параметров, добавляющих в ответ необязательные поля (IDS_ONLY_EXCLUDED_PARAMS).
+        Для запросов, созданных с AsyncVK, возвращает асинхронный итератор
+        """
+        generator = self.partial_generator
+        request = _ids_only(generator.request)
+        pages = PartialRequestsGenerator(
+            request,
+            generator.step,
+            generator.concurrency,
+            generator.pages_per_call,
+            stream=True,
+        )
+        if request.is_async:
+            return self._ids_async(pages)
+        return self._ids(pages)
+
+    @staticmethod
+    def _ids(pages):
+        for partial_request in pages:
+            yield from partial_request.response.ids_generator()
+
+    @staticmethod
+    async def _ids_async(pages):
+        async for partial_request in pages:
+            for object_id in partial_request.response.ids_generator():
+                yield object_id
+
+    def frames(self):
+        """
+        Страницы выборки фотографий в колоночном представлении (PhotoFrame) без создания экземпляров модели.
+        Для запросов, созданных с AsyncVK, возвращает асинхронный итератор
+        """
+        if self.partial_generator.request.is_async:
+            return self._frames_async()
+        return self._frames()
+
+    def _frames(self):
         for partial_request in self.partial_generator:
-            response = partial_request.get_invoke_result()
-            yield from response.ids_generator()
+            yield PhotoFrame.from_items(partial_request.response.array)
+
+    async def _frames_async(self):
+        async for partial_request in self.partial_generator:
+            yield PhotoFrame.from_items(partial_request.response.array)
+
+    def frame(self):
+        """
+        Вся выборка фотографий в колоночном представлении (PhotoFrame).
+        Для запросов, созданных с AsyncVK, возвращает корутину
+        """
+        if self.partial_generator.request.is_async:
+            return self._frame_async()
+
+        frame = PhotoFrame()
+        for partial_request in self.partial_generator:
+            frame.extend(partial_request.response.array)
+        return frame
+
+    async def _frame_async(self):
+        frame = PhotoFrame()
+        async for partial_request in self.partial_generator:
+            frame.extend(partial_request.response.array)
+        return frame
 
     @property
     def count(self):
+        """
+        Общее количество объектов. Если страницы ещё не запрашивались, запрашивается один объект.
+        Для запросов, созданных с AsyncVK, возвращает корутину
+        """
+        if self.partial_generator.request.is_async:
+            return self.partial_generator.get_total_async()
         return self.partial_generator.total
 
+    @staticmethod
+    def count_many(requests):
+        """
+        Общее количество объектов для каждого из запросов (None, если запрос завершился ошибкой).
+        Запросы выполняются по 25 в одном вызове execute, из ответа на сервере извлекается только поле count.
+        Для запросов, созданных с AsyncVK, возвращает корутину
+        """
+        requests = list(requests)
+        if requests and requests[0].is_async:
+            return _count_many_async(requests)
+
+        counts = []
+        for execute in _count_executes(requests):
+            counts.extend(_counts(execute.invoke_response()))
+        return counts
+
+    def __getitem__(self, index):
+        """
+        Объект по номеру или список объектов среза. Запрашиваются только страницы, покрывающие нужные номера;
+        общее количество запрашивается только для отрицательных номеров и срезов без конца.
+        Для запросов, созданных с AsyncVK, возвращает корутину
+        """
+        if self.partial_generator.request.is_async:
+            return self._getitem_async(index)
+
+        positions = _positions(index, self.count if _needs_total(index) else None)
+        requests = self.partial_generator.fetch_range(positions) if positions else []
+        return _select(index, positions, requests, self.source_mode, self.lazy)
+
+    async def _getitem_async(self, index):
+        total = await self.partial_generator.get_total_async() if _needs_total(index) else None
+        positions = _positions(index, total)
+
+        requests = []
+        if positions:
+            requests = await self.partial_generator.fetch_range_async(positions)
+        return _select(index, positions, requests, self.source_mode, self.lazy)
+
+    def between(self, start, end, field='date', reverse=None):
+        """
+        Объекты, у которых значение поля field (по умолчанию дата) находится в диапазоне start <= value < end.
+        Выборка должна быть упорядочена по этому полю: по возрастанию или, если в запросе задан rev, по убыванию.
+        Границы диапазона находятся двоичным поиском по смещениям запросами одного объекта,
+        затем запрашиваются только страницы внутри диапазона.
+        Для запросов, созданных с AsyncVK, возвращает корутину
+        :param start: начало диапазона, datetime или число (unixtime для дат)
+        :param end: конец диапазона, не включается
+        :param reverse: выборка упорядочена по убыванию, по умолчанию - по параметру rev запроса
+        """
+        request = self.partial_generator.request
+        if reverse is None:
+            reverse = bool(request.cast_param(request.method_params.get('rev')))
+
+        # значения в начале выборки, до первого объекта внутри диапазона и до первого объекта после него
+        bounds = _timestamp(end if reverse else start), _timestamp(start if reverse else end)
+
+        def is_before(value, bound):
+            if value is None:
+                return False
+            return value >= bound if reverse else value < bound
+
+        if request.is_async:
+            return self._between_async(field, bounds, is_before)
+
+        total = self.count
+        probe = functools.cache(lambda offset: self._probe(offset, field))
+        first = _bisect(total, probe, lambda value: is_before(value, bounds[0]))
+        last = _bisect(total, probe, lambda value: is_before(value, bounds[1]))
+        return self[first:last]
+
+    async def _between_async(self, field, bounds, is_before):
+        total = await self.partial_generator.get_total_async()
+        probes = {}
+
+        async def probe(offset):
+            if offset not in probes:
+                probes[offset] = await self._probe_async(offset, field)
+            return probes[offset]
+
+        first = await _bisect_async(total, probe, lambda value: is_before(value, bounds[0]))
+        last = await _bisect_async(total, probe, lambda value: is_before(value, bounds[1]))
+        return await self[first:last]
+
+    def _probe(self, offset, field):
+        """
+        Значение поля объекта с номером offset
+        """
+        response = PartialRequest(self.partial_generator.request, 1, offset).get_invoke_result()
+        return response.array[0].get(field) if response.count else None
+
+    async def _probe_async(self, offset, field):
+        response = await PartialRequest(self.partial_generator.request, 1, offset).get_invoke_result()
+        return response.array[0].get(field) if response.count else None
+
+    def take(self, n):
+        """
+        Первые n объектов
+        """
+        return self[:n]
+
+    def skip(self, n):
+        """
+        Объекты, начиная с n-го
+        """
+        return self[n:]
+
+    def last(self, n):
+        """
+        Последние n объектов
+        """
+        return self[-n:] if n > 0 else self[0:0]
+
     def __str__(self):
-        return (
-            f'[{self.partial_generator.request.binded_model.__name__}] {self.count} items '
-            f'({self.count // self.partial_generator.step} pages by {self.partial_generator.step})'
-        )
+        generator = self.partial_generator
+        name = generator.request.binded_model.__name__
+        # для AsyncVK количество выводится, только если уже получено: строка не может выполнять запрос
+        count = generator._total if generator.request.is_async else self.count
+        if count is None:
+            return f'[{name}] pages by {generator.step}'
+        return f'[{name}] {count} items ({count // generator.step} pages by {generator.step})'
+
+
+def _ids_only(request):
+    """
+    Копия запроса без параметров, добавляющих в ответ необязательные поля (IDS_ONLY_EXCLUDED_PARAMS)
+    """
+    request = VKRequest.from_request(request)
+    for param in IDS_ONLY_EXCLUDED_PARAMS:
+        request.set_param(param, None)
+    request.response = None
+    return request
+
+
+def _count_executes(requests):
+    """
+    Вызовы execute, возвращающие только поле count ответов на запросы с count=1
+    """
+    for i in range(0, len(requests), VKBatch.max_calls):
+        chunk = requests[i : i + VKBatch.max_calls]
+        calls = [f'{VKBatch.vkscript_call(PartialRequest(request, 1, 0))}.count' for request in chunk]
+        yield VKExecuteRequest.from_calls(chunk[0]._vk, calls)
+
+
+def _counts(results):
+    return [result if isinstance(result, int) and not isinstance(result, bool) else None for result in results]
+
+
+async def _count_many_async(requests):
+    counts = []
+    for execute in _count_executes(requests):
+        counts.extend(_counts(await execute.invoke_response()))
+    return counts
+
+
+def _timestamp(value):
+    return value.timestamp() if isinstance(value, datetime.datetime) else value
+
+
+def _bisect(n, probe, is_before):
+    """
+    Номер первого объекта, значение которого не удовлетворяет is_before (is_before истинно для начала выборки)
+    """
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if is_before(probe(mid)):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+async def _bisect_async(n, probe, is_before):
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if is_before(await probe(mid)):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _needs_total(index):
+    """
+    Для вычисления номеров объектов по индексу или срезу требуется общее количество
+    """
+    if isinstance(index, int):
+        return index < 0
+    if not isinstance(index, slice):
+        return False
+    return index.stop is None or index.stop < 0 or (index.start or 0) < 0 or (index.step or 1) < 0
+
+
+def _positions(index, total):
+    """
+    Номера объектов, соответствующие индексу или срезу
+    """
+    if isinstance(index, int):
+        if index < 0:
+            index += total
+        return range(index, index + 1) if index >= 0 else range(0)
+
+    if not isinstance(index, slice):
+        msg = f'ModelLister indices must be integers or slices, not {type(index).__name__}'
+        raise TypeError(msg)
+
+    if total is not None:
+        return range(*index.indices(total))
+    return range(index.start or 0, index.stop, index.step or 1)
+
+
+def _select(index, positions, requests, source_mode=None, lazy=None):
+    """
+    Объекты с номерами positions из ответов на запросы страниц, покрывающих эти номера.
+    Модели создаются только для выбранных объектов
+    """
+    items = {}  # номер объекта -> (ответ, данные)
+    for request in requests:
+        response = request.response
+        items.update((request.offset + i, (response, item)) for i, item in enumerate(response.array))
+
+    selected = [
+        response.create_model_instance(item, source_mode, lazy)
+        for response, item in (items[i] for i in positions if i in items)
+        if isinstance(item, dict)
+    ]
+
+    if isinstance(index, slice):
+        return selected
+    if not selected:
+        msg = 'ModelLister index out of range'
+        raise IndexError(msg)
+    return selected[0]
 
 
 class PartialRequestsGenerator:
     """
-    Используется для получения уточнённых запросов с указанным шагом
+    Используется для получения уточнённых запросов с указанным шагом.
+    При concurrency > 1 или pages_per_call > 1 смещения всех страниц вычисляются по общему количеству объектов
+    из первого ответа. Страницы запрашиваются параллельно, группами по pages_per_call в одном вызове execute,
+    и возвращаются в порядке смещений.
+    Для методов с постраничным получением по курсору (next_from) страницы запрашиваются последовательно.
+    При resume=True обход продолжается с позиции из хранилища VK.checkpoints, после обработки каждой страницы
+    в нём сохраняется позиция следующей, при завершении обхода позиция удаляется.
+    Без resume позиции не сохраняются: прерванный обход не оставляет устаревшей позиции.
+    В потоковом режиме (stream) запросы страниц не сохраняются, а их ответы освобождаются после обработки
     """
 
-    offset = 0
+    offset = 0  # смещение первой страницы
+    prefetch_factor = 2  # количество групп страниц, запрашиваемых заранее, на один поток
+
+    def __init__(self, request, step, concurrency=1, pages_per_call=1, resume=False, stream=False) -> None:
+        assert concurrency >= 1, 'concurrency must be positive'
+        assert 1 <= pages_per_call <= VKBatch.max_calls, f'pages_per_call must be in range 1..{VKBatch.max_calls}'
 
-    def __init__(self, request, step) -> None:
         self.request = request  # base request
         self.step = step  # items per request
+        self.concurrency = concurrency
+        self.pages_per_call = pages_per_call
+        self.stream = stream
         self._p_requests = {}
+        self._total = None
+        self.checkpoints = request._vk.checkpoints if resume else None  # позиции только при продолжении обхода
+
+        self._start(self.checkpoints.get(request) if self.checkpoints is not None else None)
 
-        self.first_request = self._get_p_request(self.offset)  # used for get_total
+    def _start(self, position):
+        """
+        Первая страница обхода: с сохранённой позиции или с начала выборки
+        """
+        if position and position.get('cursor'):
+            self.first_request = CursorRequest(self.request, self.step, position['cursor'])
+        else:
+            self.offset = position.get('offset', 0) if position else 0
+            self.first_request = self._get_p_request(self.offset)  # used for get_total
 
     def __str__(self) -> str:
         m1 = self.request.binded_model.__name__
@@ -57,26 +437,347 @@ class PartialRequestsGenerator:
 
     @property
     def total(self):
+        if self._total is None:
+            if self.first_request.is_invoked:
+                self._total = self.first_request.response.total
+            else:
+                self._total = self._count_total(self._count_request().get_invoke_result())
+        return self._total
+
+    async def get_total_async(self):
+        if self._total is None:
+            if self.first_request.is_invoked:
+                self._total = self.first_request.response.total
+            else:
+                self._total = self._count_total(await self._count_request().get_invoke_result())
+        return self._total
+
+    def _count_request(self):
+        """
+        Запрос одного объекта без необязательных полей: ответ содержит общее количество (count)
+        """
+        if self.is_cursor or self.step == 1:
+            return self.first_request
+        return PartialRequest(_ids_only(self.request), 1, self.offset)
+
+    def _count_total(self, response):
+        if response.has_total or response.request is self.first_request:
+            return response.total
+        # ответ без общего количества: количество определяется по полной первой странице
         return self.first_request.get_invoke_result().total
 
-    def _get_p_request(self, offset):
+    def _windows(self, positions):
+        """
+        Запросы страниц, покрывающих объекты с номерами positions, в порядке смещений.
+        Если шаг между номерами больше размера страницы, каждый объект запрашивается отдельно,
+        иначе - страницы подряд от наименьшего номера до наибольшего
+        """
+        if self.is_cursor:
+            msg = f'{self.request.method_name} is paginated by cursor, random access is not supported'
+            raise TypeError(msg)
+
+        if abs(positions.step) > self.step:
+            return [PartialRequest(self.request, 1, offset) for offset in sorted(positions)]
+
+        start, stop = min(positions), max(positions) + 1
+        return [
+            PartialRequest(self.request, min(self.step, stop - offset), offset)
+            for offset in range(start, stop, self.step)
+        ]
+
+    def _groups(self, requests):
+        size = self.pages_per_call
+        return [requests[i : i + size] for i in range(0, len(requests), size)]
+
+    @staticmethod
+    def _clip(windows, stop):
+        """
+        Первая страница получена: страницы за пределами общего количества объектов не запрашиваются
+        """
+        response = windows[0].response
+        if response.has_total:
+            stop = min(stop, response.raw_data['count'])
+        elif response.count < windows[0].count:
+            stop = windows[0].offset + response.count
+        return [window for window in windows if window is windows[0] or window.offset < stop]
+
+    def fetch_range(self, positions):
+        """
+        Выполнение запросов страниц, покрывающих объекты с номерами positions (range).
+        Первая страница запрашивается отдельно, остальные - в concurrency потоков
+        """
+        windows = self._windows(positions)
+        self._invoke_group(windows[:1])
+        windows = self._clip(windows, max(positions) + 1)
+
+        groups = self._groups(windows[1:])
+        if groups:
+            workers = min(self.concurrency, len(groups))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='vk-lister') as executor:
+                list(executor.map(self._invoke_group, groups))
+
+        return windows
+
+    async def fetch_range_async(self, positions):
+        windows = self._windows(positions)
+        await self._invoke_group_async(windows[:1])
+        windows = self._clip(windows, max(positions) + 1)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(group):
+            async with semaphore:
+                await self._invoke_group_async(group)
+
+        await asyncio.gather(*(fetch(group) for group in self._groups(windows[1:])))
+        return windows
+
+    @property
+    def prefetch(self):
+        return self.concurrency * self.prefetch_factor
+
+    @property
+    def is_cursor(self):
+        return self.request.method_info.pagination == CURSOR_PAGINATION
+
+    @property
+    def is_planned(self):
+        """
+        Смещения страниц вычисляются заранее по общему количеству объектов
+        """
+        return not self.is_cursor and (self.concurrency > 1 or self.pages_per_call > 1)
+
+    @staticmethod
+    def _has_more(response, offset):
+        """
+        Есть ли объекты после offset: страница не пуста и, если известно общее количество, оно не достигнуто
+        """
+        if not response.count:
+            return False
+        return not response.has_total or offset < response.raw_data['count']
+
+    def _get_p_request(self, offset, count=None):
+        count = count or self.step
+        if self.stream:
+            return PartialRequest(self.request, count, offset)
+
         try:
-            return self._p_requests[offset]
+            return self._p_requests[offset, count]
         except KeyError:
-            new = PartialRequest(self.request, self.step, offset)
-            self._p_requests[offset] = new
+            new = PartialRequest(self.request, count, offset)
+            self._p_requests[offset, count] = new
             return new
 
+    def _planned_offsets(self, first_response):
+        """
+        Смещения оставшихся страниц по общему количеству объектов.
+        Шаг - фактический размер первой страницы: API может вернуть меньше запрошенного count,
+        поэтому и запрашиваются оставшиеся страницы этим же размером (_planned_groups)
+        """
+        page_size = first_response.count
+        if not page_size:
+            return range(0)
+        return range(self.offset + page_size, first_response.total, page_size)
+
+    def _planned_groups(self, first_response):
+        """
+        Запросы оставшихся страниц, сгруппированные по pages_per_call
+        """
+        offsets = self._planned_offsets(first_response)
+        page_size = offsets.step
+        size = self.pages_per_call
+        for i in range(0, len(offsets), size):
+            yield [self._get_p_request(offset, page_size) for offset in offsets[i : i + size]]
+
+    def _pending(self, group):
+        return [request for request in group if not request.is_invoked]
+
+    @staticmethod
+    def _check_group(group):
+        for request in group:
+            if request.response.error is not None:
+                raise request.response.error
+        return group
+
+    def _invoke_group(self, group):
+        """
+        Выполнение группы страниц: одна страница - обычным запросом, несколько - одним вызовом execute
+        """
+        pending = self._pending(group)
+        if len(pending) == 1:
+            pending[0].invoke()
+        elif pending:
+            execute_requests(self.request._vk, pending)
+        return self._check_group(group)
+
+    async def _invoke_group_async(self, group):
+        pending = self._pending(group)
+        if len(pending) == 1:
+            await pending[0].invoke()
+        elif pending:
+            await execute_requests(self.request._vk, pending)
+        return self._check_group(group)
+
+    def _save_position(self, request):
+        """
+        Сохранение позиции страницы, следующей за обработанной
+        """
+        if self.checkpoints is None:
+            return
+
+        if self.is_cursor:
+            position = {'cursor': request.response.next_cursor}
+        else:
+            position = {'offset': request.offset + request.response.count}
+        self.checkpoints.save(self.request, position)
+
+    def _clear_position(self):
+        if self.checkpoints is None:
+            return
+
+        self.checkpoints.delete(self.request)
+        self._start(None)  # обход завершён: следующий начинается с начала выборки
+
+    def _release(self, request):
+        """
+        Освобождение ответа обработанной страницы в потоковом режиме
+        """
+        if request is None or not self.stream:
+            return
+
+        if request is self.first_request:
+            self._total = request.response.total
+        request.response = None
+
     def __iter__(self):
-        yield self.first_request
+        # ответ страницы освобождается после получения следующей: по нему вычисляется её позиция
+        done = None
+        for request in self._iter_pages():
+            self._release(done)
+            yield request
+            self._save_position(request)
+            done = request
+
+        self._release(done)
+        self._clear_position()
+
+    async def __aiter__(self):
+        done = None
+        async for request in self._aiter_pages():
+            self._release(done)
+            yield request
+            self._save_position(request)
+            done = request
+
+        self._release(done)
+        self._clear_position()
+
+    def _iter_pages(self):
+        if self.is_cursor:
+            yield from self._iter_cursor()
+            return
+
+        if self.is_planned:
+            yield from self._iter_planned()
+            return
+
         last = self.first_request.invoked()
-        self.offset += last.response.count
+        yield last
+        offset = self.offset + last.response.count
 
-        # while self.offset < self.total:
-        while last.response.count > 0:
-            # while last.response.count == self.step:
-            last = self._get_p_request(self.offset).invoked()  # todo кеширование
+        while self._has_more(last.response, offset):
+            last = self._get_p_request(offset).invoked()
             yield last
-            self.offset += last.response.count
+            offset += last.response.count
+
+    def _iter_cursor(self):
+        last = self.first_request.invoked()
+        yield last
+
+        while last.response.count and (cursor := last.response.next_cursor):
+            last = CursorRequest(self.request, self.step, cursor).invoked()
+            yield last
+
+    def _iter_planned(self):
+        first = self.first_request.invoked()
+        yield first
 
-        self.offset = 0
+        groups = self._planned_groups(first.response)
+        futures = deque()
+
+        def submit_next():
+            group = next(groups, None)
+            if group is not None:
+                futures.append(executor.submit(self._invoke_group, group))
+
+        # страницы запрашиваются не дальше prefetch групп от обрабатываемой, чтобы не накапливать ответы
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='vk-lister') as executor:
+            for _ in range(self.prefetch):
+                submit_next()
+            try:
+                while futures:
+                    group = futures.popleft().result()
+                    submit_next()
+                    yield from group
+            finally:
+                # прерванный обход не должен дожидаться запросов оставшихся страниц
+                for future in futures:
+                    future.cancel()
+
+    async def _aiter_pages(self):
+        if self.is_cursor:
+            async for request in self._aiter_cursor():
+                yield request
+            return
+
+        if self.is_planned:
+            async for request in self._aiter_planned():
+                yield request
+            return
+
+        last = await self.first_request.invoked()
+        yield last
+        offset = self.offset + last.response.count
+
+        while self._has_more(last.response, offset):
+            last = await self._get_p_request(offset).invoked()
+            yield last
+            offset += last.response.count
+
+    async def _aiter_cursor(self):
+        last = await self.first_request.invoked()
+        yield last
+
+        while last.response.count and (cursor := last.response.next_cursor):
+            last = await CursorRequest(self.request, self.step, cursor).invoked()
+            yield last
+
+    async def _aiter_planned(self):
+        first = await self.first_request.invoked()
+        yield first
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(group):
+            async with semaphore:
+                return await self._invoke_group_async(group)
+
+        groups = self._planned_groups(first.response)
+        tasks = deque()
+
+        def submit_next():
+            group = next(groups, None)
+            if group is not None:
+                tasks.append(asyncio.ensure_future(fetch(group)))
+
+        for _ in range(self.prefetch):
+            submit_next()
+        try:
+            while tasks:
+                group = await tasks.popleft()
+                submit_next()
+                for request in group:
+                    yield request
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,11 +1,17 @@
+from __future__ import annotations
+
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from vk_cli import api
 
 from .data import PhotoData
 from .vk_object import VKobjectOwned
 
+if TYPE_CHECKING:
+    from vk_cli.api.vk_request import VKRequest
+
 
 class VKPhoto(VKobjectOwned):
     """
@@ -20,10 +26,8 @@ class VKPhoto(VKobjectOwned):
 
     vk_data: PhotoData | None
 
-    def _get_vk_data(self) -> dict:
-        request = api.photos.get_by_id(photos=self.string_id, photo_sizes=None, extended=True)
-        result = request.get_invoke_result()
-        return result.single
+    def _get_vk_request(self) -> VKRequest:
+        return api.photos.get_by_id(self._vk, photos=self.string_id, photo_sizes=None, extended=True)
 
     def __repr__(self) -> str:
         return self.url
@@ -59,15 +63,14 @@ class VKPhoto(VKobjectOwned):
         :param folder: папка назначения
         :param name_counter: опциональный счётчик для использования в имени файла
         :param size_fmt: формат размера по умолчанию максимальный 'max'
+        Для асинхронного клиента возвращает корутину
         """
         from urllib.request import urlopen
 
-        fname = self.as_attachment
-
-        if isinstance(name_counter, int):
-            fname = f'{name_counter:04d}. {fname}.jpg'
+        fname_full = self._get_dl_file_name(folder, name_counter)
 
-        fname_full = folder / fname
+        if self.is_async:
+            return self._download_async(fname_full, size_fmt)
 
         if fname_full.is_file():  # skip exists
             return True
@@ -78,6 +81,25 @@ class VKPhoto(VKobjectOwned):
             f.write(u.read())
         return fname_full.exists()
 
+    async def _download_async(self, fname_full: Path, size_fmt=None) -> bool:
+        if fname_full.is_file():  # skip exists
+            return True
+
+        resp = await self._vk.http.get(self.get_image_url(size_fmt))
+        resp.raise_for_status()
+
+        with fname_full.open('wb') as f:
+            f.write(resp.content)
+        return fname_full.exists()
+
+    def _get_dl_file_name(self, folder: Path, name_counter=None) -> Path:
+        fname = self.as_attachment
+
+        if isinstance(name_counter, int):
+            fname = f'{name_counter:04d}. {fname}.jpg'
+
+        return folder / fname
+
     def get_image_url(self, size_fmt=None) -> str:
         """
         Ссылка на jpg заданного размера
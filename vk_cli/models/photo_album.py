@@ -1,6 +1,8 @@
-from collections.abc import Iterator
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
-from typing import Self
+from typing import Self, TYPE_CHECKING
 
 from vk_cli import api, VK
 
@@ -9,6 +11,9 @@ from .data import PhotoAlbumData
 from .lister import ModelLister
 from .vk_object import VKobjectOwned
 
+if TYPE_CHECKING:
+    from vk_cli.api.vk_request import VKRequest
+
 
 class VKPhotoAlbum(VKobjectOwned):
     vk_object_type = 'album'
@@ -16,6 +21,7 @@ class VKPhotoAlbum(VKobjectOwned):
     vk_data: PhotoAlbumData | None
     do_stat = False
     system_albums = {-6: '0', -7: '00', -15: '000'}
+    sync_step = 100  # размер страницы при получении новых фотографий: обычно их немного
 
     def __init__(self, vk: VK, string_id: str | None = None, object_id: int | None = None,
                  owner_id: int | None = None) -> None:
@@ -27,11 +33,8 @@ class VKPhotoAlbum(VKobjectOwned):
         self._privacy_comment = None
         self.rev = False
 
-    def _get_vk_data(self) -> dict:
-        # TODO выделить в поле get_request?
-        request = api.photos.get_albums(self._vk, owner_id=self.owner_id, album_ids=self.album_id)
-        a = request.get_invoke_result()
-        return a.single
+    def _get_vk_request(self) -> VKRequest:
+        return api.photos.get_albums(self._vk, owner_id=self.owner_id, album_ids=self.album_id)
 
     @classmethod
     def create(cls, title: str, description: str = '', group_id: int | None = None) -> Self:
@@ -54,11 +57,70 @@ class VKPhotoAlbum(VKobjectOwned):
         """
         yield from self.photos
 
+    async def __aiter__(self) -> AsyncIterator[VKPhoto]:
+        async for photo in self.photos:
+            yield photo
+
     @property
     def photos(self) -> ModelLister:
         assert (self._vk is not None), 'vk is None'
         request = api.photos.get(self._vk, owner_id=self.owner_id, album_id=self.album_id, rev=self.rev)
-        return ModelLister(request, step=500)
+        return ModelLister(request)
+
+    @property
+    def sync_name(self) -> str:
+        """
+        Имя отметки синхронизации альбома в хранилище VK.checkpoints
+        """
+        return f'photos.sync:{self.owner_id}_{self.album_id}'
+
+    def new_photos(self, since_id: int | None = None) -> Iterator[VKPhoto]:
+        """
+        Фотографии, добавленные после предыдущей синхронизации, от новых к старым.
+        Фотографии запрашиваются в обратном хронологическом порядке (rev=1) до первой уже полученной.
+        Отметка (последняя полученная фотография) хранится в VK.checkpoints и обновляется,
+        когда все новые фотографии пройдены
+        :param since_id: идентификатор последней полученной фотографии вместо сохранённой отметки
+        Для асинхронного клиента возвращает асинхронный итератор
+        """
+        assert self._vk is not None, 'vk is None'
+
+        if since_id is None and self._vk.checkpoints is not None:
+            since_id = (self._vk.checkpoints.get_watermark(self.sync_name) or {}).get('id')
+
+        request = api.photos.get(self._vk, owner_id=self.owner_id, album_id=self.album_id, rev=True)
+        lister = ModelLister(request, step=self.sync_step, stream=True)
+
+        if self.is_async:
+            return self._new_photos_async(lister, since_id)
+        return self._new_photos(lister, since_id)
+
+    def _new_photos(self, lister: ModelLister, since_id: int | None) -> Iterator[VKPhoto]:
+        newest = None
+        for photo in lister:
+            if since_id is not None and photo.id <= since_id:
+                break
+            newest = newest or photo
+            yield photo
+
+        self._save_sync_watermark(newest)
+
+    async def _new_photos_async(self, lister: ModelLister, since_id: int | None) -> AsyncIterator[VKPhoto]:
+        newest = None
+        async for photo in lister:
+            if since_id is not None and photo.id <= since_id:
+                break
+            newest = newest or photo
+            yield photo
+
+        self._save_sync_watermark(newest)
+
+    def _save_sync_watermark(self, newest: VKPhoto | None) -> None:
+        if newest is None or self._vk.checkpoints is None:
+            return
+
+        watermark = {'id': newest.id, 'date': newest.vk_data.date.timestamp()}
+        self._vk.checkpoints.save_watermark(self.sync_name, watermark)
 
     @property
     def is_editable(self) -> bool:
@@ -67,12 +129,24 @@ class VKPhotoAlbum(VKobjectOwned):
     def download(self, dl_path: str | Path) -> None:
         """
         Скачивает фотографии из альбома в папку dl_folder
+        Для асинхронного клиента возвращает корутину
         """
         dl_path = Path(dl_path)
         dl_path = dl_path / self._get_dl_folder_name()
         dl_path.mkdir(parents=True, exist_ok=True)
+
+        if self.is_async:
+            return self._download_async(dl_path)
+
         for i, photo in enumerate(self, 1):
             photo.download(dl_path, i)
+        return None
+
+    async def _download_async(self, dl_path: Path) -> None:
+        i = 0
+        async for photo in self:
+            i += 1
+            await photo.download(dl_path, i)
 
     def _get_dl_folder_name(self) -> str:
         return f'{self.owner_id}_{self.album_id} ({self.title})'
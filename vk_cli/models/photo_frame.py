@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import datetime
+import itertools
+import operator
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# числовые столбцы; width и height - размеры наибольшей копии фотографии
+COLUMNS = ('id', 'owner_id', 'album_id', 'date', 'width', 'height')
+# вычисляемые столбцы
+RESOLUTION = 'resolution'  # width * height
+# типы копий в порядке убывания размера, как в VKPhoto.get_image_url
+SIZE_TYPES = 'wzyrqpoxms'
+SIZE_RANKS = {size_type: rank for rank, size_type in enumerate(SIZE_TYPES)}
+
+
+class PhotoFrame:
+    """
+    Колоночное представление набора фотографий: числовые поля хранятся в массивах array.array,
+    адреса наибольших копий - в списке url. Создаётся из исходных данных ответа без экземпляров VKPhoto,
+    фильтрация и сортировка выполняются над столбцами целиком (средствами NumPy, если он установлен)
+    """
+
+    def __init__(self, columns: dict[str, array] | None = None, url: list[str] | None = None) -> None:
+        """
+        :param columns: массивы array('q') для каждого из COLUMNS одинаковой длины
+        :param url: адреса наибольших копий
+        """
+        columns = columns or {}
+        self.columns = {name: columns.get(name, array('q')) for name in COLUMNS}
+        self.url = url if url is not None else []
+        assert all(len(column) == len(self.url) for column in self.columns.values()), 'columns length mismatch'
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict]) -> PhotoFrame:
+        """
+        Создание по элементам ответа photos.get (и других методов, возвращающих фотографии)
+        """
+        frame = cls()
+        frame.extend(items)
+        return frame
+
+    @classmethod
+    def concat(cls, frames: Iterable[PhotoFrame]) -> PhotoFrame:
+        result = cls()
+        for frame in frames:
+            for name, column in result.columns.items():
+                column.extend(frame.columns[name])
+            result.url.extend(frame.url)
+        return result
+
+    def extend(self, items: Iterable[dict]) -> None:
+        """
+        Добавление фотографий из элементов ответа API
+        """
+        ids, owner_ids, album_ids, dates, widths, heights = (self.columns[name] for name in COLUMNS)
+        for item in items:
+            if not isinstance(item, dict):
+                break
+
+            ids.append(item['id'])
+            owner_ids.append(item.get('owner_id') or 0)
+            album_ids.append(item.get('album_id') or 0)
+            dates.append(item.get('date') or 0)
+
+            size = _max_size(item.get('sizes') or ())
+            if size is not None:
+                widths.append(size.get('width') or 0)
+                heights.append(size.get('height') or 0)
+                self.url.append(size['url'])
+            else:
+                widths.append(item.get('width') or 0)
+                heights.append(item.get('height') or 0)
+                self.url.append('')
+
+    def __len__(self) -> int:
+        return len(self.url)
+
+    def __getitem__(self, name: str) -> array | list[str]:
+        """
+        Столбец по имени: один из COLUMNS, 'url' или 'resolution'
+        """
+        if name == 'url':
+            return self.url
+        if name == RESOLUTION:
+            return array('q', map(operator.mul, self.columns['width'], self.columns['height']))
+        return self.columns[name]
+
+    def __repr__(self) -> str:
+        return f'<PhotoFrame: {len(self)} photos>'
+
+    def rows(self) -> Iterator[tuple]:
+        """
+        Строки (id, owner_id, album_id, date, width, height, url)
+        """
+        return zip(*self.columns.values(), self.url)
+
+    def take(self, indices: Sequence[int]) -> PhotoFrame:
+        """
+        Фотографии с указанными номерами в указанном порядке
+        """
+        columns = {name: array('q', map(column.__getitem__, indices)) for name, column in self.columns.items()}
+        return PhotoFrame(columns, list(map(self.url.__getitem__, indices)))
+
+    def filter(self, mask: Iterable[bool]) -> PhotoFrame:
+        """
+        Фотографии, для которых соответствующий элемент mask истинен
+        """
+        mask = list(mask)
+        assert len(mask) == len(self), 'mask length mismatch'
+
+        columns = {name: array('q', itertools.compress(column, mask)) for name, column in self.columns.items()}
+        return PhotoFrame(columns, list(itertools.compress(self.url, mask)))
+
+    def where(self, name: str, low: Any = None, high: Any = None) -> PhotoFrame:
+        """
+        Фотографии, у которых значение столбца находится в диапазоне low <= value < high
+        :param low: нижняя граница, для даты - datetime или unixtime; None - без ограничения
+        :param high: верхняя граница, не включается
+        """
+        low, high = _number(low), _number(high)
+        if low is None and high is None:
+            return self.take(range(len(self)))
+
+        np = _numpy()
+        if np is not None and name != 'url':
+            values = self._numpy_column(np, name)
+            mask = np.ones(len(values), dtype=bool)
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values < high
+            return self._take_numpy(np, np.flatnonzero(mask))
+
+        column = self[name]
+        if low is not None and high is not None:
+            mask = [low <= value < high for value in column]
+        elif low is not None:
+            mask = [value >= low for value in column]
+        else:
+            mask = [value < high for value in column]
+
+        return self.filter(mask)
+
+    def sort(self, name: str = 'date', reverse: bool = False) -> PhotoFrame:
+        """
+        Фотографии, упорядоченные по значению столбца (сортировка устойчивая)
+        """
+        np = _numpy()
+        if np is not None and name != 'url':
+            values = self._numpy_column(np, name)
+            if not reverse:
+                return self._take_numpy(np, np.argsort(values, kind='stable'))
+            # по убыванию с сохранением порядка равных значений, как sorted(..., reverse=True)
+            return self._take_numpy(np, len(values) - 1 - np.argsort(values[::-1], kind='stable')[::-1])
+
+        column = self[name]
+        return self.take(sorted(range(len(self)), key=column.__getitem__, reverse=reverse))
+
+    def _numpy_column(self, np: Any, name: str) -> np.ndarray:
+        if name == RESOLUTION:
+            return self._numpy_column(np, 'width') * self._numpy_column(np, 'height')
+        return np.frombuffer(self.columns[name], dtype=np.int64)
+
+    def _take_numpy(self, np: Any, indices: np.ndarray) -> PhotoFrame:
+        """
+        take для массива номеров NumPy: столбцы выбираются индексированием массивов без обхода элементов
+        """
+        columns = {name: array('q') for name in COLUMNS}
+        for name, column in columns.items():
+            column.frombytes(self._numpy_column(np, name)[indices].tobytes())
+        return PhotoFrame(columns, list(map(self.url.__getitem__, indices.tolist())))
+
+    def to_numpy(self) -> dict[str, np.ndarray]:
+        """
+        Столбцы в виде массивов NumPy (числовые - без копирования данных)
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            msg = 'PhotoFrame.to_numpy requires numpy package, install it with "pip install numpy"'
+            raise ImportError(msg) from e
+
+        arrays = {name: np.frombuffer(column, dtype=np.int64) for name, column in self.columns.items()}
+        arrays['url'] = np.array(self.url, dtype=object)
+        return arrays
+
+
+def _max_size(sizes: Sequence[dict]) -> dict | None:
+    """
+    Наибольшая копия фотографии, для которой есть адрес
+    """
+    best, best_rank = None, len(SIZE_TYPES)
+    for size in sizes:
+        rank = SIZE_RANKS.get(size.get('type'), best_rank)
+        if rank < best_rank and size.get('url'):
+            best, best_rank = size, rank
+    return best
+
+
+def _numpy() -> Any:
+    """
+    Модуль numpy или None, если он не установлен
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def _number(value: Any) -> Any:
+    return value.timestamp() if isinstance(value, datetime.datetime) else value
@@ -5,12 +5,13 @@ from abc import ABCMeta, abstractmethod
 from copy import copy
 from typing import Self, TYPE_CHECKING
 
-import dacite
-
+from ..api.vk_json import SOURCE_BYTES, SOURCE_KEEP, SOURCE_MODES, compress_json, decompress_json
+from .data.decoder import get_decoder, get_lazy_decoder
 from .data.vk_object_data import VKObjectData, VKOwnedObjectData
 
 if TYPE_CHECKING:
     from .. import VK
+    from ..api.vk_request import VKRequest
 
 
 class VKobject(metaclass=ABCMeta):
@@ -23,6 +24,7 @@ class VKobject(metaclass=ABCMeta):
 
     def __init__(self, string_or_object_id: int | str | None = None) -> None:
         self._id = None
+        self._vk: VK | None = None
         self.vk_data = None
 
         if isinstance(string_or_object_id, int):
@@ -32,10 +34,14 @@ class VKobject(metaclass=ABCMeta):
             self._init_from_string_id(string_or_object_id)
 
     @classmethod
-    def from_data(cls, vk: VK, data: dict) -> Self:
+    def from_data(cls, vk: VK, data: dict, source_mode: str | None = None, lazy: bool | None = None) -> Self:
+        """
+        :param source_mode: хранение исходных данных объекта ('keep', 'drop', 'bytes'), по умолчанию - VK.source_mode
+        :param lazy: преобразовывать поля данных при первом обращении, по умолчанию - VK.lazy
+        """
         pre = cls(None)
         pre._vk = vk
-        pre._init_from_json(data)  # noqa:SLF001
+        pre._init_from_json(data, source_mode, lazy)  # noqa:SLF001
         return pre
 
     def _init_from_string_id(self, str_id: str) -> None:
@@ -66,45 +72,78 @@ class VKobject(metaclass=ABCMeta):
         return self.id == other.id and self.vk_object_type == other.vk_object_type
 
     @abstractmethod
-    def _get_vk_data(self) -> None:
+    def _get_vk_request(self) -> VKRequest:
         """
         To override
-        получение JSON-данных для единичного объекта с сервера vk
+        запрос для получения JSON-данных единичного объекта с сервера vk
         """
         raise NotImplementedError
 
-    def load(self) -> Self:
+    def _get_vk_data(self, refresh: bool = False) -> dict:
+        """
+        получение JSON-данных для единичного объекта с сервера vk
+        """
+        return self._get_vk_request().get_invoke_result(update=refresh).single
+
+    @property
+    def is_async(self) -> bool:
+        return self._vk is not None and self._vk.is_async
+
+    def load(self, refresh: bool = False) -> Self:
         """
-        Получение детальной информации по объекту из VK и инициализация vk_data
+        Получение детальной информации по объекту из VK и инициализация vk_data.
+        Для асинхронного клиента возвращает корутину
+        :param refresh: не использовать сохранённые в кеше данные
         """
-        data = self._get_vk_data()
+        if self.is_async:
+            return self._load_async(refresh)
+
+        data = self._get_vk_data(refresh)
+        assert isinstance(data, dict)
+        self._init_from_json(data)
+        return self
+
+    async def _load_async(self, refresh: bool = False) -> Self:
+        response = await self._get_vk_request().get_invoke_result(update=refresh)
+        data = response.single
         assert isinstance(data, dict)
         self._init_from_json(data)
         return self
 
-    def reload(self) -> None:
-        self.load()
+    def reload(self):
+        return self.load(refresh=True)
 
-    def _init_from_json(self, data: dict) -> Self:
+    def _init_from_json(self, data: dict, source_mode: str | None = None, lazy: bool | None = None) -> Self:
         """
         Инициализация по данным JSON
         :param data: словарь с данными об объекте, полученный в результате запроса через API VK
+        :param source_mode: хранение исходных данных объекта, по умолчанию - VK.source_mode
+        :param lazy: преобразовывать поля данных при первом обращении, по умолчанию - VK.lazy
         """
 
         data = html.unescape(data)
 
-        _data = copy(data)
-        _data['source'] = data
+        source_mode = source_mode or getattr(self._vk, 'source_mode', SOURCE_KEEP)
+        assert source_mode in SOURCE_MODES, f'unknown source mode {source_mode}'
+
+        if source_mode == SOURCE_KEEP:
+            source = data
+        elif source_mode == SOURCE_BYTES:
+            source = compress_json(data)
+        else:
+            source = None
 
-        kwargs = {
-            'data_class': self.vk_data_class,
-            'data': _data,
-        }
+        if lazy is None:
+            lazy = getattr(self._vk, 'lazy', False)
 
-        if hasattr(self.vk_data_class.Meta, 'config'):
-            kwargs['config'] = self.vk_data_class.Meta.config
+        config = getattr(self.vk_data_class.Meta, 'config', None)
+        if lazy:
+            self.vk_data = get_lazy_decoder(self.vk_data_class, config)(data, source=source)
+            return self
 
-        self.vk_data = dacite.from_dict(**kwargs)
+        _data = copy(data)
+        _data['source'] = source
+        self.vk_data = get_decoder(self.vk_data_class, config)(_data)
 
         return self
 
@@ -112,8 +151,14 @@ class VKobject(metaclass=ABCMeta):
     def id(self) -> int:
         return self._id or self.vk_data and self.vk_data.id
 
-    def get_source_data(self) -> dict:
-        return self.vk_data and self.vk_data.source
+    def get_source_data(self) -> dict | None:
+        """
+        Исходные данные объекта из ответа API; None, если они не сохраняются (source_mode='drop')
+        """
+        source = self.vk_data and self.vk_data.source
+        if isinstance(source, bytes):
+            return decompress_json(source, self._vk and self._vk.json_loads)
+        return source
 
 
 class VKobjectOwned(VKobject, metaclass=ABCMeta):